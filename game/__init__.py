@@ -0,0 +1,30 @@
+"""슈팅 게임 패키지.
+
+`from game import World` 같은 편의 이름은 처음 쓸 때 import 한다 (PEP 562). 패키지만 import 해서는
+pygame / numpy 를 불러오지 않으므로 game.startup, game.settings 는 가볍게 먼저 import 할 수 있다.
+"""
+import importlib
+
+_EXPORTS = {
+    "World": "game.world",
+    "Inputs": "game.world",
+    "NO_INPUT": "game.world",
+    "EVENT_ROUND": "game.world",
+    "EVENT_GAME_OVER": "game.world",
+    "load_images": "game.assets",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'game' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
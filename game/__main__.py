@@ -0,0 +1,7 @@
+"""python -m game — shooting_game.py 와 같음."""
+import sys
+
+from game import startup  # 시작 시간 측정 기준 — 다른 import 보다 먼저
+from game.main import main
+
+sys.exit(main())
@@ -0,0 +1,142 @@
+import os
+import queue
+import threading
+import time
+
+import pygame
+
+# 시작 시 읽는 에셋 전체의 메모리 예산 (초과하면 보고서에 경고)
+DEFAULT_BUDGET_BYTES = 32 * 1024 * 1024
+
+
+def estimate_bytes(value):
+    # Surface / Mask / Sound / 컨테이너 / 파일 경로(스트리밍 음악) 의 대략적인 메모리 사용량
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    if pygame.mixer and isinstance(value, pygame.mixer.Sound):
+        freq, size, channels = pygame.mixer.get_init() or (0, 0, 0)
+        return int(value.get_length() * freq) * (abs(size) // 8) * channels
+    if isinstance(value, pygame.mask.Mask):
+        w, h = value.get_size()
+        return (w * h + 7) // 8
+    if isinstance(value, dict):
+        return sum(estimate_bytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_bytes(v) for v in value)
+    if isinstance(value, str) and os.path.exists(value):
+        return os.path.getsize(value)
+    return 0
+
+
+class AssetRecord:
+    def __init__(self, name):
+        self.name = name
+        self.value = None
+        self.ready = False
+        self.error = None
+        self.load_ms = 0.0      # 백그라운드 스레드에서 디코딩/스케일에 걸린 시간
+        self.finalize_ms = 0.0  # 메인 스레드에서 픽셀 형식 변환에 걸린 시간
+        self.nbytes = 0
+
+
+class AssetManager:
+    """무거운 에셋을 백그라운드 스레드에서 읽고, 메인 스레드에서 디스플레이 형식으로 변환한다.
+
+    start(jobs) 로 {이름: (loader, finalize)} 작업을 넘기면 loader 는 스레드에서 순서대로 돌고,
+    메뉴 루프 등에서 매 프레임 poll() 을 부르면 끝난 것들의 finalize(convert 등)를 처리한다.
+    """
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.records = {}
+        self._jobs = {}
+        self._done = queue.Queue()
+        self._pending = 0
+        self._thread = None
+        self._reported = False
+
+    def start(self, jobs):
+        for name in jobs:
+            self.records[name] = AssetRecord(name)
+        self._jobs.update(jobs)
+        self._pending += len(jobs)
+        self._thread = threading.Thread(target=self._run, args=(list(jobs.items()),), daemon=True)
+        self._thread.start()
+
+    def _run(self, jobs):
+        for name, (loader, _) in jobs:
+            t0 = time.perf_counter()
+            try:
+                value, error = loader(), None
+            except Exception as e:
+                value, error = None, e
+            self._done.put((name, value, error, (time.perf_counter() - t0) * 1000))
+
+    def _finish(self, name, value, error, load_ms):
+        record = self.records[name]
+        record.load_ms = load_ms
+        finalize = self._jobs[name][1]
+        if error is None and finalize is not None:
+            t0 = time.perf_counter()
+            try:
+                value = finalize(value)
+            except Exception as e:
+                value, error = None, e
+            record.finalize_ms = (time.perf_counter() - t0) * 1000
+        if error is not None:
+            print(f"Warning: asset {name}: {error}")
+        record.value = value
+        record.error = error
+        record.nbytes = estimate_bytes(value)
+        record.ready = True
+        self._pending -= 1
+
+    def poll(self):
+        # 메인 스레드에서 호출: 끝난 작업을 마무리하고 새로 준비된 이름 목록을 돌려줌
+        ready = []
+        while True:
+            try:
+                item = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._finish(*item)
+            ready.append(item[0])
+        return ready
+
+    def wait(self):
+        # 남은 작업이 모두 끝날 때까지 기다림
+        while self._pending:
+            self._finish(*self._done.get())
+        return self.values()
+
+    @property
+    def done(self):
+        return self._pending == 0
+
+    def get(self, name, default=None):
+        record = self.records.get(name)
+        if record is None or not record.ready:
+            return default
+        return record.value
+
+    def values(self):
+        return {name: r.value for name, r in self.records.items() if r.ready}
+
+    def report(self):
+        lines = ["asset               load ms  convert ms      KiB"]
+        total = 0
+        for r in self.records.values():
+            state = "" if r.ready else "  (loading)"
+            if r.error is not None:
+                state = f"  (error: {r.error})"
+            lines.append(f"{r.name:18s} {r.load_ms:8.1f} {r.finalize_ms:11.1f} {r.nbytes / 1024:8.0f}{state}")
+            total += r.nbytes
+        over = "  OVER BUDGET" if total > self.budget_bytes else ""
+        lines.append(f"total {total / 1024 / 1024:.1f} MiB / budget {self.budget_bytes / 1024 / 1024:.0f} MiB{over}")
+        return lines
+
+    def print_report_once(self):
+        if self.done and not self._reported:
+            self._reported = True
+            for line in self.report():
+                print(line)
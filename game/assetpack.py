@@ -0,0 +1,172 @@
+"""미리 스케일한 스프라이트 아틀라스 + 충돌 마스크 바이너리 팩.
+
+mk_assetpack.py 가 만들고, 게임은 load_pack() 으로 mmap 해서 PNG/JPG 디코딩 없이 읽는다.
+
+형식 (little-endian):
+    header   "<4sHHHII" magic b"SGPK", version, page 수, entry 수, 배치 키(assets.pack_key — 히트박스/양자화 설정),
+                        원본 키(assets.sources_key — 원본 이미지 크기/CRC)
+    page     "<HH4sII"  width, height, 픽셀 형식(b"RGBA"/b"RGB "), data offset, data length
+    entry    "<H" 이름 길이 + UTF-8 이름, "<HHHHHII" page, x, y, w, h, mask offset, mask length
+    data     page 픽셀(raw), 마스크(행마다 1bit/px, np.packbits 형식)
+"""
+import mmap
+import struct
+
+import numpy as np
+import pygame
+
+MAGIC = b"SGPK"
+VERSION = 3
+
+_HEADER = struct.Struct("<4sHHHII")
+_PAGE = struct.Struct("<HH4sII")
+_NAME_LEN = struct.Struct("<H")
+_ENTRY = struct.Struct("<HHHHHII")
+
+ATLAS_WIDTH = 1024
+_ALIGN = 16
+
+
+def _align(n):
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def pack_mask(mask):
+    bits = pygame.surfarray.array_red(mask.to_surface()).T > 0
+    return np.packbits(bits, axis=1).tobytes()
+
+
+def unpack_mask(data, size):
+    w, h = size
+    bits = np.unpackbits(np.frombuffer(data, np.uint8).reshape(h, -1), axis=1, count=w)
+    rgba = np.zeros((h, w, 4), np.uint8)
+    rgba[..., 3] = bits * 255
+    return pygame.mask.from_surface(pygame.image.frombuffer(rgba.tobytes(), (w, h), "RGBA"))
+
+
+def _shelf_pack(sizes, width=ATLAS_WIDTH, pad=1):
+    # 높이 순으로 줄(shelf)에 채워 넣기. 반환: 위치 목록, 아틀라스 높이
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    positions = [None] * len(sizes)
+    x = y = shelf_h = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > width:
+            x = 0
+            y += shelf_h + pad
+            shelf_h = 0
+        positions[i] = (x, y)
+        x += w + pad
+        shelf_h = max(shelf_h, h)
+    return positions, y + shelf_h
+
+
+def write_pack(path, sprites, opaque=(), key=0, sources=0):
+    """sprites: {이름: (Surface, Mask 또는 None)}. opaque 에 든 이름은 RGB 단독 page 로 저장(배경 등).
+
+    key / sources 는 팩을 만들 때의 설정 / 원본 이미지 요약값 — 읽는 쪽이 다르면 팩을 쓰지 않는다.
+    """
+    names = [n for n in sprites if n not in opaque]
+    pages = []      # (w, h, fmt, bytes)
+    entries = []    # (name, page, x, y, w, h, mask)
+
+    if names:
+        sizes = [sprites[n][0].get_size() for n in names]
+        positions, height = _shelf_pack(sizes)
+        atlas = pygame.Surface((ATLAS_WIDTH, max(height, 1)), pygame.SRCALPHA)
+        atlas.fill((0, 0, 0, 0))
+        for name, (x, y), (w, h) in zip(names, positions, sizes):
+            atlas.blit(sprites[name][0], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            entries.append((name, 0, x, y, w, h, sprites[name][1]))
+        pages.append((atlas.get_width(), atlas.get_height(), b"RGBA", pygame.image.tobytes(atlas, "RGBA")))
+
+    for name in opaque:
+        surf, mask = sprites[name]
+        w, h = surf.get_size()
+        entries.append((name, len(pages), 0, 0, w, h, mask))
+        pages.append((w, h, b"RGB ", pygame.image.tobytes(surf, "RGB")))
+
+    table = _HEADER.size + _PAGE.size * len(pages)
+    for name, *_ in entries:
+        table += _NAME_LEN.size + len(name.encode("utf-8")) + _ENTRY.size
+
+    offset = _align(table)
+    blobs = []
+    page_rows = []
+    for w, h, fmt, data in pages:
+        page_rows.append(_PAGE.pack(w, h, fmt, offset, len(data)))
+        blobs.append((offset, data))
+        offset = _align(offset + len(data))
+    entry_rows = []
+    for name, page, x, y, w, h, mask in entries:
+        raw = name.encode("utf-8")
+        if mask is not None:
+            data = pack_mask(mask)
+            blobs.append((offset, data))
+            mask_off, mask_len = offset, len(data)
+            offset = _align(offset + len(data))
+        else:
+            mask_off = mask_len = 0
+        entry_rows.append(_NAME_LEN.pack(len(raw)) + raw + _ENTRY.pack(page, x, y, w, h, mask_off, mask_len))
+
+    with open(path, "wb") as fp:
+        fp.write(_HEADER.pack(MAGIC, VERSION, len(pages), len(entries), key, sources))
+        for row in page_rows:
+            fp.write(row)
+        for row in entry_rows:
+            fp.write(row)
+        for off, data in blobs:
+            fp.write(b"\0" * (off - fp.tell()))
+            fp.write(data)
+
+
+class AssetPack:
+    """mmap 으로 연 팩. page Surface 는 mmap 버퍼를 그대로 참조하므로 팩 객체를 살려둘 것."""
+
+    def __init__(self, path):
+        self._fp = open(path, "rb")
+        self._mm = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mm)
+        magic, version, n_pages, n_entries, self.key, self.sources = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not an asset pack (v{VERSION}): {path}")
+        pos = _HEADER.size
+
+        self.pages = []
+        for _ in range(n_pages):
+            w, h, fmt, off, length = _PAGE.unpack_from(view, pos)
+            pos += _PAGE.size
+            self.pages.append(pygame.image.frombuffer(view[off:off + length], (w, h), fmt.decode().strip()))
+
+        self.entries = {}
+        for _ in range(n_entries):
+            (name_len,) = _NAME_LEN.unpack_from(view, pos)
+            pos += _NAME_LEN.size
+            name = bytes(view[pos:pos + name_len]).decode("utf-8")
+            pos += name_len
+            self.entries[name] = _ENTRY.unpack_from(view, pos)
+            pos += _ENTRY.size
+        self._view = view
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def names(self):
+        return list(self.entries)
+
+    def image(self, name):
+        page, x, y, w, h, _, _ = self.entries[name]
+        surf = self.pages[page]
+        if (w, h) == surf.get_size():
+            return surf
+        return surf.subsurface((x, y, w, h))
+
+    def mask(self, name):
+        _, _, _, w, h, off, length = self.entries[name]
+        if not length:
+            return None
+        return unpack_mask(self._view[off:off + length], (w, h))
+
+
+def load_pack(path):
+    return AssetPack(path)
@@ -0,0 +1,153 @@
+import os
+import zlib
+
+import pygame
+
+from game.settings import PLAYER_WIDTH, PLAYER_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT
+
+# 프로젝트 루트 (game/ 의 상위 폴더)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# mk_assetpack.py 가 만드는 아틀라스 팩 (있으면 PNG/JPG 대신 사용)
+PACK_NAME = "assets.pack"
+SOURCE_FILES = ("fighter.png", "background.jpg", os.path.join("assets", "enemies", "weak_enemy.png"), "weak_enemy.png")
+
+
+def find_asset(*names):
+    # 프로젝트 루트 -> 현재 작업 폴더 순서로 찾기 (exe 옆에 둔 파일도 인식)
+    for name in names:
+        for p in (os.path.join(BASE_DIR, name), name):
+            if os.path.exists(p):
+                return p
+    return None
+
+
+# --- 에셋 작업 목록 ------------------------------------------------------------
+# asset_jobs() 는 {이름: (loader, finalize)} 를 돌려준다. loader 는 디스플레이 없이(다른 스레드에서도)
+# 돌 수 있는 디코딩/스케일 작업이고, finalize 는 메인 스레드에서 디스플레이 픽셀 형식으로 바꾸는 작업이다.
+
+def to_display_alpha(surf):
+    if surf is None or pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha()
+
+
+def to_display(surf):
+    if surf is None or pygame.display.get_surface() is None:
+        return surf
+    return surf.convert()
+
+
+def variants_to_display(variants):
+    return {key: (to_display_alpha(image), mask) for key, (image, mask) in variants.items()}
+
+
+def asset_jobs():
+    # 지금 원본 이미지로 만든 에셋 팩이 있으면 팩에서, 아니면 원본 파일을 디코딩
+    pack_path = find_asset(PACK_NAME)
+    if pack_path:
+        try:
+            jobs = _pack_jobs(pack_path)
+        except Exception as e:
+            print(f"Warning: {PACK_NAME}: {e}")
+            jobs = None
+        if jobs is not None:
+            return jobs
+    return _file_jobs()
+
+
+def load_images():
+    # 모든 이미지 에셋을 지금 바로(동기) 읽기 — 헤드리스 도구/벤치마크용
+    images = {}
+    for name, (loader, finalize) in asset_jobs().items():
+        value = loader()
+        images[name] = finalize(value) if finalize else value
+    return images
+
+
+def load_images_from_files():
+    # 원본 PNG/JPG 디코딩 (변환 없이) — mk_assetpack.py 에서 사용
+    return {name: loader() for name, (loader, _) in _file_jobs().items()}
+
+
+def sources_key():
+    # 원본 이미지들의 (이름, 크기, CRC32) 요약. mtime 과 달리 압축 풀기 / 복사 순서와 상관없이 그대로 남는다
+    crc = 0
+    for name in SOURCE_FILES:
+        p = find_asset(name)
+        if p:
+            with open(p, "rb") as fp:
+                data = fp.read()
+            crc = zlib.crc32(f"{name}:{len(data)}:{zlib.crc32(data)}".encode(), crc)
+    return crc
+
+
+def _load_player_file():
+    player_img = pygame.image.load(find_asset("fighter.png"))
+    return pygame.transform.scale(player_img, (PLAYER_WIDTH, PLAYER_HEIGHT))
+
+
+def _load_background_file():
+    background_img = pygame.image.load(find_asset("background.jpg"))
+    return pygame.transform.scale(background_img, (SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def _load_weak_enemy_file():
+    # 사용자 약한 적 이미지 로드 (우선순위: assets/enemies/weak_enemy.png -> 프로젝트 루트 weak_enemy.png)
+    p = find_asset(os.path.join("assets", "enemies", "weak_enemy.png"), "weak_enemy.png")
+    if p:
+        try:
+            return pygame.image.load(p)
+        except Exception:
+            return None
+    return None
+
+
+def _file_jobs():
+    return {
+        "background": (_load_background_file, to_display),
+        "player": (_load_player_file, to_display_alpha),
+        "weak_enemy": (_load_weak_enemy_file, to_display_alpha),
+    }
+
+
+def pack_key():
+    # 팩 내용(변형 크기 / 들어 있는 마스크)을 정하는 설정의 요약값. 바뀌면 이미지가 그대로여도 팩을 다시 만들어야 함
+    from game.enemy_variants import HITBOXES, SIZE_STEP, SCALE_STEP
+    from game.entities import PLAYER_HITBOX
+
+    settings = (sorted(HITBOXES.items()), sorted(SIZE_STEP.items()), SCALE_STEP, PLAYER_HITBOX,
+                PLAYER_WIDTH, PLAYER_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT)
+    return zlib.crc32(repr(settings).encode())
+
+
+def _pack_jobs(path):
+    from game.assetpack import load_pack
+    from game.enemy_variants import HITBOXES, parse_variant_name
+    from game.entities import PLAYER_HITBOX
+    from game.hitbox import needs_mask
+
+    pack = load_pack(path)
+    if pack.sources != sources_key():
+        return None  # 원본 이미지가 바뀜 (팩을 다시 만들 때까지 원본 디코딩)
+    if pack.key != pack_key():
+        raise ValueError("built with different hitbox / variant settings, run mk_assetpack.py")
+
+    def load_variants():
+        # 마스크는 히트박스가 MASK 인 종류만 풀어 둔다
+        variants = {}
+        for name in pack.names():
+            if name.startswith("enemy:"):
+                key = parse_variant_name(name)
+                variants[key] = (pack.image(name), pack.mask(name) if needs_mask(HITBOXES[key[0]]) else None)
+        return variants
+
+    return {
+        # 디스플레이가 없으면 Surface 가 mmap 버퍼를 참조하므로 팩을 같이 들고 있음
+        "pack": (lambda: pack, None),
+        "background": (lambda: pack.image("background"), to_display),
+        "player": (lambda: pack.image("player"), to_display_alpha),
+        "player_mask": (lambda: pack.mask("player") if needs_mask(PLAYER_HITBOX) else None, None),
+        "weak_enemy": (lambda: pack.image("weak_enemy") if "weak_enemy" in pack else None, to_display_alpha),
+        "enemy_variants": (load_variants, variants_to_display),
+    }
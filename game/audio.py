@@ -0,0 +1,177 @@
+"""효과음 뱅크.
+
+효과음은 시작할 때 에셋 스레드에서 모두 pygame.mixer.Sound 로 디코딩해 둔다
+(assets/sfx/<이름>.wav 또는 .ogg 가 있으면 그 파일, 없으면 NumPy 로 합성).
+World 는 소리를 직접 내지 않고 world.sounds 에 이름만 남기고, 장면이 틱마다 SoundBank.play 로 넘긴다.
+play 는 고정된 채널 풀에서 빈 채널을 고르거나(없으면 우선순위가 같거나 낮은 가장 오래된 소리를 뺏음)
+Channel.play 만 호출하므로 믹싱은 SDL 오디오 스레드에서 돌고 시뮬레이션은 기다리지 않는다.
+같은 소리는 프레임마다 limit 번까지만 낸다 (총알 수십 발이 한 프레임에 맞아도 소리는 몇 개).
+"""
+import os
+
+import numpy as np
+import pygame
+
+from game.assets import find_asset
+from game.settings import SFX_CHANNELS, SFX_VOLUME, SOUND_NAMES
+
+# 이름: (우선순위, 프레임당 최대 횟수, 볼륨)
+SFX = {
+    "shot": (1, 1, 0.35),
+    "bomb": (2, 1, 0.5),
+    "hit": (2, 2, 0.4),
+    "explosion": (3, 2, 0.6),
+    "powerup": (3, 1, 0.7),
+    "player_hit": (4, 1, 0.8),
+    "round": (5, 1, 0.8),
+}
+# 네트워크로는 settings.SOUND_NAMES 번호로 보냄 — 효과음을 더하거나 빼면 그 표도 (game/net.py)
+assert set(SFX) == set(SOUND_NAMES), "audio.SFX 와 settings.SOUND_NAMES 가 다름"
+
+
+# --- 합성 ---------------------------------------------------------------------
+
+def _envelope(n, decay):
+    return np.exp(-np.linspace(0, decay, n))
+
+
+def _sweep(freq, ms, f0, f1, decay=4.0, square=False):
+    n = int(freq * ms / 1000)
+    f = np.linspace(f0, f1, n)
+    wave = np.sin(2 * np.pi * np.cumsum(f) / freq)
+    if square:
+        wave = np.sign(wave)
+    return wave * _envelope(n, decay)
+
+
+def _noise(freq, ms, decay=5.0, smooth=1, seed=0):
+    n = int(freq * ms / 1000)
+    wave = np.random.default_rng(seed).uniform(-1, 1, n)
+    if smooth > 1:
+        # 이동 평균으로 고음을 깎아 둔탁하게
+        wave = np.convolve(wave, np.ones(smooth) / smooth, mode="same") * np.sqrt(smooth)
+    return np.clip(wave, -1, 1) * _envelope(n, decay)
+
+
+def _tones(freq, ms, notes):
+    # notes 를 같은 길이로 이어 붙인 짧은 멜로디
+    return np.concatenate([_sweep(freq, ms / len(notes), f, f, decay=2.0) for f in notes])
+
+
+SYNTH = {
+    "shot": lambda freq: _sweep(freq, 70, 1400, 500, square=True) * 0.5,
+    "bomb": lambda freq: _sweep(freq, 180, 420, 90, decay=3.0),
+    "hit": lambda freq: _noise(freq, 50, decay=6.0),
+    "explosion": lambda freq: _noise(freq, 420, decay=4.0, smooth=24, seed=1),
+    "powerup": lambda freq: _tones(freq, 240, (523, 659, 784, 1047)),
+    "player_hit": lambda freq: _sweep(freq, 160, 180, 110, decay=2.5, square=True) * 0.6,
+    "round": lambda freq: _tones(freq, 420, (784, 1047)),
+}
+
+
+def synth_sound(name):
+    # 믹서 형식(주파수 / 채널 수)에 맞는 int16 배열로 만들어 Sound 로
+    freq, size, channels = pygame.mixer.get_init()
+    wave = SYNTH[name](freq)
+    if abs(size) == 8:
+        data = (wave * 127).astype(np.int8 if size < 0 else np.uint8)
+    else:
+        data = (wave * 32767).astype(np.int16)
+    if channels > 1:
+        data = np.repeat(data[:, None], channels, axis=1)
+    return pygame.sndarray.make_sound(np.ascontiguousarray(data))
+
+
+def load_sounds():
+    """모든 효과음을 Sound 로 (에셋 스레드에서 호출). 믹서가 없으면 빈 dict."""
+    if not pygame.mixer or not pygame.mixer.get_init():
+        return {}
+    sounds = {}
+    for name in SFX:
+        path = find_asset(*(os.path.join("assets", "sfx", name + ext) for ext in (".wav", ".ogg")))
+        try:
+            sounds[name] = pygame.mixer.Sound(path) if path else synth_sound(name)
+        except (pygame.error, ValueError) as e:
+            print(f"Warning: sfx {name}: {e}")
+    return sounds
+
+
+# --- 재생 ---------------------------------------------------------------------
+
+class SoundBank:
+    def __init__(self, sounds, channels=SFX_CHANNELS, volume=SFX_VOLUME):
+        self.sounds = sounds or {}
+        self.enabled = bool(self.sounds) and bool(pygame.mixer) and bool(pygame.mixer.get_init())
+        self.channels = []
+        if self.enabled:
+            pygame.mixer.set_num_channels(channels)
+            self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+            for name, sound in self.sounds.items():
+                sound.set_volume(SFX[name][2] * volume)
+        self._voices = [(0, 0)] * len(self.channels)  # 채널별 (우선순위, 시작 순번)
+        self._serial = 0
+        self._frame_counts = {}
+        self.played = 0
+        self.stolen = 0     # 다른 소리를 끊고 낸 횟수
+        self.dropped = 0    # 채널이 없어 못 낸 횟수
+        self.limited = 0    # 프레임당 제한으로 버린 횟수
+
+    def begin_frame(self):
+        self._frame_counts.clear()
+
+    def play(self, name):
+        if not self.enabled:
+            return None
+        sound = self.sounds.get(name)
+        if sound is None:
+            return None
+        priority, limit, _ = SFX[name]
+        count = self._frame_counts.get(name, 0)
+        if count >= limit:
+            self.limited += 1
+            return None
+        self._frame_counts[name] = count + 1
+
+        index = self._free_channel()
+        if index is None:
+            index = self._steal(priority)
+            if index is None:
+                self.dropped += 1
+                return None
+            self.stolen += 1
+        channel = self.channels[index]
+        channel.play(sound)
+        self._serial += 1
+        self._voices[index] = (priority, self._serial)
+        self.played += 1
+        return channel
+
+    def play_all(self, names):
+        for name in names:
+            self.play(name)
+
+    def _free_channel(self):
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+        return None
+
+    def _steal(self, priority):
+        # 우선순위가 같거나 낮은 소리 중 (낮은 우선순위, 오래된 것) 먼저
+        best = None
+        for i, voice in enumerate(self._voices):
+            if voice[0] <= priority and (best is None or voice < self._voices[best]):
+                best = i
+        return best
+
+    def stop(self):
+        for channel in self.channels:
+            channel.stop()
+
+    def stats(self):
+        return {
+            "played": self.played,
+            "stolen": self.stolen,
+            "dropped": self.dropped,
+            "limited": self.limited,
+        }
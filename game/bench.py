@@ -0,0 +1,267 @@
+"""스트레스 시나리오 벤치마크.
+
+    python -m game.bench                      # 모든 시나리오
+    python -m game.bench -s bullets_5000 -n 300 -o bench.json
+    python -m game.bench --replay last_replay.rpl   # 기록한 판을 그대로 다시 돌려서 측정
+
+각 시나리오마다 update / collision / draw 단계별 p50/p95/p99 프레임 시간(ms)과
+초당 틱 수를 출력하고 JSON 으로 저장한다. SDL dummy 드라이버로 창 없이 돈다.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from collections import namedtuple
+
+import pygame
+
+from game.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FRAME_MS, LOW_PARTICLE_CAP
+from game.assets import load_images
+from game.projectiles import BULLET, BOMB, ENEMY_BULLET
+from game.particles import ParticleSystem
+from game.render import ScrollRenderer, draw_batched
+from game.replay import Replay, world_checksum
+from game.world import World, Inputs, NO_INPUT, QUALITY_LOW_CAPS
+
+Scenario = namedtuple("Scenario", ["name", "description", "setup", "per_tick"])
+
+SCENARIOS = {}
+
+PHASES = ("update", "collision", "draw")
+KIND_NAMES = {BULLET: "bullet", BOMB: "bomb", ENEMY_BULLET: "enemy_bullet"}
+
+
+def scenario(name, description, per_tick=None):
+    # per_tick(world, tick) -> Inputs : 매 틱 시작 전에 호출 (엔티티 보충/입력 생성)
+    def register(setup):
+        SCENARIOS[name] = Scenario(name, description, setup, per_tick)
+        return setup
+    return register
+
+
+def _invulnerable(world):
+    # 게임 오버로 시나리오가 끊기지 않도록 체력을 크게
+    world.player.health = 10 ** 9
+
+
+def _sweep_and_fire(world, tick):
+    return Inputs(tick % 60 < 30, tick % 60 >= 30, tick % 3 == 0)
+
+
+def _refill_bullets(world, tick):
+    rng = world.rng
+    for _ in range(5000 - world.projectiles.count(BULLET)):
+        world.add_bullet(rng.randint(0, SCREEN_WIDTH), rng.randint(10, SCREEN_HEIGHT))
+    return NO_INPUT
+
+
+def _refill_enemy_bullets(world, tick, target=3000):
+    rng = world.rng
+    for _ in range(target - world.projectiles.count(ENEMY_BULLET)):
+        x = rng.randint(0, SCREEN_WIDTH)
+        y = rng.randint(0, SCREEN_HEIGHT)
+        world.add_enemy_bullet(x, y, x + rng.uniform(-50, 50), y + 100, speed=rng.uniform(2.0, 3.0))
+    return NO_INPUT
+
+
+def _refill_bullet_hell(world, tick):
+    return _refill_enemy_bullets(world, tick, target=10000)
+
+
+def _bomb_every_tick(world, tick):
+    world.player.bomb_bullet = True
+    return Inputs(tick % 120 < 60, tick % 120 >= 60, True)
+
+
+@scenario("baseline", "기본 편대 (게임 시작 상태), 3틱마다 발사", _sweep_and_fire)
+def _baseline(world):
+    _invulnerable(world)
+
+
+@scenario("formation_1000", "편대 적 1,000마리 (40x25)", _sweep_and_fire)
+def _formation_1000(world):
+    _invulnerable(world)
+    world.create_formation(cols=40, rows=25, start_x=10, start_y=0, h_spacing=18, v_spacing=16)
+
+
+@scenario("bullets_5000", "플레이어 총알 5,000발 유지", _refill_bullets)
+def _bullets_5000(world):
+    _invulnerable(world)
+
+
+@scenario("enemy_bullets_full", "화면을 채운 적 총알 (약 3,000발 유지)", _refill_enemy_bullets)
+def _enemy_bullets_full(world):
+    _invulnerable(world)
+
+
+@scenario("bullet_hell_10000", "적 총알 10,000발 유지", _refill_bullet_hell)
+def _bullet_hell_10000(world):
+    _invulnerable(world)
+
+
+@scenario("bomb_spam", "폭탄 파워업 상태로 매 틱 발사, 편대 적 200마리", _bomb_every_tick)
+def _bomb_spam(world):
+    _invulnerable(world)
+    world.create_formation(cols=20, rows=10, start_x=10, start_y=0, h_spacing=36, v_spacing=30)
+
+
+def percentile(sorted_values, p):
+    # nearest-rank 방식
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, int(round(p / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[k]
+
+
+def summarize(samples_ns):
+    ms = sorted(v / 1e6 for v in samples_ns)
+    return {
+        "mean_ms": sum(ms) / len(ms) if ms else 0.0,
+        "p50_ms": percentile(ms, 50),
+        "p95_ms": percentile(ms, 95),
+        "p99_ms": percentile(ms, 99),
+        "max_ms": ms[-1] if ms else 0.0,
+    }
+
+
+def replay_scenario(path):
+    # 리플레이 파일을 시나리오로: 기록된 시드와 입력을 그대로 사용
+    replay = Replay.load(path)
+    name = "replay:" + os.path.basename(path)
+    sc = Scenario(name, f"{path} ({len(replay)} ticks @ {replay.sim_hz} Hz)", lambda world: None,
+                  lambda world, tick: replay.inputs[tick])
+    return sc, replay
+
+
+def run_scenario(sc, images, screen, ticks=600, seed=0, dt=FRAME_MS, quality=None):
+    # quality: 품질 단계를 고정해서 실행 (None 이면 입력에 든 그대로 — 시나리오는 0, 리플레이는 기록된 값)
+    world = World(images, seed=seed)
+    sc.setup(world)
+    renderer = ScrollRenderer(screen, images["background"])
+    particles = ParticleSystem(seed=seed)
+    if quality is not None:
+        world.quality = quality  # 첫 틱 전 시나리오 보충에도 같은 단계가 걸리도록
+        if quality >= QUALITY_LOW_CAPS:
+            particles.limit = LOW_PARTICLE_CAP
+    samples = {phase: [] for phase in PHASES}
+    frame = []
+    peak_sprites = 0
+    peak_projectiles = {name: 0 for name in KIND_NAMES.values()}
+    clock = time.perf_counter_ns
+
+    start = clock()
+    for tick in range(ticks):
+        inputs = (sc.per_tick(world, tick) if sc.per_tick else NO_INPUT) or NO_INPUT
+        if quality is not None:
+            inputs = inputs._replace(quality=quality)
+        t0 = clock()
+        world.handle_input(inputs)
+        world.update(dt)
+        t1 = clock()
+        world.collide()
+        t2 = clock()
+        renderer.scroll()
+        renderer.begin()
+        draw_batched(screen, world.all_sprites, doreturn=False)
+        world.projectiles.draw(screen)
+        particles.emit_all(world.effects)
+        particles.update(dt)
+        particles.draw(screen)
+        t3 = clock()
+        samples["update"].append(t1 - t0)
+        samples["collision"].append(t2 - t1)
+        samples["draw"].append(t3 - t2)
+        frame.append(t3 - t0)
+        peak_sprites = max(peak_sprites, len(world.all_sprites) + len(world.projectiles))
+        for kind, name in KIND_NAMES.items():
+            peak_projectiles[name] = max(peak_projectiles[name], world.projectiles.count(kind))
+    wall = (clock() - start) / 1e9
+    # 시나리오 보충 작업은 빼고 게임 루프 단계 시간만으로 계산
+    elapsed = sum(frame) / 1e9
+
+    return {
+        "description": sc.description,
+        "ticks": ticks,
+        "seed": seed,
+        "quality": quality,
+        "ticks_per_sec": ticks / elapsed if elapsed else 0.0,
+        "wall_seconds": wall,
+        "peak_sprites": peak_sprites,
+        "peak_projectiles": peak_projectiles,
+        "frame": summarize(frame),
+        "phases": {phase: summarize(samples[phase]) for phase in PHASES},
+        "pools": world.pool_stats(),
+        "particles": particles.stats(),
+        # 같은 시드/틱 수에서 값이 바뀌면 시뮬레이션 결과가 달라진 것
+        "checksum": f"{world_checksum(world):08x}",
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="슈팅 게임 스트레스 벤치마크")
+    parser.add_argument("-s", "--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="실행할 시나리오 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("-n", "--ticks", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default="bench_results.json")
+    parser.add_argument("--replay", action="append", default=[],
+                        help="리플레이 파일을 시나리오로 실행 (여러 번 지정 가능)")
+    parser.add_argument("--quality", type=int, choices=range(4), default=None,
+                        help="품질 단계를 고정해서 실행 (0~3, game.governor; 기본: 입력 그대로)")
+    parser.add_argument("--list", action="store_true", help="시나리오 목록만 출력")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for sc in SCENARIOS.values():
+            print(f"{sc.name:20s} {sc.description}")
+        return 0
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    images = load_images()
+
+    results = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "scenarios": {},
+    }
+    runs = [(SCENARIOS[name], dict(ticks=args.ticks, seed=args.seed, quality=args.quality))
+            for name in args.scenario or ([] if args.replay else list(SCENARIOS))]
+    for path in args.replay:
+        sc, replay = replay_scenario(path)
+        # 품질을 고정하면 기록과 다르게 도므로 체크섬은 비교하지 않음
+        expect = replay.checksum if args.quality is None else 0
+        runs.append((sc, dict(ticks=len(replay), seed=replay.seed, dt=replay.step_ms, expect=expect,
+                              quality=args.quality)))
+
+    status = 0
+    for sc, opts in runs:
+        name = sc.name
+        expect = opts.pop("expect", 0)
+        r = run_scenario(sc, images, screen, **opts)
+        results["scenarios"][name] = r
+        if expect and r["checksum"] != f"{expect:08x}":
+            print(f"Warning: {name}: replay desync (checksum {r['checksum']} != {expect:08x})")
+            status = 1
+        phases = "  ".join(
+            f"{phase} {r['phases'][phase]['p50_ms']:.2f}/{r['phases'][phase]['p95_ms']:.2f}/{r['phases'][phase]['p99_ms']:.2f}"
+            for phase in PHASES
+        )
+        print(f"{name:20s} {r['ticks_per_sec']:8.1f} ticks/s  peak {r['peak_sprites']:5d}  (p50/p95/p99 ms) {phases}")
+
+    with open(args.output, "w", encoding="utf-8") as fp:
+        json.dump(results, fp, indent=2, ensure_ascii=False)
+    print(f"saved {args.output}")
+    pygame.quit()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
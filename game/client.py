@@ -0,0 +1,237 @@
+"""LAN 협동 플레이 클라이언트.
+
+    python shooting_game.py --connect 192.168.0.10          # 게임 화면으로 접속
+    python -m game.client --host 127.0.0.1 --seconds 10     # 화면 없이 봇으로 접속 (테스트용)
+
+NetClient 는 논블로킹 UDP 소켓 하나로 게임 루프 안에서 poll() 만 부르면 된다 (별도 스레드 없음).
+틱마다 send_input() 으로 입력에 순번을 매겨 보내고(최근 NET_INPUT_REDUNDANCY 틱치를 같이 실어서
+패킷 하나가 빠져도 다음 패킷에 들어감), 스냅숏은 번호로 보관해서 다음 델타의 기준으로 쓴다.
+
+내 플레이어만 예측한다: 서버가 처리했다고 알려온 마지막 입력 이후의 입력을 서버 위치에서부터
+entities.move_player 로 다시 적용한 위치에 그린다. 나머지는 받은 스냅숏 그대로.
+"""
+import argparse
+import random
+import socket
+import sys
+import time
+from collections import OrderedDict
+
+from game import net
+from game.entities import move_player
+from game.replay import pack_inputs
+from game.settings import (
+    NET_PORT, NET_INPUT_REDUNDANCY, NET_HISTORY, NET_TIMEOUT_MS, FRAME_MS, PLAYER_WIDTH, SIM_HZ,
+)
+from game.world import Inputs
+
+HELLO_EVERY_S = 0.5
+
+
+class NetClient:
+    def __init__(self, host, port=NET_PORT, player_width=PLAYER_WIDTH):
+        self.addr = (socket.gethostbyname(host), port)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.player_width = player_width
+        self.index = None          # WELCOME 을 받으면 내 플레이어 번호
+        self.players = 0
+        self.sim_hz = SIM_HZ
+        self.refused = False       # 서버에 자리가 없음
+        self.closed = False        # 서버가 끝냄 / 응답 없음
+        self.stats = net.NetStats()
+        self.states = OrderedDict()  # 스냅숏 번호 -> 상태
+        self.snap_id = 0
+        self.state = net.empty_state()
+        self.sounds = []           # 지난 poll 이후 받은 효과음 / 효과 (꺼내 쓰는 쪽이 비움)
+        self.effects = []
+        self.seq = 0
+        self.pending = []          # (순번, Inputs) 서버가 아직 처리 안 한 내 입력
+        self.last_applied = 0
+        self.mispredictions = 0    # 예측 위치와 서버 위치가 달랐던 스냅숏 수
+        self._predicted = {}       # 순번 -> 예측한 x (보정 확인용)
+        self._last_hello = 0.0
+        self._last_heard = time.monotonic()
+        self.hello()
+
+    # --- 송수신 -------------------------------------------------------------------
+
+    def send(self, packet):
+        try:
+            self.sock.sendto(packet, self.addr)
+        except OSError:
+            return
+        self.stats.sent(len(packet))
+
+    def hello(self):
+        self._last_hello = time.monotonic()
+        self.send(net.HELLO.pack(net.MSG_HELLO, net.PROTOCOL_VERSION))
+
+    def close(self):
+        if not self.closed:
+            self.send(net.BYTE.pack(net.MSG_BYE))
+        self.closed = True
+        self.sock.close()
+
+    @property
+    def connected(self):
+        return self.index is not None and not self.closed
+
+    def poll(self):
+        """받은 패킷을 모두 처리. 새 스냅숏이 있었으면 True."""
+        if self.closed:
+            return False
+        got = False
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                # 서버가 아직 없으면 (ICMP port unreachable) 다음 HELLO 까지 기다림
+                break
+            if addr != self.addr or not data:
+                continue
+            self.stats.received(len(data))
+            self._last_heard = time.monotonic()
+            kind = data[0]
+            if kind == net.MSG_WELCOME:
+                _, self.index, self.players, self.sim_hz = net.WELCOME.unpack_from(data, 0)
+            elif kind == net.MSG_FULL:
+                self.refused = True
+                self.closed = True
+            elif kind == net.MSG_BYE:
+                self.closed = True
+            elif kind == net.MSG_SNAPSHOT:
+                got = self.receive_snapshot(data) or got
+        now = time.monotonic()
+        if self.index is None and now - self._last_hello >= HELLO_EVERY_S:
+            self.hello()
+        if (now - self._last_heard) * 1000 > NET_TIMEOUT_MS and self.index is not None:
+            self.closed = True
+        self.stats.update()
+        return got
+
+    def receive_snapshot(self, data):
+        snap_id, base_id, last_applied, echo_time, hold_ms, body = net.unpack_snapshot(data)
+        if snap_id <= self.snap_id:
+            self.stats.dropped += 1   # 늦게 온 예전 스냅숏
+            return False
+        if base_id:
+            base = self.states.get(base_id)
+            if base is None:
+                self.stats.dropped += 1
+                return False
+            self.stats.delta_snapshots += 1
+        else:
+            base = net.empty_state()
+            self.stats.full_snapshots += 1
+        state, sounds, effects = net.decode_state(body, base)
+        self.states[snap_id] = state
+        while len(self.states) > NET_HISTORY:
+            self.states.popitem(last=False)
+        self.snap_id = snap_id
+        self.state = state
+        self.sounds.extend(sounds)
+        self.effects.extend(effects)
+        if echo_time:
+            self.stats.add_rtt(max(0, ((net.now_ms() - echo_time) & 0xFFFFFFFF) - hold_ms))
+        self.acknowledge(last_applied)
+        return True
+
+    def acknowledge(self, last_applied):
+        # 서버가 처리한 입력은 예측 대상에서 빼고, 그 시점 예측이 맞았는지 확인
+        self.last_applied = last_applied
+        self.pending = [(seq, inputs) for seq, inputs in self.pending if seq > last_applied]
+        predicted = self._predicted.pop(last_applied, None)
+        for seq in [s for s in self._predicted if s < last_applied]:
+            del self._predicted[seq]
+        me = self.me
+        if predicted is not None and me is not None and int(predicted) != me[0]:
+            self.mispredictions += 1
+
+    def send_input(self, inputs):
+        # 이번 틱 입력에 순번을 매겨 보관하고, 최근 입력 몇 틱치를 한 패킷으로 보냄
+        self.seq += 1
+        self.pending.append((self.seq, inputs))
+        self._predicted[self.seq] = self.predicted_x()
+        recent = self.pending[-NET_INPUT_REDUNDANCY:]
+        bits = [pack_inputs(i) for _, i in recent]
+        self.send(net.pack_input(self.snap_id, net.now_ms(), recent[0][0], bits))
+
+    # --- 상태 ---------------------------------------------------------------------
+
+    @property
+    def me(self):
+        if self.index is None:
+            return None
+        return self.state["p"].get(self.index)
+
+    @property
+    def flags(self):
+        g = self.state["g"].get(0)
+        return g[4] if g else net.FLAG_WAITING
+
+    def predicted_x(self):
+        """내 플레이어의 예측 x: 서버 위치 + 아직 처리 안 된 내 입력."""
+        me = self.me
+        if me is None:
+            return None
+        if self.flags & (net.FLAG_WAITING | net.FLAG_GAME_OVER) or not me[2]:
+            return float(me[0])
+        x = float(me[0])
+        scale = 1000 / self.sim_hz / FRAME_MS
+        for _, inputs in self.pending:
+            x = move_player(x, inputs, scale, self.player_width)
+        return x
+
+    def take_events(self):
+        sounds, effects = self.sounds, self.effects
+        self.sounds = []
+        self.effects = []
+        return sounds, effects
+
+
+# --- 화면 없는 봇 클라이언트 (localhost 테스트용) ------------------------------------
+
+def run_bot(host, port, seconds, seed=None):
+    rng = random.Random(seed)
+    client = NetClient(host, port)
+    step = 1 / SIM_HZ
+    start = next_tick = time.monotonic()
+    next_report = start + 1.0
+    move = 0
+    while time.monotonic() - start < seconds and not client.closed:
+        client.poll()
+        now = time.monotonic()
+        while next_tick <= now:
+            next_tick += step
+            if client.connected:
+                if rng.random() < 0.05:
+                    move = rng.choice((-1, 0, 1))
+                client.send_input(Inputs(move < 0, move > 0, rng.random() < 0.1))
+        if now >= next_report:
+            next_report += 1.0
+            g = client.state["g"].get(0)
+            print(f"client P{(client.index or 0) + 1}: tick {g[0] if g else '-'}, "
+                  f"pending {len(client.pending)}, mispredicted {client.mispredictions}, {client.stats.summary()}")
+        time.sleep(max(0.0, min(next_tick, next_report) - time.monotonic()))
+    if client.refused:
+        print("client: server is full")
+    client.close()
+    return client
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="화면 없는 LAN 협동 플레이 봇 클라이언트")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=NET_PORT)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    client = run_bot(args.host, args.port, args.seconds, args.seed)
+    return 0 if client.index is not None else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
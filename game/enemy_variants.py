@@ -0,0 +1,162 @@
+from collections import OrderedDict
+
+import pygame
+
+from game.hitbox import AABB, Capsule, MASK, needs_mask
+from game.settings import ENEMY_KINDS
+
+# 만들어 둘 변형(이미지+마스크) 최대 개수. 양자화 후 전체 조합이 60개 남짓이라 보통 다 들어간다.
+VARIANT_CACHE_SIZE = 128
+
+# 크기 양자화 간격 (px) / 약한 적 이미지 배율 간격
+SIZE_STEP = {"weak": 4, "strong": 5, "mid": 7}
+SCALE_STEP = 0.1
+
+# 변형 종류별 히트박스 (game.hitbox). 그린 모양이 단순한 것은 캡슐/사각형으로 두고 마스크를 만들지 않는다.
+# weak: 타원 (가로세로가 달라서 원 대신 캡슐), mid: 모서리만 둥근 사각형, strong: 뿔 달린 오각형, weak_img: 사용자 이미지(모양 모름)
+HITBOXES = {
+    "weak": Capsule(),
+    "weak_img": MASK,
+    "strong": MASK,
+    "mid": AABB(),
+}
+# 네트워크로는 settings.ENEMY_KINDS 번호로 보냄 — 종류를 더하거나 빼면 그 표도 (game/net.py)
+assert set(HITBOXES) == set(ENEMY_KINDS), "enemy_variants.HITBOXES 와 settings.ENEMY_KINDS 가 다름"
+
+
+def _snap(value, lo, step):
+    return lo + int(round((value - lo) / step)) * step
+
+
+def _steps(lo, hi, step):
+    return [_snap(v, lo, step) for v in range(lo, hi + 1, step)]
+
+
+def variant_name(key):
+    # 에셋 팩 안에서 쓰는 이름: ("strong", 55, 40) -> "enemy:strong:55:40"
+    return "enemy:" + ":".join(str(part) for part in key)
+
+
+def parse_variant_name(name):
+    kind, *rest = name.split(":")[1:]
+    if kind == "weak_img":
+        return (kind, float(rest[0]))
+    return (kind, int(rest[0]), int(rest[1]))
+
+
+class EnemyVariants:
+    """적 타입별 이미지/마스크/히트박스를 몇 가지 크기로 양자화해 공유하는 캐시.
+
+    pick() 은 예전 Enemy.__init__ 과 같은 순서로 rng 를 뽑은 뒤 값을 격자에 맞춰 자르므로,
+    같은 시드에서는 같은 변형이 나온다. 변형은 처음 요청될 때 한 번만 만들고(LRU 로 개수 제한),
+    같은 변형의 적들은 image 와 mask 객체를 함께 쓴다 — 수정하지 말 것.
+    변형은 (image, mask, hitbox) 이고 히트박스가 MASK 가 아닌 종류는 mask 가 None.
+    """
+
+    def __init__(self, weak_enemy_img=None, maxsize=VARIANT_CACHE_SIZE, prebuilt=None):
+        self.weak_enemy_img = weak_enemy_img
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # 에셋 팩에서 읽은 변형 {key: (image, mask)} — 처음부터 캐시에 채워둠
+        if prebuilt:
+            for key, (image, mask) in prebuilt.items():
+                hitbox = HITBOXES[key[0]]
+                self._cache[key] = (image, mask if needs_mask(hitbox) else None, hitbox)
+
+    def all_keys(self):
+        # 양자화 후 나올 수 있는 모든 변형 (에셋 팩 빌드용)
+        keys = []
+        if self.weak_enemy_img:
+            keys += [("weak_img", round(0.6 + i * SCALE_STEP, 2)) for i in range(5)]
+        else:
+            keys += [("weak", w, h) for w in _steps(28, 36, SIZE_STEP["weak"]) for h in _steps(28, 36, SIZE_STEP["weak"])]
+        keys += [("strong", w, h) for w in _steps(50, 70, SIZE_STEP["strong"]) for h in _steps(40, 60, SIZE_STEP["strong"])]
+        keys += [("mid", w, h) for w in _steps(36, 50, SIZE_STEP["mid"]) for h in _steps(30, 44, SIZE_STEP["mid"])]
+        return keys
+
+    def pick(self, enemy_type, rng):
+        return self.get(self.pick_key(enemy_type, rng))
+
+    def pick_key(self, enemy_type, rng):
+        # 변형 키만 (네트워크 스냅숏은 이미지 대신 이 키를 보냄)
+        if enemy_type == "weak":
+            if self.weak_enemy_img:
+                scale = _snap(rng.uniform(0.6, 1.0), 0.6, SCALE_STEP)
+                key = ("weak_img", round(scale, 2))
+            else:
+                step = SIZE_STEP["weak"]
+                w = _snap(rng.randint(28, 36), 28, step)
+                h = _snap(rng.randint(28, 36), 28, step)
+                key = ("weak", w, h)
+        elif enemy_type == "strong":
+            step = SIZE_STEP["strong"]
+            w = _snap(rng.randint(50, 70), 50, step)
+            h = _snap(rng.randint(40, 60), 40, step)
+            key = ("strong", w, h)
+        else:  # mid / mixed
+            step = SIZE_STEP["mid"]
+            w = _snap(rng.randint(36, 50), 36, step)
+            h = _snap(rng.randint(30, 44), 30, step)
+            key = ("mid", w, h)
+        return key
+
+    def get(self, key):
+        cache = self._cache
+        variant = cache.get(key)
+        if variant is not None:
+            cache.move_to_end(key)
+            self.hits += 1
+            return variant
+        self.misses += 1
+        return self._store(key)
+
+    def _store(self, key):
+        cache = self._cache
+        image = self._build(key)
+        hitbox = HITBOXES[key[0]]
+        mask = None
+        if needs_mask(hitbox):
+            try:
+                mask = pygame.mask.from_surface(image)
+            except Exception:
+                mask = None
+        variant = (image, mask, hitbox)
+        cache[key] = variant
+        if len(cache) > self.maxsize:
+            cache.popitem(last=False)
+        return variant
+
+    def warm(self, limit=4):
+        # 아직 안 만든 변형을 limit 개까지 미리 만들기 (라운드 전환처럼 한가한 프레임용). 남은 개수 반환
+        if len(self._cache) >= self.maxsize:
+            return 0
+        missing = [key for key in self.all_keys() if key not in self._cache]
+        for key in missing[:limit]:
+            self._store(key)
+        return max(len(missing) - limit, 0)
+
+    def _build(self, key):
+        kind = key[0]
+        if kind == "weak_img":
+            img = self.weak_enemy_img
+            w = int(img.get_width() * key[1])
+            h = int(img.get_height() * key[1])
+            return pygame.transform.smoothscale(img, (w, h))
+
+        _, w, h = key
+        image = pygame.Surface((w, h), pygame.SRCALPHA)
+        if kind == "weak":
+            pygame.draw.ellipse(image, (200, 80, 80), image.get_rect())
+        elif kind == "strong":
+            # 강한 적 모양: 장방형+뿔 스타일
+            pygame.draw.polygon(image, (120, 40, 200), [(w//2, 0), (w-1, h//3), (w-1, h-1), (0, h-1), (0, h//3)])
+        else:
+            pygame.draw.rect(image, (220, 160, 60), image.get_rect(), border_radius=6)
+            # 약간 장식 추가
+            pygame.draw.rect(image, (180, 120, 40), (w//6, h//3, w*2//3, h//6))
+        return image
+
+    def stats(self):
+        return {"variants": len(self._cache), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,198 @@
+import pygame
+
+from game.hitbox import Capsule, needs_mask
+from game.settings import SCREEN_WIDTH, SCREEN_HEIGHT, GREEN, BLUE, PLAYER_SPEED
+
+# 그리기 층 (render.draw_batched: 낮은 층부터, 같은 층 안에서는 같은 이미지끼리 묶어서).
+# 스프라이트는 image 를 바꿀 때 batch_key = (층, id(image)) 도 같이 바꾼다
+LAYER_ENEMY = 1
+LAYER_POWERUP = 2
+LAYER_PLAYER = 3
+
+# 히트박스 (game.hitbox). 플레이어는 날개를 뺀 몸통 캡슐 — 마스크를 만들지 않음
+PLAYER_HITBOX = Capsule(0.4)
+
+
+def move_player(x, controls, scale, width):
+    # 플레이어 가로 이동 한 틱 (네트워크 클라이언트의 예측도 같은 함수를 씀)
+    if controls is not None:
+        step = PLAYER_SPEED * scale
+        if controls.left:
+            x -= step
+        if controls.right:
+            x += step
+    if x < 0:
+        x = 0.0
+    if x > SCREEN_WIDTH - width:
+        x = float(SCREEN_WIDTH - width)
+    return x
+
+
+# Player class
+class Player(pygame.sprite.Sprite):
+    draw_layer = LAYER_PLAYER
+    hitbox = PLAYER_HITBOX
+
+    def __init__(self, world, index=0, count=1):
+        super().__init__()
+        self.world = world
+        self.index = index  # 협동 플레이에서 몇 번째 플레이어인지 (0 = 1P)
+        self.image = world.images["player"]
+        self.batch_key = (self.draw_layer, id(self.image))
+        self.rect = self.image.get_rect()
+        # 플레이어가 여럿이면 화면을 같은 간격으로 나눠서 시작
+        self.rect.centerx = SCREEN_WIDTH * (2 * index + 1) // (2 * count)
+        self.rect.bottom = SCREEN_HEIGHT - 10
+        self.x = float(self.rect.x)  # 틱 배율이 1 이 아닐 때도 이동량이 깎이지 않도록 실수 좌표 유지
+        self.health = 3  # 플레이어 체력
+        self.double_bullet = False
+        self.bomb_bullet = False
+        self.controls = None  # World.step 에서 이번 틱 입력을 넣어줌
+        # 히트박스가 마스크일 때만 마스크 (에셋 팩에 미리 만든 마스크가 있으면 사용)
+        self.mask = world.images.get("player_mask") if needs_mask(self.hitbox) else None
+        if self.mask is None and needs_mask(self.hitbox):
+            try:
+                self.mask = pygame.mask.from_surface(self.image)
+            except Exception:
+                self.mask = None
+
+    def update(self):
+        self.x = move_player(self.x, self.controls, self.world.tick_scale, self.rect.width)
+        self.rect.x = int(self.x)
+
+    def reduce_health(self):
+        self.health -= 1
+        if self.health <= 0:
+            self.kill()
+
+    def reset_powerups(self):
+        self.double_bullet = False
+        self.bomb_bullet = False
+
+
+class Enemy(pygame.sprite.Sprite):
+    draw_layer = LAYER_ENEMY
+
+    def __init__(self, world, enemy_type="weak", formation=None, offset_x=0, offset_y=0):
+        super().__init__()
+        self.world = world
+        self.enemy_type = enemy_type
+        rng = world.rng
+
+        # 타입별 이미지/마스크/히트박스(양자화된 변형을 공유) 및 체력 설정
+        self.variant = world.enemy_variants.pick_key(enemy_type, rng)
+        self.image, self.mask, self.hitbox = world.enemy_variants.get(self.variant)
+        self.batch_key = (self.draw_layer, id(self.image))
+        if enemy_type == "weak":
+            self.health = 1
+            self.value = 10
+        elif enemy_type == "strong":
+            self.health = 3
+            self.value = 50
+        else:  # mid / mixed
+            self.health = 2
+            self.value = 25
+
+        # rect / 초기 위치 설정
+        self.rect = self.image.get_rect()
+        self.formation = None
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+
+        if formation is None:
+            self.rect.x = rng.randint(0, SCREEN_WIDTH - self.rect.width)
+            self.rect.y = rng.randint(-140, -40)
+            self.speed = world.enemy_speed + rng.uniform(-0.4, 0.8)
+            self.y = float(self.rect.y)
+        else:
+            self.speed = 0
+            # add_member 가 formation 을 설정하고 rect 를 편대 위치에 놓음
+            formation.add_member(self, offset_x // formation.h_spacing if formation.h_spacing else 0,
+                                 offset_y // formation.v_spacing if formation.v_spacing else 0)
+
+        # 적 발사 타이머 (간격을 늘려서 발사 빈도 감소) — 시뮬레이션 시계(world.time_ms) 기준
+        # 실제 발사는 World 의 FireScheduler 가 이 시각이 된 적만 꺼내서 shoot() 호출
+        self.shoot_interval = rng.randint(2000, 4000)   # 이전보다 길게
+        self.next_shot_time = world.time_ms + rng.randint(800, self.shoot_interval)
+
+    def update(self):
+        world = self.world
+        rng = world.rng
+        if self.formation is None:
+            self.y += self.speed * world.tick_scale
+            self.rect.y = int(self.y)
+            if self.rect.top > SCREEN_HEIGHT:
+                self.rect.x = rng.randint(0, SCREEN_WIDTH - self.rect.width)
+                self.rect.y = rng.randint(-140, -40)
+                self.speed = world.enemy_speed + rng.uniform(-0.4, 0.8)
+                self.y = float(self.rect.y)
+
+    def shoot(self, now):
+        # 발사 시각이 된 적: 확률 검사 후 플레이어 쪽으로 발사하고 다음 발사 시각을 돌려줌
+        world = self.world
+        rng = world.rng
+        tuning = world.tuning
+        if rng.random() <= tuning.enemy_shoot_prob:
+            player = world.target_player(self.rect.centerx)
+            if player is not None:
+                bx = self.rect.centerx
+                by = self.rect.bottom
+                tx = player.rect.centerx
+                ty = player.rect.centery
+                spd = rng.uniform(tuning.enemy_bullet_min_speed, tuning.enemy_bullet_max_speed)
+                world.add_enemy_bullet(bx, by, tx, ty, speed=spd)
+        # 다음 발사 시간 (간격도 랜덤화)
+        return now + rng.randint(1200, max(2000, self.shoot_interval))
+
+    def kill(self):
+        if self.formation is not None:
+            self.formation.remove_member(self)
+        super().kill()
+
+
+# 파워업 이미지는 종류별로 한 번만 만들어 공유
+_powerup_images = {}
+
+
+def powerup_image(power_type):
+    image = _powerup_images.get(power_type)
+    if image is None:
+        image = pygame.Surface([20, 20], pygame.SRCALPHA)
+        if power_type == "double_bullet":
+            pygame.draw.circle(image, GREEN, (10, 10), 10)
+        else:
+            pygame.draw.circle(image, BLUE, (10, 10), 10)
+        _powerup_images[power_type] = image
+    return image
+
+
+# PowerUp class (SpritePool 로 재사용됨)
+class PowerUp(pygame.sprite.Sprite):
+    # 한 틱(FRAME_MS) 동안 떨어지는 거리
+    SPEED = 2
+    draw_layer = LAYER_POWERUP
+
+    def __init__(self, x, y, power_type, world=None):
+        super().__init__()
+        self.pool = None
+        self.reset(x, y, power_type, world)
+
+    def reset(self, x, y, power_type, world=None):
+        self.world = world
+        self.image = powerup_image(power_type)
+        self.batch_key = (self.draw_layer, id(self.image))
+        self.rect = self.image.get_rect(center=(x, y))
+        self.y = float(self.rect.y)
+        self.power_type = power_type
+
+    def kill(self):
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
+    def update(self):
+        self.y += self.SPEED * (self.world.tick_scale if self.world is not None else 1.0)
+        self.rect.y = int(self.y)
+        if self.rect.top > SCREEN_HEIGHT:
+            self.kill()
@@ -0,0 +1,74 @@
+import heapq
+from itertools import count
+
+
+class FireScheduler:
+    """적 발사 예약 큐.
+
+    (next_shot_time, 순번, enemy) 를 힙에 넣어 두고, 매 틱 시각이 된 항목만 꺼낸다.
+    죽은 적이나 시각이 다시 예약된 항목은 바로 지우지 않고 꺼낼 때 버린다(lazy removal).
+    틱당 비용은 적 수가 아니라 실제로 발사 시각이 된 적 수에 비례한다.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._counter = count()   # 같은 시각이면 먼저 예약한 순서대로
+        self.fired = 0            # 꺼내서 처리한 적 수
+        self.stale = 0            # 꺼냈지만 버린 항목 (죽은 적 / 재예약)
+        self.compactions = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def clear(self):
+        self._heap.clear()
+
+    def schedule(self, enemy, when):
+        enemy.next_shot_time = when
+        heapq.heappush(self._heap, (when, next(self._counter), enemy))
+
+    def schedule_many(self, entries):
+        """[(enemy, when), ...] 을 한 번에 예약 (편대 생성 / 일제 사격 후 재예약)."""
+        heap = self._heap
+        counter = self._counter
+        added = []
+        for enemy, when in entries:
+            enemy.next_shot_time = when
+            added.append((when, next(counter), enemy))
+        if len(added) > len(heap):
+            # 많이 넣을 때는 push 를 반복하는 것보다 합쳐서 heapify 가 싸다
+            heap.extend(added)
+            heapq.heapify(heap)
+        else:
+            for item in added:
+                heapq.heappush(heap, item)
+
+    def pop_due(self, now):
+        # now 까지 발사 시각이 된 살아있는 적 목록 (시각 순)
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= now:
+            when, _, enemy = heapq.heappop(heap)
+            if enemy.next_shot_time != when or not enemy.alive():
+                self.stale += 1
+                continue
+            due.append(enemy)
+        self.fired += len(due)
+        return due
+
+    def compact(self, live):
+        # 죽은 적 항목이 live 보다 훨씬 많이 쌓였으면 한 번에 정리
+        heap = self._heap
+        if len(heap) <= 2 * live + 64:
+            return
+        self._heap = [item for item in heap if item[2].alive() and item[2].next_shot_time == item[0]]
+        heapq.heapify(self._heap)
+        self.compactions += 1
+
+    def stats(self):
+        return {
+            "queued": len(self._heap),
+            "fired": self.fired,
+            "stale": self.stale,
+            "compactions": self.compactions,
+        }
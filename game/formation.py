@@ -0,0 +1,130 @@
+import math
+
+import numpy as np
+
+from game.settings import SCREEN_WIDTH
+
+
+# 갤러그식 편대
+class Formation:
+    """편대 하나. 멤버 오프셋/폭은 슬롯별 NumPy 배열로 들고, 편대 기준점(x, y)만 움직인다.
+
+    멤버 제거는 슬롯의 alive 를 내리는 O(1) 작업이고, 좌/우 경계는 경계에 있던 멤버가
+    죽었을 때만 다시 계산한다. 멤버 좌표는 floor(기준점) + 오프셋 으로, 기준점의 정수 위치가
+    바뀐 틱에만 한 번에 계산해서 rect 에 넣는다.
+    """
+
+    def __init__(self, x, y, cols, rows, h_spacing=70, v_spacing=60, pattern=None):
+        self.x = x
+        self.y = y
+        self.cols = cols
+        self.rows = rows
+        self.h_spacing = h_spacing
+        self.v_spacing = v_spacing
+        self.dir = 1  # 1: 오른쪽, -1: 왼쪽
+        self.speed = 1.2
+        self.drop_amount = 20
+        self.pattern = pattern or []  # optional type pattern
+
+        capacity = max(cols * rows, 1)
+        self._sprites = [None] * capacity
+        self._off_x = np.zeros(capacity, np.int32)
+        self._off_y = np.zeros(capacity, np.int32)
+        self._width = np.zeros(capacity, np.int32)
+        self._alive = np.zeros(capacity, bool)
+        self._n = 0          # 사용한 슬롯 수
+        self.count = 0       # 살아있는 멤버 수
+        self._active = None  # 살아있는 슬롯 (제거되면 다시 계산)
+        self._bounds = None  # (가장 왼쪽 오프셋, 가장 오른쪽 오프셋+폭)
+        self._origin = None  # 멤버 rect 에 마지막으로 반영한 정수 기준점
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def members(self):
+        return [self._sprites[i] for i in self._active_slots().tolist()]
+
+    def add_member(self, enemy, col, row):
+        slot = self._n
+        if slot == len(self._sprites):
+            self._grow()
+        self._n += 1
+        enemy.formation = self
+        enemy.formation_slot = slot
+        enemy.offset_x = col * self.h_spacing
+        enemy.offset_y = row * self.v_spacing
+        self._sprites[slot] = enemy
+        self._off_x[slot] = enemy.offset_x
+        self._off_y[slot] = enemy.offset_y
+        self._width[slot] = enemy.rect.width
+        self._alive[slot] = True
+        self.count += 1
+        self._active = None
+        self._bounds = None
+        enemy.rect.topleft = (math.floor(self.x) + enemy.offset_x, math.floor(self.y) + enemy.offset_y)
+
+    def _grow(self):
+        extra = len(self._sprites)
+        self._sprites.extend([None] * extra)
+        self._off_x = np.concatenate([self._off_x, np.zeros(extra, np.int32)])
+        self._off_y = np.concatenate([self._off_y, np.zeros(extra, np.int32)])
+        self._width = np.concatenate([self._width, np.zeros(extra, np.int32)])
+        self._alive = np.concatenate([self._alive, np.zeros(extra, bool)])
+
+    def remove_member(self, enemy):
+        slot = getattr(enemy, "formation_slot", None)
+        if slot is None or self._sprites[slot] is not enemy:
+            return
+        self._sprites[slot] = None
+        self._alive[slot] = False
+        self.count -= 1
+        self._active = None
+        # 경계에 있던 멤버가 빠졌을 때만 경계를 다시 계산
+        if self._bounds is not None:
+            left, right = self._bounds
+            if self._off_x[slot] == left or self._off_x[slot] + self._width[slot] == right:
+                self._bounds = None
+        enemy.formation_slot = None
+
+    def _active_slots(self):
+        if self._active is None:
+            self._active = np.flatnonzero(self._alive[:self._n])
+        return self._active
+
+    def bounds(self):
+        # 살아있는 멤버 기준 (왼쪽 오프셋, 오른쪽 오프셋+폭)
+        if self._bounds is None:
+            slots = self._active_slots()
+            if slots.size:
+                self._bounds = (int(self._off_x[slots].min()), int((self._off_x[slots] + self._width[slots]).max()))
+            else:
+                self._bounds = (0, 0)
+        return self._bounds
+
+    def update(self, scale=1.0):
+        if not self.count:
+            return
+        # 경계에 닿으면 방향 전환 (아래로 드롭하지 않음 — 적은 내려오지 않고 좌/우 이동만)
+        left_off, right_off = self.bounds()
+        left = left_off + self.x
+        right = right_off + self.x
+        if right >= SCREEN_WIDTH - 10 and self.dir == 1:
+            self.dir = -1
+            # self.y += self.drop_amount  # 제거: 더 이상 아래로 떨어지지 않음
+        elif left <= 10 and self.dir == -1:
+            self.dir = 1
+            # self.y += self.drop_amount  # 제거
+        self.x += self.dir * self.speed * scale
+
+        # 적용: 기준점의 정수 위치가 바뀐 틱에만 멤버 좌표를 한 번에 계산해서 반영
+        origin = (math.floor(self.x), math.floor(self.y))
+        if origin == self._origin:
+            return
+        self._origin = origin
+        slots = self._active_slots()
+        xs = (self._off_x[slots] + origin[0]).tolist()
+        ys = (self._off_y[slots] + origin[1]).tolist()
+        sprites = self._sprites
+        for slot, x, y in zip(slots.tolist(), xs, ys):
+            sprites[slot].rect.topleft = (x, y)
@@ -0,0 +1,68 @@
+"""프레임 예산을 지키기 위한 품질 자동 조절.
+
+최근 window 프레임의 작업 시간(프레임 제한으로 쉰 시간은 빼고) 평균이 예산을 넘으면 한 단계 낮추고,
+hold 프레임 동안 여유(예산의 up_ratio 이하)가 계속되면 한 단계 올린다. 단계를 바꾼 뒤에는 창을
+비우고 다시 채운 다음에야 또 바꾼다 (오르내림 반복 방지).
+
+단계 (앞 단계 조치를 모두 포함, world.QUALITY_*):
+    0 높음   타입별 히트박스 그대로 (game.hitbox)
+    1 보통   마스크 히트박스도 사각형으로
+    2 낮음   + 배경 스크롤 멈춤
+    3 최저   + 파티클 / 적 총알 / 플레이어 탄 최대 개수 낮춤
+"""
+from collections import deque
+
+from game.settings import FRAME_BUDGET_MS
+from game.world import QUALITY_HIGH, QUALITY_LOW_CAPS
+
+TIER_NAMES = ("높음", "보통", "낮음", "최저")
+TIER_LOG_NAMES = ("high", "coarse-hitboxes", "static-background", "low-caps")
+
+
+class QualityGovernor:
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, window=60, hold=180, down_ratio=1.0, up_ratio=0.6):
+        self.budget_ms = budget_ms
+        self.window = window
+        self.hold = hold
+        self.down_ratio = down_ratio
+        self.up_ratio = up_ratio
+        self.tier = QUALITY_HIGH
+        self.changes = 0
+        self._samples = deque(maxlen=max(window, hold))
+
+    def reset(self):
+        # 메뉴 / 일시정지에서 돌아왔을 때: 그동안의 프레임은 세지 않음
+        self._samples.clear()
+
+    def average(self, n=None):
+        samples = self._samples
+        n = min(n or self.window, len(samples))
+        if not n:
+            return 0.0
+        return sum(samples[i] for i in range(len(samples) - n, len(samples))) / n
+
+    def observe(self, work_ms):
+        """프레임 하나의 작업 시간(ms)을 넣는다. 단계가 바뀌었으면 새 단계, 아니면 None."""
+        samples = self._samples
+        samples.append(work_ms)
+        if len(samples) >= self.window and self.tier < QUALITY_LOW_CAPS:
+            avg = self.average(self.window)
+            if avg > self.budget_ms * self.down_ratio:
+                return self._set(self.tier + 1, avg)
+        if len(samples) >= self.hold and self.tier > QUALITY_HIGH:
+            avg = self.average(self.hold)
+            if avg < self.budget_ms * self.up_ratio:
+                return self._set(self.tier - 1, avg)
+        return None
+
+    def _set(self, tier, avg):
+        print(f"quality: {TIER_LOG_NAMES[self.tier]} -> {TIER_LOG_NAMES[tier]} "
+              f"(avg {avg:.1f} ms, budget {self.budget_ms:.1f} ms)")
+        self.tier = tier
+        self.changes += 1
+        self._samples.clear()
+        return tier
+
+    @property
+    def name(self):
+        return TIER_NAMES[self.tier]
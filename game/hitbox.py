@@ -0,0 +1,181 @@
+"""타입별 히트박스 모양과 충돌 판정.
+
+엔티티 타입마다 hitbox 로 모양 하나를 선언한다 (크기는 rect 기준 비율이라 같은 타입이면 크기가 달라도
+같은 값을 공유):
+
+    AABB(sx, sy)   rect 를 가로 sx, 세로 sy 배로 줄인 사각형 (꽉 찬 총알, 둥근 모서리 사각형)
+    Circle(ratio)  rect 중심, 반지름 ratio * 짧은 변 / 2
+    Capsule(ratio) 긴 축을 따라가는 선분 + 반지름 ratio * 짧은 변 / 2 (길쭉한 기체, 타원)
+    MASK           sprite.mask 픽셀 단위 (모양이 불규칙한 것만)
+
+collide(a, b) 는 두 모양 조합마다 가장 싼 정확한 검사를 고른다: 사각형끼리는 Rect.colliderect,
+원끼리는 중심 제곱 거리, 캡슐이 끼면 둥근 사각형(rounded) 간격의 제곱 거리.
+마스크는 MASK 끼리이거나 한쪽만 MASK 일 때만 쓰고, 이때 반대쪽 모양은 크기별로 한 번만 마스크로
+그려 캐시한다. MASK 가 아닌 타입은 마스크를 만들지 않는다 (needs_mask).
+모든 검사는 rect 가 이미 겹친 후보에만 부른다고 가정한다 (격자 / collidelistall 이 먼저 거름).
+그래서 모양은 rect 밖으로 나가면 안 된다 (비율은 1 이하).
+"""
+from collections import namedtuple
+
+import numpy as np
+import pygame
+
+AABB = namedtuple("AABB", ["sx", "sy"], defaults=(1.0, 1.0))
+Circle = namedtuple("Circle", ["ratio"], defaults=(1.0,))
+Capsule = namedtuple("Capsule", ["ratio"], defaults=(1.0,))
+Mask = namedtuple("Mask", [])
+MASK = Mask()
+RECT = AABB()
+
+_shape_masks = {}
+
+
+def needs_mask(shape):
+    return type(shape) is Mask
+
+
+def coarse(shape, ratio):
+    # 품질을 낮췄을 때(world.QUALITY_COARSE): 마스크 히트박스만 줄인 사각형으로 바꿈
+    return AABB(ratio, ratio) if type(shape) is Mask else shape
+
+
+# --- 모양 -> 좌표 ---------------------------------------------------------------
+
+def box(shape, rect):
+    if shape.sx == 1.0 and shape.sy == 1.0:
+        return rect
+    return rect.inflate(-round(rect.width * (1 - shape.sx)), -round(rect.height * (1 - shape.sy)))
+
+
+def circle(shape, rect):
+    cx = rect.x + rect.width / 2
+    cy = rect.y + rect.height / 2
+    return cx, cy, shape.ratio * min(rect.width, rect.height) / 2
+
+
+def segment(shape, rect):
+    # (x0, y0, x1, y1, 반지름) — 짧은 변 방향 가운데를 지나는 긴 축 선분 (항상 가로 또는 세로)
+    w, h = rect.size
+    cx = rect.x + w / 2
+    cy = rect.y + h / 2
+    if h >= w:
+        r = shape.ratio * w / 2
+        half = max(h / 2 - r, 0)
+        return cx, cy - half, cx, cy + half, r
+    r = shape.ratio * h / 2
+    half = max(w / 2 - r, 0)
+    return cx - half, cy, cx + half, cy, r
+
+
+def rounded(shape, rect):
+    """MASK 가 아닌 모양을 (left, top, right, bottom, 반지름) 둥근 사각형으로.
+
+    사각형은 반지름 0, 원은 크기 0 인 사각형(점), 캡슐은 축에 나란한 선분이라 폭 0 인 사각형이다.
+    두 둥근 사각형은 사각형 사이 간격(가로/세로)의 제곱합이 반지름 합의 제곱 이하일 때 겹친다.
+    """
+    kind = type(shape)
+    if kind is AABB:
+        r = box(shape, rect)
+        return r.left, r.top, r.right, r.bottom, 0.0
+    if kind is Circle:
+        cx, cy, r = circle(shape, rect)
+        return cx, cy, cx, cy, r
+    x0, y0, x1, y1, r = segment(shape, rect)
+    return x0, y0, x1, y1, r
+
+
+def shape_mask(shape, size):
+    """MASK 가 아닌 모양을 size 크기 rect 기준으로 그린 마스크 (모양 x 크기별로 한 번만)."""
+    key = (type(shape), shape, size)  # Circle(1.0) == Capsule(1.0) 이므로 타입도 키에
+    mask = _shape_masks.get(key)
+    if mask is None:
+        rect = pygame.Rect((0, 0), size)
+        if type(shape) is AABB:
+            mask = pygame.mask.Mask(size)
+            inner = box(shape, rect)
+            mask.draw(pygame.mask.Mask(inner.size, fill=True), inner.topleft)
+        else:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            left, top, right, bottom, r = rounded(shape, rect)
+            pygame.draw.circle(surf, (255, 255, 255), (left, top), r)
+            pygame.draw.circle(surf, (255, 255, 255), (right, bottom), r)
+            # 몸통: 선분을 반지름만큼 양옆(세로 선분) / 위아래(가로 선분)로 넓힌 사각형
+            if right - left < bottom - top:
+                body = (left - r, top, right - left + 2 * r, bottom - top)
+            else:
+                body = (left, top - r, right - left, bottom - top + 2 * r)
+            pygame.draw.rect(surf, (255, 255, 255), body)
+            mask = pygame.mask.from_surface(surf)
+        _shape_masks[key] = mask
+    return mask
+
+
+# --- 모양 조합별 검사 (sa, ra, sb, rb) ------------------------------------------
+
+def _aabb_aabb(sa, ra, sb, rb):
+    # pygame 과 같이 변이 맞닿기만 한 것은 겹침이 아님
+    return box(sa, ra).colliderect(box(sb, rb))
+
+
+def _circle_circle(sa, ra, sb, rb):
+    ax, ay, ar = circle(sa, ra)
+    bx, by, br = circle(sb, rb)
+    return (ax - bx) ** 2 + (ay - by) ** 2 <= (ar + br) ** 2
+
+
+def _rounded_rounded(sa, ra, sb, rb):
+    al, at, ar, ab, arad = rounded(sa, ra)
+    bl, bt, br, bb, brad = rounded(sb, rb)
+    dx = max(bl - ar, al - br, 0)
+    dy = max(bt - ab, at - bb, 0)
+    return dx * dx + dy * dy <= (arad + brad) ** 2
+
+
+_TESTS = {
+    (AABB, AABB): _aabb_aabb,
+    (Circle, Circle): _circle_circle,
+}
+
+
+def overlap(sa, ra, ma, sb, rb, mb):
+    """모양 sa(rect ra, 마스크 ma) 와 sb(rb, mb) 가 겹치는지. 마스크는 MASK 인 쪽만 있으면 된다."""
+    if type(sa) is Mask:
+        if type(sb) is not Mask:
+            mb = shape_mask(sb, rb.size)
+        return ma is None or bool(ma.overlap(mb, (rb.x - ra.x, rb.y - ra.y)))
+    if type(sb) is Mask:
+        ma = shape_mask(sa, ra.size)
+        return mb is None or bool(mb.overlap(ma, (ra.x - rb.x, ra.y - rb.y)))
+    return _TESTS.get((type(sa), type(sb)), _rounded_rounded)(sa, ra, sb, rb)
+
+
+def overlap_rects(shape, rect, mask, left, top, w, h):
+    """모양 shape(rect, mask) 와 같은 크기 w x h 사각형 여러 개(left, top 배열)의 겹침 여부 배열.
+
+    탄처럼 꽉 찬 사각형 여러 개와 한 스프라이트를 비교할 때 후보 전체를 벡터 연산 한 번으로.
+    """
+    if type(shape) is Mask:
+        if mask is None:
+            return np.ones(len(left), bool)
+        other = shape_mask(RECT, (w, h))
+        return np.fromiter((bool(mask.overlap(other, (x - rect.x, y - rect.y)))
+                            for x, y in zip(left.tolist(), top.tolist())), bool, len(left))
+    if type(shape) is AABB:
+        r = box(shape, rect)
+        return (left < r.right) & (left + w > r.left) & (top < r.bottom) & (top + h > r.top)
+    l, t, r, b, rad = rounded(shape, rect)
+    dx = np.maximum(np.maximum(left - r, l - (left + w)), 0)
+    dy = np.maximum(np.maximum(top - b, t - (top + h)), 0)
+    return dx * dx + dy * dy <= rad * rad
+
+
+def collide(a, b):
+    # pygame.sprite.collide_mask 자리에 쓰는 함수 (스프라이트의 hitbox / rect / mask 사용)
+    return overlap(a.hitbox, a.rect, getattr(a, "mask", None), b.hitbox, b.rect, getattr(b, "mask", None))
+
+
+def collide_coarse(ratio):
+    # 품질을 낮췄을 때 collide 대신 (마스크 히트박스를 줄인 사각형으로)
+    def collided(a, b):
+        return overlap(coarse(a.hitbox, ratio), a.rect, None, coarse(b.hitbox, ratio), b.rect, None)
+    return collided
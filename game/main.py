@@ -0,0 +1,109 @@
+"""게임 실행: 창을 열고 시작 메뉴(또는 --connect 면 LAN 협동 플레이)로 메인 루프를 돈다.
+
+    python shooting_game.py [--connect HOST[:PORT]]
+    python -m game [--connect HOST[:PORT]]
+
+import 만 해서는 아무것도 하지 않는다 (pygame 초기화, 창, 음악은 모두 main() 안에서).
+pygame 과 화면 모듈은 main() 에서 import 하고, 시뮬레이션 / 네트워크 / 효과음 모듈은 게임을 시작할 때
+import 해서 첫 메뉴 프레임까지의 시간을 줄인다. 단계별 시간은 game.startup 이 출력한다.
+"""
+import argparse
+
+from game import startup
+from game.settings import NET_PORT
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="슈팅 게임")
+    parser.add_argument("--connect", metavar="HOST[:PORT]", help="LAN 협동 플레이 서버에 접속 (서버: python -m game.server)")
+    return parser.parse_args(argv)
+
+
+def init_display():
+    import pygame
+
+    from game.settings import SCREEN_WIDTH, SCREEN_HEIGHT, VSYNC, MIXER_FREQUENCY, MIXER_BUFFER
+
+    # 믹서 버퍼(지연) 설정은 init 전에
+    pygame.mixer.pre_init(MIXER_FREQUENCY, -16, 2, MIXER_BUFFER)
+    pygame.init()
+    # Initialize mixer for sound
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"Warning: {e}")
+        pygame.mixer = None
+
+    # Initialize screen (VSYNC 설정 시 SCALED 창으로 수직 동기화 시도)
+    screen = None
+    if VSYNC:
+        try:
+            screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
+        except pygame.error as e:
+            print(f"Warning: vsync: {e}")
+    if screen is None:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("슈팅 게임")  # 한국어 타이틀
+    return screen
+
+
+# Load background music if mixer is initialized (백그라운드 스레드에서 읽고 준비되면 재생)
+def load_music():
+    import pygame
+
+    from game.assets import find_asset
+
+    path = find_asset("background_music.mp3")
+    pygame.mixer.music.load(path)
+    return path
+
+
+def play_music(path):
+    import pygame
+
+    pygame.mixer.music.play(-1)  # Play the music in a loop
+    return path
+
+
+def start_assets():
+    # 이미지/음악/효과음은 시작 메뉴가 떠 있는 동안 백그라운드에서 읽는다
+    import pygame
+
+    from game.assets import asset_jobs
+    from game.asset_manager import AssetManager
+
+    assets = AssetManager()
+    jobs = asset_jobs()
+    if pygame.mixer:
+        from game.audio import load_sounds
+
+        jobs["music"] = (load_music, play_music)
+        jobs["sfx"] = (load_sounds, None)
+    assets.start(jobs)
+    return assets
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    import pygame
+
+    from game.scenes import App, StartMenuScene
+
+    startup.mark("imports")
+    screen = init_display()
+    startup.mark("display")
+    assets = start_assets()
+
+    # 시작 메뉴 -> 게임 -> 게임 오버 화면 전환은 모두 장면 스택(game/scenes.py)이 처리
+    app = App(screen, assets)
+    if args.connect:
+        # LAN 협동 플레이: 메뉴 없이 서버에 접속
+        from game.client import NetClient
+        from game.playing import NetPlayingScene
+
+        host, _, port = args.connect.partition(":")
+        app.run(NetPlayingScene(app, NetClient(host, int(port) if port else NET_PORT)))
+    else:
+        app.run(StartMenuScene(app))
+    pygame.quit()
+    return 0
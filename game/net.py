@@ -0,0 +1,281 @@
+"""LAN 협동 플레이 프로토콜 (UDP).
+
+서버(game.server)가 World 를 돌리고, 클라이언트(game.client)는 틱마다 입력을 보내고 스냅숏을 받는다.
+
+스냅숏은 World 상태를 표(table) 몇 개로 양자화한 것 — {번호: 정수 튜플}:
+    g  전역      {0: (틱, 라운드, 라운드 처치, 누적 처치, 플래그)}
+    p  플레이어  {번호: (x, y, 체력, 파워업 비트)}
+    e  적        {net_id: (x, y, 변형 종류, 변형 a, 변형 b)}
+    u  파워업    {net_id: (x, y, 종류)}
+    b  탄        {생성 순번: (종류, x, y)}
+좌표는 모두 정수 px. 보낼 때는 클라이언트가 마지막으로 받았다고 알려온(ack) 스냅숏과 비교해서
+없어진 번호와 바뀐 항목만, 바뀐 항목은 필드별 차이를 zigzag varint 로 쓴다 (새 항목은 0 과의 차이).
+그 뒤 zlib 으로 줄어들면 압축한다. 효과음/파티클 이벤트는 델타 없이 덧붙인다.
+
+패킷 (little-endian, 첫 바이트가 종류):
+    HELLO     "<BH"     종류, 프로토콜 버전
+    WELCOME   "<BBBH"   종류, 내 플레이어 번호, 인원, SIM_HZ
+    FULL      "<B"      자리 없음
+    INPUT     "<BIIIB"  종류, ack 스냅숏 번호, 클라이언트 시각(ms), 첫 입력 순번, 개수 + 입력 비트(replay.pack_inputs) 들
+    SNAPSHOT  "<BIIIIHB" 종류, 스냅숏 번호, 기준 번호(0 = 전체), 처리한 마지막 입력 순번,
+                        되돌려주는 클라이언트 시각, 서버에서 기다린 ms, 압축 여부 + 본문
+    BYE       "<B"
+"""
+import struct
+import time
+import zlib
+
+import numpy as np
+
+from game.replay import write_varint, read_varint
+from game.settings import SOUND_NAMES, EFFECT_NAMES, ENEMY_KINDS
+
+PROTOCOL_VERSION = 1
+
+MSG_HELLO = 1
+MSG_WELCOME = 2
+MSG_FULL = 3
+MSG_INPUT = 4
+MSG_SNAPSHOT = 5
+MSG_BYE = 6
+
+HELLO = struct.Struct("<BH")
+WELCOME = struct.Struct("<BBBH")
+INPUT = struct.Struct("<BIIIB")
+SNAPSHOT = struct.Struct("<BIIIIHB")
+BYTE = struct.Struct("<B")
+
+# UDP 한 패킷에 실을 수 있는 최대 크기 (넘으면 탄 표를 잘라냄)
+MAX_PACKET = 60000
+
+TABLES = ("g", "p", "e", "u", "b")
+FIELDS = {"g": 5, "p": 4, "e": 5, "u": 3, "b": 3}
+
+# 전역 플래그
+FLAG_GAME_OVER = 1
+FLAG_WAITING = 2     # 인원이 다 모이지 않아 멈춰 있음
+
+POWERUP_TYPES = ("double_bullet", "bomb_bullet")
+# 효과음 / 효과 / 적 변형 종류 번호는 settings 의 표 순서 (렌더링 / 오디오 쪽 dict 순서와 무관)
+VARIANT_KINDS = ENEMY_KINDS
+
+
+def now_ms():
+    return int(time.monotonic() * 1000) & 0xFFFFFFFF
+
+
+# --- World -> 표 ----------------------------------------------------------------
+
+def variant_code(key):
+    # EnemyVariants 키 -> (종류 번호, a, b). weak_img 는 배율 x100
+    if key[0] == "weak_img":
+        return VARIANT_KINDS.index(key[0]), int(round(key[1] * 100)), 0
+    return VARIANT_KINDS.index(key[0]), key[1], key[2]
+
+
+def variant_key(kind, a, b):
+    name = VARIANT_KINDS[kind]
+    if name == "weak_img":
+        return (name, a / 100)
+    return (name, a, b)
+
+
+def capture(world, flags=0):
+    """World 의 지금 상태를 스냅숏 표 dict 로."""
+    players = {}
+    for player in world.players:
+        bits = (1 if player.double_bullet else 0) | (2 if player.bomb_bullet else 0)
+        players[player.index] = (player.rect.x, player.rect.y, max(player.health, 0), bits)
+    if world.game_over:
+        flags |= FLAG_GAME_OVER
+    enemies = {e.net_id: (e.rect.x, e.rect.y, *variant_code(e.variant)) for e in world.enemies}
+    powerups = {u.net_id: (u.rect.x, u.rect.y, POWERUP_TYPES.index(u.power_type)) for u in world.powerups}
+    proj = world.projectiles
+    n = proj.n
+    slots = np.flatnonzero(proj.alive[:n])
+    bullets = dict(zip(
+        proj.seq[slots].tolist(),
+        zip(proj.kind[slots].tolist(),
+            np.floor(proj.x[slots]).astype(np.int64).tolist(),
+            np.floor(proj.y[slots]).astype(np.int64).tolist()),
+    ))
+    return {
+        "g": {0: (world.tick, world.round_num, world.enemies_killed, world.total_kills, flags)},
+        "p": players,
+        "e": enemies,
+        "u": powerups,
+        "b": bullets,
+    }
+
+
+def empty_state():
+    return {name: {} for name in TABLES}
+
+
+# --- 델타 인코딩 ------------------------------------------------------------------
+
+def _zigzag(v):
+    return v * 2 if v >= 0 else -v * 2 - 1
+
+
+def _unzigzag(v):
+    return v >> 1 if not v & 1 else -((v + 1) >> 1)
+
+
+def encode_state(state, base, sounds=(), effects=()):
+    """state 를 base 와의 차이로 (base 가 빈 상태면 전체). 본문 bytes 를 돌려준다."""
+    out = bytearray()
+    for name in TABLES:
+        table = state[name]
+        old = base[name]
+        zero = (0,) * FIELDS[name]
+        removed = sorted(k for k in old if k not in table)
+        changed = sorted(k for k, v in table.items() if old.get(k) != v)
+        write_varint(out, len(removed))
+        prev = 0
+        for k in removed:
+            write_varint(out, k - prev)
+            prev = k
+        write_varint(out, len(changed))
+        prev = 0
+        for k in changed:
+            write_varint(out, k - prev)
+            prev = k
+            for a, b in zip(table[k], old.get(k, zero)):
+                write_varint(out, _zigzag(a - b))
+    write_varint(out, len(sounds))
+    out.extend(SOUND_NAMES.index(name) for name in sounds)
+    write_varint(out, len(effects))
+    for kind, x, y in effects:
+        out.append(EFFECT_NAMES.index(kind))
+        write_varint(out, _zigzag(int(x)))
+        write_varint(out, _zigzag(int(y)))
+    return bytes(out)
+
+
+def decode_state(data, base):
+    """encode_state 의 반대. (상태, 효과음 이름 목록, 효과 목록)."""
+    pos = 0
+    state = {}
+    for name in TABLES:
+        table = dict(base[name])
+        fields = FIELDS[name]
+        zero = (0,) * fields
+        count, pos = read_varint(data, pos)
+        k = 0
+        for _ in range(count):
+            gap, pos = read_varint(data, pos)
+            k += gap
+            del table[k]
+        count, pos = read_varint(data, pos)
+        k = 0
+        for _ in range(count):
+            gap, pos = read_varint(data, pos)
+            k += gap
+            old = table.get(k, zero)
+            values = []
+            for i in range(fields):
+                v, pos = read_varint(data, pos)
+                values.append(old[i] + _unzigzag(v))
+            table[k] = tuple(values)
+        state[name] = table
+    count, pos = read_varint(data, pos)
+    sounds = [SOUND_NAMES[i] for i in data[pos:pos + count]]
+    pos += count
+    count, pos = read_varint(data, pos)
+    effects = []
+    for _ in range(count):
+        kind = EFFECT_NAMES[data[pos]]
+        x, pos = read_varint(data, pos + 1)
+        y, pos = read_varint(data, pos)
+        effects.append((kind, _unzigzag(x), _unzigzag(y)))
+    return state, sounds, effects
+
+
+def pack_snapshot(snap_id, base_id, last_input, echo_time, hold_ms, body):
+    compressed = 0
+    if len(body) > 64:
+        packed = zlib.compress(body, 1)
+        if len(packed) < len(body):
+            body = packed
+            compressed = 1
+    return SNAPSHOT.pack(MSG_SNAPSHOT, snap_id, base_id, last_input, echo_time, min(hold_ms, 0xFFFF), compressed) + body
+
+
+def unpack_snapshot(data):
+    _, snap_id, base_id, last_input, echo_time, hold_ms, compressed = SNAPSHOT.unpack_from(data, 0)
+    body = data[SNAPSHOT.size:]
+    if compressed:
+        body = zlib.decompress(body)
+    return snap_id, base_id, last_input, echo_time, hold_ms, body
+
+
+def pack_input(ack, client_time, first_seq, bits):
+    return INPUT.pack(MSG_INPUT, ack, client_time, first_seq, len(bits)) + bytes(bits)
+
+
+def unpack_input(data):
+    _, ack, client_time, first_seq, count = INPUT.unpack_from(data, 0)
+    return ack, client_time, first_seq, data[INPUT.size:INPUT.size + count]
+
+
+# --- 통계 -------------------------------------------------------------------------
+
+class NetStats:
+    """주고받은 바이트/패킷 수, 초당 대역폭, 왕복 지연(RTT)."""
+
+    def __init__(self):
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.packets_in = 0
+        self.packets_out = 0
+        self.rate_in = 0.0     # 최근 1초 bytes/s
+        self.rate_out = 0.0
+        self.rtt_ms = None     # 지수 평균
+        self.rtt_min = None
+        self.full_snapshots = 0
+        self.delta_snapshots = 0
+        self.dropped = 0       # 기준 스냅숏이 없거나 순서가 늦어 버린 스냅숏
+        self._mark = (time.monotonic(), 0, 0)
+
+    def sent(self, size):
+        self.bytes_out += size
+        self.packets_out += 1
+
+    def received(self, size):
+        self.bytes_in += size
+        self.packets_in += 1
+
+    def add_rtt(self, ms):
+        self.rtt_ms = ms if self.rtt_ms is None else self.rtt_ms * 0.9 + ms * 0.1
+        self.rtt_min = ms if self.rtt_min is None else min(self.rtt_min, ms)
+
+    def update(self):
+        # 1초마다 초당 대역폭 갱신
+        now = time.monotonic()
+        t, bin_, bout = self._mark
+        if now - t >= 1.0:
+            self.rate_in = (self.bytes_in - bin_) / (now - t)
+            self.rate_out = (self.bytes_out - bout) / (now - t)
+            self._mark = (now, self.bytes_in, self.bytes_out)
+
+    def summary(self):
+        # RTT 는 클라이언트 쪽에서만 잰다 (서버 쪽 통계에는 없음)
+        rtt = f"rtt {self.rtt_ms:.1f} ms (min {self.rtt_min} ms), " if self.rtt_ms is not None else ""
+        return (f"in {self.rate_in / 1024:.1f} KiB/s, out {self.rate_out / 1024:.1f} KiB/s, {rtt}"
+                f"snapshots {self.full_snapshots} full / {self.delta_snapshots} delta, dropped {self.dropped}")
+
+    def as_dict(self):
+        return {
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "packets_in": self.packets_in,
+            "packets_out": self.packets_out,
+            "rate_in": self.rate_in,
+            "rate_out": self.rate_out,
+            "rtt_ms": self.rtt_ms,
+            "rtt_min_ms": self.rtt_min,
+            "full_snapshots": self.full_snapshots,
+            "delta_snapshots": self.delta_snapshots,
+            "dropped": self.dropped,
+        }
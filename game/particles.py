@@ -0,0 +1,215 @@
+"""폭발 / 피격 / 파워업 파티클.
+
+파티클은 스프라이트 대신 NumPy 배열(위치, 속도, 남은 수명, 색)의 한 행이다. 살아있는 파티클은
+항상 배열 앞쪽 [0, n) 에 모여 있고, 이동/수명 감소/화면 밖 제거는 프레임마다 벡터 연산 한 번,
+그리기는 미리 만든 작은 Surface(색 x 수명 단계) 를 쓴다. 화면 같은 32비트 Surface 에는 그 색을
+픽셀 배열에 단계별로 한꺼번에 쓰고, 그 밖에는 fblits(없으면 blits) 한 번으로 그린다.
+
+시각 효과일 뿐이라 시뮬레이션과 따로 돈다: World 는 world.effects 에 (종류, x, y) 만 남기고
+장면이 그걸 emit 한다. 난수도 World 시드가 아니라 자체 generator 를 써서 리플레이에 영향이 없다.
+"""
+import numpy as np
+import pygame
+
+from game.settings import SCREEN_WIDTH, SCREEN_HEIGHT, MAX_PARTICLES, EFFECT_NAMES
+
+PALETTE = (
+    (255, 245, 210),   # 0 흰 불꽃
+    (255, 200, 60),    # 1 노랑
+    (255, 120, 20),    # 2 주황
+    (200, 40, 20),     # 3 빨강
+    (255, 255, 255),   # 4 흰색
+    (120, 220, 255),   # 5 하늘색
+    (120, 255, 140),   # 6 연두
+)
+# 남은 수명 단계별 (크기 px, 밝기) — 수명이 줄수록 작고 어두워짐
+LEVELS = ((1, 0.45), (2, 0.65), (3, 0.85), (4, 1.0))
+
+# 종류: (개수, 최소/최대 속도 px/ms, 최소/최대 수명 ms, 색 번호들)
+EFFECTS = {
+    "hit": (6, 0.05, 0.20, 80, 200, (0, 4)),
+    "explosion": (36, 0.03, 0.22, 250, 650, (0, 1, 2, 3)),
+    "bomb": (140, 0.05, 0.35, 300, 900, (0, 1, 2, 3)),
+    "powerup": (28, 0.08, 0.12, 300, 500, (4, 5, 6)),
+}
+# 네트워크로는 settings.EFFECT_NAMES 번호로 보냄 — 효과를 더하거나 빼면 그 표도 (game/net.py)
+assert set(EFFECTS) == set(EFFECT_NAMES), "particles.EFFECTS 와 settings.EFFECT_NAMES 가 다름"
+GRAVITY = 0.0003      # px/ms^2 (아래로)
+DRAG = 0.997          # ms 당 속도 감쇠
+MARGIN = 8            # 화면 밖으로 이만큼 나가면 제거
+
+_surfaces = []
+
+
+def particle_surfaces():
+    # 색 x 수명 단계 Surface 목록 (인덱스 = 색 * len(LEVELS) + 단계)
+    if not _surfaces:
+        display = pygame.display.get_surface() is not None
+        for color in PALETTE:
+            for size, bright in LEVELS:
+                surf = pygame.Surface((size, size))
+                surf.fill(tuple(int(c * bright) for c in color))
+                _surfaces.append(surf.convert() if display else surf)
+    return _surfaces
+
+
+class ParticleSystem:
+    def __init__(self, capacity=MAX_PARTICLES, seed=None):
+        # 최대 개수만큼 한 번에 할당 (늘리지 않음 — 넘치면 버림)
+        self.capacity = capacity
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.vx = np.zeros(capacity, np.float32)
+        self.vy = np.zeros(capacity, np.float32)
+        self.life = np.zeros(capacity, np.float32)
+        self.max_life = np.ones(capacity, np.float32)
+        self.color = np.zeros(capacity, np.int16)
+        self.n = 0
+        self.limit = capacity   # 지금 허용하는 최대 개수 (품질 단계에 따라 낮춤, capacity 이하)
+        self.rng = np.random.default_rng(seed)
+        self.emitted = 0
+        self.dropped = 0      # 최대 개수에 걸려 버린 파티클
+        self.high_water = 0
+        self._half = np.array([size // 2 for size, _ in LEVELS], np.int32)
+        self._size = np.array([size for size, _ in LEVELS], np.int32)
+        self._mapped = None
+        self._mapped_key = None
+
+    def __len__(self):
+        return self.n
+
+    def _arrays(self):
+        return (self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.color)
+
+    def clear(self):
+        self.n = 0
+
+    def emit(self, kind, x, y, count=None):
+        total, lo, hi, life_lo, life_hi, colors = EFFECTS[kind]
+        if count is None:
+            count = total
+        k = max(0, min(count, self.limit - self.n))
+        self.dropped += count - k
+        if not k:
+            return 0
+        rng = self.rng
+        s = slice(self.n, self.n + k)
+        angle = rng.uniform(0, 2 * np.pi, k)
+        speed = rng.uniform(lo, hi, k)
+        self.x[s] = x
+        self.y[s] = y
+        self.vx[s] = np.cos(angle) * speed
+        self.vy[s] = np.sin(angle) * speed
+        self.life[s] = self.max_life[s] = rng.uniform(life_lo, life_hi, k)
+        self.color[s] = rng.choice(colors, k)
+        self.n += k
+        self.emitted += k
+        if self.n > self.high_water:
+            self.high_water = self.n
+        return k
+
+    def emit_all(self, effects):
+        for kind, x, y in effects:
+            self.emit(kind, x, y)
+
+    def update(self, dt):
+        n = self.n
+        if not n:
+            return
+        x, y, vx, vy, life = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.life[:n]
+        x += vx * dt
+        y += vy * dt
+        vx *= DRAG ** dt
+        vy *= DRAG ** dt
+        vy += GRAVITY * dt
+        life -= dt
+        keep = (life > 0) & (x > -MARGIN) & (x < SCREEN_WIDTH + MARGIN) & (y > -MARGIN) & (y < SCREEN_HEIGHT + MARGIN)
+        live = int(np.count_nonzero(keep))
+        if live < n:
+            # 살아있는 것만 앞으로 모으기
+            for arr in self._arrays():
+                arr[:live] = arr[:n][keep]
+            self.n = live
+
+    def draw(self, surface, doreturn=False):
+        # doreturn 이면 파티클 전체를 감싸는 사각형 하나를 돌려줌 (dirty rect)
+        n = self.n
+        if not n:
+            return []
+        levels = len(LEVELS)
+        level = np.minimum((self.life[:n] / self.max_life[:n] * levels).astype(np.int32), levels - 1)
+        half = self._half[level]
+        xs = self.x[:n].astype(np.int32) - half
+        ys = self.y[:n].astype(np.int32) - half
+        index = self.color[:n] * levels + level
+        if surface.get_bytesize() == 4:
+            self._draw_pixels(surface, xs, ys, index, level)
+        else:
+            self._draw_blits(surface, xs, ys, index)
+        if not doreturn:
+            return []
+        left, top = int(xs.min()), int(ys.min())
+        return [pygame.Rect(left, top, int(xs.max()) - left + LEVELS[-1][0], int(ys.max()) - top + LEVELS[-1][0])]
+
+    def _draw_blits(self, surface, xs, ys, index):
+        surfaces = particle_surfaces()
+        seq = zip(map(surfaces.__getitem__, index.tolist()), zip(xs.tolist(), ys.tolist()))
+        # pygame-ce 의 fblits 가 있으면 그쪽 (rect 목록을 만들지 않음), 없으면 blits
+        fblits = getattr(surface, "fblits", None)
+        if fblits is not None:
+            fblits(seq)
+        else:
+            surface.blits(seq, doreturn=False)
+
+    def _draw_pixels(self, surface, xs, ys, index, level):
+        # 32비트 Surface 에는 blit 대신 픽셀 배열에 직접 쓴다. 파티클이 몇 px 짜리라 blit 한 번의
+        # 고정 비용이 픽셀 복사보다 훨씬 크다. 단계별로 (size x size) 칸마다 한 번씩 모아서 씀.
+        colors = self._mapped_colors(surface)[index]
+        w, h = surface.get_size()
+        big = LEVELS[-1][0]
+        pixels = pygame.surfarray.pixels2d(surface)
+        inside = (xs >= 0) & (ys >= 0) & (xs <= w - big) & (ys <= h - big)
+        if pixels.T.flags.c_contiguous:
+            # 대부분(화면 안쪽)은 경계 검사 없이 1차원 인덱스로
+            flat = pixels.T.reshape(-1)
+            base = ys.astype(np.int64) * w + xs
+            for lv, (size, _) in enumerate(LEVELS):
+                sel = inside & (level == lv)
+                if not sel.any():
+                    continue
+                b, c = base[sel], colors[sel]
+                for dy in range(size):
+                    for dx in range(size):
+                        flat[b + (dy * w + dx)] = c
+            del flat
+            rest = ~inside
+        else:
+            rest = np.ones(len(xs), bool)
+        if rest.any():
+            # 화면 가장자리에 걸친 것: 칸마다 잘라서
+            xs, ys, colors, level = xs[rest], ys[rest], colors[rest], level[rest]
+            size = self._size[level]
+            for dy in range(big):
+                for dx in range(big):
+                    x = xs + dx
+                    y = ys + dy
+                    ok = (size > max(dx, dy)) & (x >= 0) & (x < w) & (y >= 0) & (y < h)
+                    pixels[x[ok], y[ok]] = colors[ok]
+        del pixels  # Surface 잠금 해제
+
+    def _mapped_colors(self, surface):
+        # 미리 만든 Surface 들의 색을 대상 Surface 픽셀 형식의 정수로 (형식이 바뀌면 다시)
+        key = (surface.get_bitsize(), surface.get_masks(), surface.get_shifts())
+        if self._mapped_key != key:
+            self._mapped = np.array([surface.map_rgb(s.get_at((0, 0))) for s in particle_surfaces()], np.uint32)
+            self._mapped_key = key
+        return self._mapped
+
+    def stats(self):
+        return {
+            "live": self.n,
+            "capacity": self.capacity,
+            "high_water": self.high_water,
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+        }
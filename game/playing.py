@@ -0,0 +1,308 @@
+"""게임 진행 장면: 한 대에서 하는 게임(PlayingScene, RoundTransitionScene)과 LAN 협동 플레이 화면.
+
+시뮬레이션(game.world)과 네트워크 모듈을 끌어오므로 App.start_game / main 에서 처음 쓸 때 import 한다.
+"""
+import pygame
+
+from game import net, startup
+from game.settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, SIM_HZ, RENDER_FPS, MAX_PARTICLES, LOW_PARTICLE_CAP,
+)
+from game.world import Inputs, EVENT_ROUND, EVENT_GAME_OVER, QUALITY_STATIC_BG, QUALITY_LOW_CAPS
+from game.text import render_text, HudText
+from game.render import draw_batched
+from game.timestep import FixedTimestep
+from game.enemy_variants import EnemyVariants
+from game.entities import powerup_image
+from game.projectiles import kind_surface
+from game.scenes import Scene, GameOverScene, FAREWELL_MS
+
+ROUND_MESSAGE_MS = 2000   # 라운드 메시지 표시 시간
+
+
+# 게임 진행: 고정 주기 시뮬레이션 + 보간 렌더링
+class PlayingScene(Scene):
+    fps = RENDER_FPS  # 화면 프레임 제한 (시뮬레이션 속도와는 무관)
+    startup_mark = "game frame"
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.world = app.world
+        self.renderer = app.renderer
+        # 시뮬레이션은 SIM_HZ 고정 주기로, 화면은 RENDER_FPS(0 이면 제한 없음)로 따로 돈다
+        self.timestep = FixedTimestep(SIM_HZ)
+        self.fire = 0  # 아직 틱에 넣지 않은 SPACE 누름 수 (틱마다 하나씩 발사)
+        self.frame_ms = 0
+        # HUD 문자열 (값이 바뀔 때만 다시 렌더링)
+        self.health_text = HudText("체력: {}", 30, WHITE)
+        self.kills_text = HudText("처치: {}", 30, WHITE)
+        self.quality_text = HudText("화질: {}", 22, WHITE)
+
+    def enter(self):
+        self.resume()
+
+    def resume(self):
+        # 메뉴/메시지처럼 멈춰 있던 시간은 시뮬레이션에 넣지 않음
+        self.timestep.reset()
+        self.renderer.invalidate()
+        self.frame_ms = 0
+        if self.app.governor is not None:
+            self.app.governor.reset()
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.app.end_game()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                self.fire += 1  # 누를 때마다 한 발: 틱마다 하나씩 (틱보다 많이 눌렸으면 다음 틱으로 넘김)
+
+    def update(self, frame_ms):
+        world = self.world
+        timestep = self.timestep
+        self.frame_ms = frame_ms
+        recorder = self.app.recorder
+        sfx = self.app.sfx
+        particles = self.app.particles
+        sfx.begin_frame()
+        quality = self.govern()
+        keys = pygame.key.get_pressed()
+        events = []
+        for _ in range(timestep.advance(frame_ms)):
+            inputs = Inputs(keys[pygame.K_LEFT], keys[pygame.K_RIGHT], self.fire > 0, quality)
+            if recorder is not None:
+                recorder.record(inputs)
+            events = world.step(inputs, timestep.step_ms)
+            sfx.play_all(world.sounds)
+            particles.emit_all(world.effects)
+            if self.fire:
+                self.fire -= 1
+            if events:
+                break
+
+        if EVENT_GAME_OVER in events:
+            # 게임 오버 메뉴: 다시하기면 리셋 후 계속, 아니면 종료
+            self.app.save_replay()
+            self.app.scenes.push(GameOverScene(self.app))
+        elif EVENT_ROUND in events:
+            self.app.scenes.push(RoundTransitionScene(self.app, self))
+
+    def govern(self):
+        # 지난 프레임 작업 시간(프레임 제한으로 쉰 시간 제외)으로 품질 단계 조절. 현재 단계를 돌려줌
+        governor = self.app.governor
+        if governor is None:
+            return 0
+        tier = governor.observe(self.app.clock.get_rawtime())
+        if tier is not None:
+            self.renderer.set_scrolling(tier < QUALITY_STATIC_BG)
+            self.app.particles.limit = LOW_PARTICLE_CAP if tier >= QUALITY_LOW_CAPS else MAX_PARTICLES
+        return governor.tier
+
+    def render(self, frame_ms):
+        # 이번 프레임 그리기 (화면에 올리지는 않음)
+        # 배경 띠에서 한 번 blit (배경이 멈춰 있으면 지난 프레임 영역만 지움)
+        # 스프라이트/탄은 직전 틱과 현재 틱 사이를 누산기 비율(alpha)만큼 보간해서 그림
+        world = self.world
+        renderer = self.renderer
+        screen = self.app.screen
+        prof = self.app.active_profiler
+        alpha = self.timestep.alpha
+        renderer.scroll(frame_ms)
+        renderer.begin()
+        if prof is not None:
+            prof.lap("scroll")
+
+        sprite_rects = draw_batched(screen, world.all_sprites, world.prev_positions, alpha, renderer.tracking)
+        if prof is not None:
+            prof.lap("draw_sprites")
+        drawn = world.projectiles.draw(screen, renderer.tracking, alpha)
+        if prof is not None:
+            prof.lap("draw_projectiles")
+        particles = self.app.particles
+        particles.update(frame_ms)
+        drawn += particles.draw(screen, renderer.tracking)
+        if prof is not None:
+            prof.lap("particles")
+        hud = [
+            screen.blit(self.health_text.render(world.player.health), (10, 10)),
+            screen.blit(self.kills_text.render(world.enemies_killed), (SCREEN_WIDTH - 140, 10)),
+        ]
+        governor = self.app.governor
+        if governor is not None and governor.tier:
+            hud.append(screen.blit(self.quality_text.render(governor.name), (10, SCREEN_HEIGHT - 30)))
+        if prof is not None:
+            prof.lap("hud")
+            hud.append(self.app.overlay.draw(screen))
+            prof.lap("overlay")
+        if renderer.tracking:
+            renderer.mark(sprite_rects)
+            renderer.mark(drawn)
+            renderer.mark(hud)
+
+    def draw(self):
+        self.render(self.frame_ms)
+        # 바뀐 영역만 (배경이 움직였으면 전체) 화면에 올리기
+        self.renderer.present()
+
+
+# 라운드 메시지 (예전의 2초 wait 대신 시간이 정해진 장면)
+class RoundTransitionScene(Scene):
+    startup_mark = "game frame"  # 게임 시작 직후 첫 화면은 라운드 메시지
+
+    def __init__(self, app, playing):
+        super().__init__(app)
+        self.playing = playing
+        self.elapsed = 0
+        self.shown = False
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.app.end_game()
+
+    def update(self, frame_ms):
+        self.elapsed += frame_ms
+        if self.elapsed >= ROUND_MESSAGE_MS:
+            self.app.scenes.pop()
+            return
+        # 한가한 프레임에 다음 라운드에 나올 적 이미지 변형을 미리 만들어 둠
+        self.app.world.enemy_variants.warm()
+
+    def draw(self):
+        if self.shown:
+            return  # 화면이 바뀌지 않으므로 다시 올릴 것 없음
+        self.shown = True
+        screen = self.app.screen
+        self.playing.render(0)
+        text = render_text(f"라운드 {self.app.world.round_num}", 74, WHITE)
+        screen.blit(
+            text,
+            (
+                SCREEN_WIDTH // 2 - text.get_width() // 2,
+                SCREEN_HEIGHT // 2 - text.get_height() // 2,
+            ),
+        )
+        pygame.display.flip()
+
+
+# LAN 협동 플레이 클라이언트 화면 (python shooting_game.py --connect 호스트).
+# 시뮬레이션은 서버(game.server)가 돌리고, 여기서는 틱마다 입력을 보내고 받은 스냅숏을 그린다.
+class NetPlayingScene(Scene):
+    fps = RENDER_FPS
+    startup_mark = "game frame"
+    PARTNER_TINT = (140, 200, 255)
+
+    def __init__(self, app, client):
+        super().__init__(app)
+        self.client = client
+        self.timestep = FixedTimestep(SIM_HZ)
+        self.fire = 0  # 아직 보내지 않은 SPACE 누름 수
+        self.frame_ms = 0
+        self.closed_ms = 0
+        self.images = None
+        self.health_text = HudText("체력: {}", 30, WHITE)
+        self.kills_text = HudText("처치: {}", 30, WHITE)
+        self.net_text = HudText("{}", 18, WHITE)
+        self.status_text = HudText("{}", 36, WHITE)
+
+    def enter(self):
+        # 에셋 준비 (메뉴 없이 바로 들어오므로 여기서 기다림)
+        app = self.app
+        images = app.init_gameplay()
+        self.images = images
+        self.variants = EnemyVariants(images.get("weak_enemy"), prebuilt=images.get("enemy_variants"))
+        self.player_image = images["player"]
+        self.partner_image = images["player"].copy()
+        self.partner_image.fill(self.PARTNER_TINT, special_flags=pygame.BLEND_RGB_MULT)
+        self.renderer = app.renderer
+        startup.mark("game setup")
+        self.client.player_width = self.player_image.get_width()
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.client.close()
+            self.app.scenes.clear()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            self.fire += 1
+
+    def update(self, frame_ms):
+        client = self.client
+        self.frame_ms = frame_ms
+        client.poll()
+        keys = pygame.key.get_pressed()
+        for _ in range(self.timestep.advance(frame_ms)):
+            if client.connected:
+                client.send_input(Inputs(keys[pygame.K_LEFT], keys[pygame.K_RIGHT], self.fire > 0))
+                if self.fire:
+                    self.fire -= 1
+        sounds, effects = client.take_events()
+        sfx = self.app.sfx
+        sfx.begin_frame()
+        sfx.play_all(sounds)
+        self.app.particles.emit_all(effects)
+        if client.closed:
+            # 연결이 끊기면 잠깐 알리고 종료
+            self.closed_ms += frame_ms
+            if self.closed_ms >= FAREWELL_MS:
+                self.app.scenes.clear()
+
+    def enemy_image(self, kind, a, b):
+        key = net.variant_key(kind, a, b)
+        if key[0] == "weak_img" and self.variants.weak_enemy_img is None:
+            key = ("weak", 32, 32)  # 서버에만 적 이미지 파일이 있을 때
+        return self.variants.get(key)[0]
+
+    def status(self):
+        client = self.client
+        if client.refused:
+            return "서버에 자리가 없습니다"
+        if client.closed:
+            return "연결이 끊겼습니다"
+        if not client.connected:
+            return "서버에 연결 중..."
+        if client.flags & net.FLAG_WAITING:
+            return "다른 플레이어를 기다리는 중..."
+        if client.flags & net.FLAG_GAME_OVER:
+            return "게임 오버 - 곧 다시 시작합니다"
+        return None
+
+    def draw(self):
+        client = self.client
+        state = client.state
+        renderer = self.renderer
+        screen = self.app.screen
+        renderer.scroll(self.frame_ms)
+        renderer.begin()
+
+        seq = [(self.enemy_image(kind, a, b), (x, y)) for x, y, kind, a, b in state["e"].values()]
+        seq += [(powerup_image(net.POWERUP_TYPES[t]), (x, y)) for x, y, t in state["u"].values()]
+        for index, (x, y, health, _) in state["p"].items():
+            if health <= 0:
+                continue
+            if index == client.index:
+                seq.append((self.player_image, (int(client.predicted_x()), y)))
+            else:
+                seq.append((self.partner_image, (x, y)))
+        seq += [(kind_surface(kind), (x, y)) for kind, x, y in state["b"].values()]
+        drawn = screen.blits(seq, doreturn=renderer.tracking) or []
+        particles = self.app.particles
+        particles.update(self.frame_ms)
+        drawn += particles.draw(screen, renderer.tracking)
+
+        me = client.me
+        g = state["g"].get(0)
+        stats = client.stats
+        rtt = f"{stats.rtt_ms:.0f} ms" if stats.rtt_ms is not None else "-"
+        line = (f"P{(client.index or 0) + 1}  ping {rtt}  in {stats.rate_in / 1024:.1f} KiB/s"
+                f"  out {stats.rate_out / 1024:.1f} KiB/s")
+        hud = [
+            screen.blit(self.health_text.render(me[2] if me else "-"), (10, 10)),
+            screen.blit(self.kills_text.render(g[2] if g else 0), (SCREEN_WIDTH - 140, 10)),
+            screen.blit(self.net_text.render(line), (10, SCREEN_HEIGHT - 26)),
+        ]
+        status = self.status()
+        if status:
+            text = self.status_text.render(status)
+            hud.append(screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, SCREEN_HEIGHT // 2)))
+        if renderer.tracking:
+            renderer.mark(drawn)
+            renderer.mark(hud)
+        renderer.present()
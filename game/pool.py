@@ -0,0 +1,41 @@
+class SpritePool:
+    """kill 된 스프라이트를 버리지 않고 다시 쓰는 풀.
+
+    factory(*args) 로 만든 스프라이트는 reset(*args) 로 재초기화할 수 있어야 하고,
+    kill() 될 때 pool.release(self) 를 호출해야 한다 (PowerUp 참고).
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self._free = []
+        self.in_use = 0
+        self.high_water = 0   # 동시에 사용된 최대 개수
+        self.hits = 0         # 재사용으로 처리된 acquire
+        self.misses = 0       # 새로 만들어야 했던 acquire
+
+    def acquire(self, *args):
+        if self._free:
+            sprite = self._free.pop()
+            sprite.reset(*args)
+            self.hits += 1
+        else:
+            sprite = self.factory(*args)
+            sprite.pool = self
+            self.misses += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return sprite
+
+    def release(self, sprite):
+        self.in_use -= 1
+        self._free.append(sprite)
+
+    def stats(self):
+        return {
+            "in_use": self.in_use,
+            "free": len(self._free),
+            "high_water": self.high_water,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,167 @@
+"""프레임 단계별 시간 측정 (게임 중 F3: 켜기/끄기 + 오버레이, F4: 내보내기).
+
+lap(phase) 는 직전 lap 이후 흐른 시간을 phase 에 더한다. 한 프레임에 같은 단계가 여러 번
+(틱이 여러 번 돌 때) 나오면 합산된다. 측정값은 최근 capacity 프레임만 ring buffer 에 남는다.
+꺼져 있을 때는 호출하는 쪽이 profiler 를 None 으로 들고 있어 비용이 `is not None` 검사뿐이다.
+"""
+import csv
+import json
+import time
+
+import numpy as np
+import pygame
+
+from game.text import get_korean_font
+
+PHASES = (
+    "events",                 # 이벤트 큐 처리
+    "input",                  # 입력 적용 / 발사
+    "update_sprites",         # all_sprites.update()
+    "update_projectiles",
+    "update_formations",
+    "enemy_fire",
+    "collide_bullets",
+    "collide_bombs",
+    "collide_player",
+    "collide_powerups",
+    "collide_enemy_bullets",
+    "scene_update",           # 그 밖의 장면 update
+    "scroll",                 # 배경 스크롤 + 배경 blit
+    "draw_sprites",           # all_sprites 그리기
+    "draw_projectiles",
+    "particles",              # 파티클 이동 + 그리기
+    "hud",
+    "overlay",
+    "present",                # flip / display.update (메뉴 화면은 그리기 전체)
+)
+COUNTERS = ("sprites", "enemies", "projectiles", "powerups")
+
+TRACE_FILE = "profile_trace.json"
+CSV_FILE = "profile_frames.csv"
+
+
+class FrameProfiler:
+    def __init__(self, capacity=600, phases=PHASES):
+        self.capacity = capacity
+        self.phases = tuple(phases)
+        self._col = {name: i for i, name in enumerate(self.phases)}
+        self.ms = np.zeros((capacity, len(self.phases)))
+        self.start_us = np.full((capacity, len(self.phases)), -1.0)  # 단계가 처음 시작한 시각
+        self.frame_us = np.zeros(capacity)
+        self.counts = np.zeros((capacity, len(COUNTERS)), np.int64)
+        self.frames = 0    # 지금까지 기록한 프레임 수 (ring buffer 위치 = frames % capacity)
+        self.enabled = False
+        self._origin = time.perf_counter_ns()
+        self._row = 0
+        self._last = self._origin
+
+    def begin_frame(self):
+        row = self.frames % self.capacity
+        self._row = row
+        self.ms[row] = 0.0
+        self.start_us[row] = -1.0
+        now = time.perf_counter_ns()
+        self.frame_us[row] = (now - self._origin) / 1000
+        self._last = now
+
+    def lap(self, phase):
+        now = time.perf_counter_ns()
+        row = self._row
+        col = self._col[phase]
+        self.ms[row, col] += (now - self._last) / 1e6
+        if self.start_us[row, col] < 0:
+            self.start_us[row, col] = (self._last - self._origin) / 1000
+        self._last = now
+
+    def end_frame(self, world=None):
+        if world is not None:
+            self.counts[self._row] = (
+                len(world.all_sprites), len(world.enemies), len(world.projectiles), len(world.powerups),
+            )
+        self.frames += 1
+
+    def _recent_rows(self, n=None):
+        # 오래된 것부터 최근 n 프레임의 행 번호
+        stored = min(self.frames, self.capacity)
+        if n is None or n > stored:
+            n = stored
+        return [(self.frames - n + i) % self.capacity for i in range(n)]
+
+    def averages(self, n=60):
+        rows = self._recent_rows(n)
+        if not rows:
+            return {}, {}
+        ms = self.ms[rows].mean(axis=0)
+        counts = self.counts[rows[-1]]
+        return dict(zip(self.phases, ms.tolist())), dict(zip(COUNTERS, counts.tolist()))
+
+    def export_csv(self, path=CSV_FILE):
+        rows = self._recent_rows()
+        first = self.frames - len(rows)
+        with open(path, "w", newline="") as fp:
+            writer = csv.writer(fp)
+            writer.writerow(["frame", "start_ms", "total_ms", *self.phases, *COUNTERS])
+            for i, row in enumerate(rows):
+                ms = self.ms[row]
+                writer.writerow([
+                    first + i, round(self.frame_us[row] / 1000, 3), round(float(ms.sum()), 4),
+                    *(round(v, 4) for v in ms.tolist()), *self.counts[row].tolist(),
+                ])
+        return path
+
+    def export_trace(self, path=TRACE_FILE):
+        # Chrome trace-event 형식 (chrome://tracing, Perfetto 에서 열기)
+        events = []
+        for row in self._recent_rows():
+            for col, phase in enumerate(self.phases):
+                dur = self.ms[row, col]
+                if dur <= 0:
+                    continue
+                events.append({
+                    "name": phase, "cat": "frame", "ph": "X", "pid": 1, "tid": 1,
+                    "ts": round(float(self.start_us[row, col]), 3), "dur": round(float(dur) * 1000, 3),
+                })
+            events.append({
+                "name": "entities", "ph": "C", "pid": 1, "ts": round(float(self.frame_us[row]), 3),
+                "args": dict(zip(COUNTERS, self.counts[row].tolist())),
+            })
+        with open(path, "w") as fp:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fp)
+        return path
+
+    def export(self):
+        return self.export_trace(), self.export_csv()
+
+
+class ProfilerOverlay:
+    """단계별 평균 ms / 엔티티 수를 화면 왼쪽에 표시. 글자는 refresh 프레임마다 한 번만 다시 만든다."""
+
+    def __init__(self, profiler, refresh=15, size=16):
+        self.profiler = profiler
+        self.refresh = refresh
+        self.font = get_korean_font(size)
+        self._surface = None
+        self._built_at = -refresh
+
+    def _build(self):
+        phases, counts = self.profiler.averages()
+        lines = [f"frame {sum(phases.values()):6.2f} ms"]
+        lines += [f"{name:22s}{ms:6.2f}" for name, ms in phases.items() if ms >= 0.005]
+        lines += [" ".join(f"{k} {v}" for k, v in counts.items())]
+        rendered = [self.font.render(line, True, (255, 255, 0)) for line in lines]
+        w = max(s.get_width() for s in rendered) + 8
+        h = sum(s.get_height() for s in rendered) + 8
+        surface = pygame.Surface((w, h), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 160))
+        y = 4
+        for s in rendered:
+            surface.blit(s, (4, y))
+            y += s.get_height()
+        return surface
+
+    def draw(self, surface, pos=(10, 50)):
+        frames = self.profiler.frames
+        if self._surface is None or frames - self._built_at >= self.refresh:
+            self._surface = self._build()
+            self._built_at = frames
+        return surface.blit(self._surface, pos)
@@ -0,0 +1,302 @@
+from itertools import repeat
+
+import numpy as np
+import pygame
+
+from game.hitbox import RECT, overlap, overlap_rects, coarse
+from game.settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, RED, BLUE, BULLET_WIDTH, BULLET_HEIGHT,
+)
+
+# 탄 종류
+BULLET = 0        # 플레이어 총알
+BOMB = 1          # 폭탄 (폭발 반경 피해)
+ENEMY_BULLET = 2  # 적 총알
+
+# 종류별 크기 / 색. 모두 꽉 찬 사각형이라 히트박스도 모두 rect 그대로 (마스크는 만들지 않음).
+# (격자 충돌 후보 계산은 크기가 격자 한 칸(64px) 이하라고 가정)
+KIND_SIZES = {
+    BULLET: (BULLET_WIDTH, BULLET_HEIGHT),
+    BOMB: (BULLET_WIDTH * 2, BULLET_HEIGHT * 2),
+    ENEMY_BULLET: (6, 10),
+}
+KIND_COLORS = {
+    BULLET: RED,
+    BOMB: BLUE,
+    ENEMY_BULLET: (255, 200, 0),
+}
+
+_surfaces = {}
+
+
+def kind_surface(kind):
+    surf = _surfaces.get(kind)
+    if surf is None:
+        surf = pygame.Surface(KIND_SIZES[kind])
+        surf.fill(KIND_COLORS[kind])
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        _surfaces[kind] = surf
+    return surf
+
+
+class Projectiles:
+    """총알/폭탄/적 총알을 Sprite 대신 NumPy 배열(struct-of-arrays) 한 벌로 관리한다.
+
+    각 탄은 슬롯 번호로 가리킨다. 위치(x, y = 왼쪽 위, float), 속도, 종류, 생존 여부,
+    생성 순번을 배열로 두고 이동/화면 밖 제거는 프레임마다 벡터 연산 한 번으로 처리한다.
+    죽은 슬롯은 free 리스트로 재사용한다.
+    """
+
+    def __init__(self, capacity=256):
+        self._alloc(capacity)
+        # 풀 통계 (clear 해도 유지)
+        self.high_water = 0   # 동시에 살아있던 최대 탄 수
+        self.hits = 0         # 빈 슬롯을 재사용한 spawn
+        self.misses = 0       # 새 슬롯을 써야 했던 spawn
+        self.grows = 0        # 배열을 두 배로 늘린 횟수
+        self.clear()
+
+    def _alloc(self, capacity):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, np.float64)
+        self.y = np.zeros(capacity, np.float64)
+        self.vx = np.zeros(capacity, np.float64)
+        self.vy = np.zeros(capacity, np.float64)
+        self.kind = np.zeros(capacity, np.int8)
+        self.w = np.zeros(capacity, np.int32)
+        self.h = np.zeros(capacity, np.int32)
+        self.alive = np.zeros(capacity, bool)
+        self.seq = np.zeros(capacity, np.int64)
+        # 직전 틱 위치 (렌더 보간용)
+        self.px = np.zeros(capacity, np.float64)
+        self.py = np.zeros(capacity, np.float64)
+
+    def _grow(self):
+        self.grows += 1
+        old = self._arrays()
+        self._alloc(self.capacity * 2)
+        for dst, src in zip(self._arrays(), old):
+            dst[:len(src)] = src
+
+    def _arrays(self):
+        return (self.x, self.y, self.vx, self.vy, self.kind, self.w, self.h, self.alive, self.seq, self.px, self.py)
+
+    def clear(self):
+        self.alive[:] = False
+        self.n = 0          # 사용 중인 슬롯 범위 [0, n)
+        self.free = []      # n 아래의 빈 슬롯 (LIFO 재사용)
+        self._next_seq = 0
+        self.counts = {kind: 0 for kind in KIND_SIZES}
+
+    # --- 생성 / 제거 ----------------------------------------------------------
+
+    def spawn(self, kind, left, top, vx, vy):
+        if self.free:
+            slot = self.free.pop()
+            self.hits += 1
+        else:
+            if self.n == self.capacity:
+                self._grow()
+            slot = self.n
+            self.n += 1
+            self.misses += 1
+        self.x[slot] = self.px[slot] = left
+        self.y[slot] = self.py[slot] = top
+        self.vx[slot] = vx
+        self.vy[slot] = vy
+        self.kind[slot] = kind
+        self.w[slot], self.h[slot] = KIND_SIZES[kind]
+        self.alive[slot] = True
+        self.seq[slot] = self._next_seq
+        self._next_seq += 1
+        self.counts[kind] += 1
+        live = self.count()
+        if live > self.high_water:
+            self.high_water = live
+        return slot
+
+    def spawn_at(self, kind, centerx, bottom, vx, vy):
+        # Bullet/Bomb 처럼 (centerx, bottom) 기준으로 놓기
+        w, h = KIND_SIZES[kind]
+        return self.spawn(kind, centerx - w // 2, bottom - h, vx, vy)
+
+    def spawn_centered(self, kind, cx, cy, vx, vy):
+        w, h = KIND_SIZES[kind]
+        return self.spawn(kind, cx - w // 2, cy - h // 2, vx, vy)
+
+    def kill(self, slot):
+        if self.alive[slot]:
+            self.alive[slot] = False
+            self.counts[int(self.kind[slot])] -= 1
+            self.free.append(slot)
+
+    def count(self, kind=None):
+        if kind is None:
+            return sum(self.counts.values())
+        return self.counts[kind]
+
+    def stats(self):
+        return {
+            "in_use": self.count(),
+            "capacity": self.capacity,
+            "high_water": self.high_water,
+            "hits": self.hits,
+            "misses": self.misses,
+            "grows": self.grows,
+        }
+
+    def __len__(self):
+        return self.count()
+
+    def centers(self, kind):
+        # 살아있는 kind 탄들의 중심 좌표 배열 (cx, cy)
+        slots = self._select(kind)
+        return self.x[slots] + self.w[slots] / 2, self.y[slots] + self.h[slots] / 2
+
+    def rect(self, slot):
+        return pygame.Rect(int(np.floor(self.x[slot])), int(np.floor(self.y[slot])),
+                           int(self.w[slot]), int(self.h[slot]))
+
+    # --- 프레임 처리 ----------------------------------------------------------
+
+    def update(self, scale=1.0):
+        # 속도는 FRAME_MS 한 틱 기준 — scale 은 이번 틱 길이의 배율
+        n = self.n
+        if not n:
+            return
+        alive = self.alive[:n]
+        x = self.x[:n]
+        y = self.y[:n]
+        self.px[:n] = x
+        self.py[:n] = y
+        if scale == 1.0:
+            x += self.vx[:n]
+            y += self.vy[:n]
+        else:
+            x += self.vx[:n] * scale
+            y += self.vy[:n] * scale
+
+        # 화면 밖으로 완전히 나간 탄 제거
+        kind = self.kind[:n]
+        w = self.w[:n]
+        h = self.h[:n]
+        gone = alive & ((y + h < 0) | (y > SCREEN_HEIGHT) | (x > SCREEN_WIDTH) | (x + w < 0))
+        if gone.any():
+            slots = np.flatnonzero(gone)
+            alive[slots] = False
+            for k in KIND_SIZES:
+                self.counts[k] -= int(np.count_nonzero(kind[slots] == k))
+            self.free.extend(slots.tolist())
+        if not alive.any():
+            # 전부 사라졌으면 범위를 0 으로 되돌려 이후 연산 길이를 줄임
+            self.n = 0
+            self.free.clear()
+
+    def _select(self, kind):
+        n = self.n
+        return np.flatnonzero(self.alive[:n] & (self.kind[:n] == kind))
+
+    def _by_seq(self, slots):
+        if len(slots) > 1:
+            slots = slots[np.argsort(self.seq[slots], kind="stable")]
+        return slots
+
+    def collide_grid(self, kind, grid, dokill, precise, coarse_ratio):
+        """kind 탄과 격자(SpatialHash)에 들어있는 스프라이트의 충돌.
+
+        pygame.sprite.groupcollide(탄, 그룹, dokill, False, hitbox.collide) 와 같은 의미로
+        {슬롯: [스프라이트, ...]} 를 탄 생성 순서대로 돌려준다. 격자에서 빈 칸에만 있는
+        탄은 벡터 연산 단계에서 걸러지므로 narrowphase(스프라이트 히트박스 vs 탄 사각형)는 후보에만 돈다.
+        precise=False 면 마스크 히트박스를 coarse_ratio 로 줄인 사각형으로 본다.
+        """
+        slots = self._select(kind)
+        if not slots.size:
+            return {}
+        cs = grid.cell_size
+        cols = grid.cols
+        occupied = np.fromiter((bool(c) for c in grid.cells), bool, len(grid.cells))
+        if not occupied.any():
+            return {}
+        w, h = KIND_SIZES[kind]
+        left = np.floor(self.x[slots]).astype(np.int64)
+        top = np.floor(self.y[slots]).astype(np.int64)
+        x0 = np.clip(left // cs, 0, cols - 1)
+        x1 = np.clip((left + w - 1) // cs, 0, cols - 1)
+        y0 = np.clip(top // cs, 0, grid.rows - 1) * cols
+        y1 = np.clip((top + h - 1) // cs, 0, grid.rows - 1) * cols
+        near = occupied[y0 + x0] | occupied[y0 + x1] | occupied[y1 + x0] | occupied[y1 + x1]
+        if not near.any():
+            return {}
+
+        crashed = {}
+        cand = np.flatnonzero(near)
+        order = self._by_seq(slots[cand])
+        pos = dict(zip(slots[cand].tolist(), zip(left[cand].tolist(), top[cand].tolist())))
+        for slot in order.tolist():
+            rect = pygame.Rect(pos[slot], (w, h))
+
+            def hit(s):
+                shape = s.hitbox if precise else coarse(s.hitbox, coarse_ratio)
+                return overlap(shape, s.rect, s.mask, RECT, rect, None)
+
+            hits = grid.collide_rect(rect, hit)
+            if hits:
+                crashed[slot] = hits
+                if dokill:
+                    self.kill(slot)
+        return crashed
+
+    def collide_sprite(self, sprite, kind, dokill, precise, coarse_ratio):
+        # pygame.sprite.spritecollide(sprite, 탄, dokill, hitbox.collide) 에 해당 — 맞은 슬롯 목록
+        # precise=False 면 sprite 의 마스크 히트박스를 coarse_ratio 로 줄인 사각형으로 본다
+        slots = self._select(kind)
+        if not slots.size:
+            return []
+        w, h = KIND_SIZES[kind]
+        r = sprite.rect
+        shape = sprite.hitbox if precise else coarse(sprite.hitbox, coarse_ratio)
+        smask = sprite.mask
+        left = np.floor(self.x[slots])
+        top = np.floor(self.y[slots])
+        near = (left < r.right) & (left + w > r.left) & (top < r.bottom) & (top + h > r.top)
+        if not near.any():
+            return []
+        slots = slots[near]
+        hit = overlap_rects(shape, r, smask, left[near].astype(np.int64), top[near].astype(np.int64), w, h)
+        hits = []
+        for slot in self._by_seq(slots[hit]).tolist():
+            hits.append(slot)
+            if dokill:
+                self.kill(slot)
+        return hits
+
+    def draw(self, surface, doreturn=False, alpha=1.0):
+        # 종류별 공유 Surface 로 blits 한 번씩. doreturn 이면 그린 영역(dirty rect) 목록을 돌려줌
+        # alpha < 1 이면 직전 틱 위치와 현재 위치 사이를 보간해서 그림
+        rects = []
+        n = self.n
+        if not n:
+            return rects
+        fblits = getattr(surface, "fblits", None)
+        for kind in KIND_SIZES:
+            slots = self._select(kind)
+            if not slots.size:
+                continue
+            x = self.x[slots]
+            y = self.y[slots]
+            if alpha < 1.0:
+                px = self.px[slots]
+                py = self.py[slots]
+                x = px + (x - px) * alpha
+                y = py + (y - py) * alpha
+            xs = np.floor(x).astype(np.int64).tolist()
+            ys = np.floor(y).astype(np.int64).tolist()
+            if doreturn:
+                rects.extend(surface.blits(zip(repeat(kind_surface(kind)), zip(xs, ys))))
+            elif fblits is not None:
+                # pygame-ce: 같은 Surface 를 여러 위치에 (Surface, [위치...]) 한 항목으로
+                fblits([(kind_surface(kind), list(zip(xs, ys)))])
+            else:
+                surface.blits(zip(repeat(kind_surface(kind)), zip(xs, ys)), doreturn=False)
+        return rects
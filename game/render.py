@@ -0,0 +1,243 @@
+"""화면 그리기.
+
+StaticScreen   배경이 움직이지 않는 화면(메뉴, 게임 오버)용 dirty-rect 모드 (LayeredDirty)
+ScrollRenderer 게임 중 화면. 2배 높이로 미리 이어 붙인 배경 띠에서 한 번에 잘라 그린다
+draw_batched   스프라이트를 층/이미지별로 묶고 화면 밖은 빼서 blits 한 번에 그린다
+"""
+from itertools import groupby
+from operator import attrgetter, itemgetter
+
+import pygame
+
+from game.settings import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, BG_SCROLL_SPEED, FRAME_MS
+
+# dirty rect 가 이보다 많으면 하나씩 지우고 올리는 것보다 화면 전체를 한 번 올리는 게 싸다
+MAX_DIRTY_RECTS = 96
+
+# 한 틱에 이보다 많이 움직인 스프라이트(화면 위로 재배치 등)는 보간하지 않고 현재 위치에 그림
+SNAP_DISTANCE = 64
+
+
+def make_strip(background, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+    # 배경 두 장을 위아래로 붙인 띠. 스크롤 위치가 어디든 blit 한 번으로 화면을 채울 수 있다
+    w, h = size
+    strip = pygame.Surface((w, h * 2))
+    strip.fill(BLACK)
+    if background is not None:
+        strip.blit(background, (0, 0))
+        strip.blit(background, (0, h))
+    if pygame.display.get_surface() is not None:
+        strip = strip.convert()
+    return strip
+
+
+_cached_batch_key = attrgetter("batch_key")
+
+
+def _batch_key(sprite):
+    # batch_key 가 없는 스프라이트용 (느림)
+    return (getattr(sprite, "draw_layer", 0), id(sprite.image))
+
+
+def draw_batched(surface, group, prev_positions=None, alpha=1.0, doreturn=True):
+    """group 의 스프라이트를 층(draw_layer) -> 같은 이미지끼리 묶어서 blits 한 번으로 그린다.
+
+    정렬 키는 스프라이트의 batch_key = (층, id(image)) 속성 (C 로 정렬되도록 미리 계산해 둠).
+
+    화면(surface) 밖에 있는 스프라이트는 넘기지 않는다. prev_positions({sprite: (x, y)})가 있으면
+    직전 틱 위치와 현재 위치 사이 alpha 지점에 그린다 (직전 위치가 없거나 순간이동한 스프라이트는 현재 위치).
+    doreturn 이면 그린 영역 목록을 돌려준다.
+    """
+    visible = surface.get_rect().inflate(2 * SNAP_DISTANCE, 2 * SNAP_DISTANCE).colliderect
+    sprites = [s for s in group.sprites() if visible(s.rect)]
+    try:
+        sprites.sort(key=_cached_batch_key)
+    except AttributeError:
+        sprites.sort(key=_batch_key)
+    if alpha >= 1.0 or not prev_positions:
+        items = [(s.image, s.rect) for s in sprites]
+    else:
+        items = []
+        append = items.append
+        get_prev = prev_positions.get
+        snap = SNAP_DISTANCE
+        for s in sprites:
+            r = s.rect
+            prev = get_prev(s)
+            if prev is None:
+                append((s.image, r))
+                continue
+            px, py = prev
+            dx = r.x - px
+            dy = r.y - py
+            if -snap < dx < snap and -snap < dy < snap:
+                append((s.image, (int(px + dx * alpha), int(py + dy * alpha))))
+            else:
+                append((s.image, r))
+    if doreturn:
+        return surface.blits(items)
+    # pygame-ce 의 fblits: rect 목록을 만들지 않고, 같은 이미지는 (image, [위치...]) 한 항목으로
+    fblits = getattr(surface, "fblits", None)
+    if fblits is not None:
+        fblits([(image, [pos for _, pos in run]) for image, run in groupby(items, itemgetter(0))])
+    else:
+        surface.blits(items, doreturn=False)
+    return []
+
+
+class StaticScreen:
+    """배경이 고정된 화면용 dirty-rect 렌더러.
+
+    배경 이미지와 버튼 사각형은 한 장으로 구워 LayeredDirty 의 배경으로 쓰고, 글자는
+    DirtySprite 로 올린다. 처음(또는 invalidate 뒤)에만 화면 전체를 올리고, 그 뒤로는
+    바뀐 스프라이트 영역만 display.update(rects) 한다. 바뀐 게 없으면 아무것도 안 올린다.
+    """
+
+    def __init__(self, screen, background=None):
+        self.screen = screen
+        self.layers = pygame.sprite.LayeredDirty()
+        self._source = None
+        self._decor = []   # (color, rect) 배경에 같이 구울 사각형
+        self.background = None
+        self.set_background(background, force=True)
+
+    def set_background(self, background, force=False):
+        # 같은 이미지면 무시 (메뉴 루프에서 매 프레임 불러도 됨)
+        if background is self._source and not force:
+            return
+        self._source = background
+        self._compose()
+
+    def add_rect(self, color, rect):
+        rect = pygame.Rect(rect)
+        self._decor.append((color, rect))
+        self._compose()
+        return rect
+
+    def _compose(self):
+        bg = pygame.Surface(self.screen.get_size())
+        bg.fill(BLACK)
+        if self._source is not None:
+            bg.blit(self._source, (0, 0))
+        for color, rect in self._decor:
+            pygame.draw.rect(bg, color, rect)
+        if pygame.display.get_surface() is not None:
+            bg = bg.convert()
+        self.background = bg
+        self.layers.clear(self.screen, bg)
+        self.invalidate()
+
+    def add(self, image, pos, layer=0):
+        sprite = pygame.sprite.DirtySprite()
+        sprite.image = image
+        sprite.rect = image.get_rect(topleft=pos)
+        self.layers.add(sprite, layer=layer)
+        return sprite
+
+    def add_centered(self, image, center, layer=0):
+        sprite = self.add(image, (0, 0), layer)
+        sprite.rect.center = center
+        return sprite
+
+    def set_image(self, sprite, image):
+        # 글자가 바뀌면 이전 영역은 LayeredDirty 가 배경으로 지운다
+        sprite.image = image
+        sprite.rect = image.get_rect(topleft=sprite.rect.topleft)
+        sprite.dirty = 1
+
+    def invalidate(self):
+        # 다른 화면이 덮어썼을 때 다음 draw 에서 전체를 다시 그리게
+        self._full = True
+
+    def draw(self):
+        # 바뀐 영역만 그려서 화면에 올리고 그 목록을 돌려준다
+        screen_rect = self.screen.get_rect()
+        if self._full:
+            self._full = False
+            self.layers.repaint_rect(screen_rect)
+            self.layers.draw(self.screen)
+            # 전체 다시 그리기 경로에서는 LayeredDirty 가 dirty 를 내리지 않으므로 직접
+            for sprite in self.layers:
+                if sprite.dirty == 1:
+                    sprite.dirty = 0
+            pygame.display.flip()
+            return [screen_rect]
+        rects = self.layers.draw(self.screen)
+        if rects:
+            pygame.display.update(rects)
+        return rects
+
+
+class ScrollRenderer:
+    """게임 중 화면 렌더러.
+
+    예전의 fill + 배경 두 번 blit 대신 미리 만든 2배 높이 띠에서 area 를 지정해 한 번만 blit 한다.
+    배경이 움직인 프레임은 어차피 모든 픽셀이 바뀌므로 flip 하고, 배경이 멈춰 있으면
+    (scroll_speed == 0) 지난 프레임에 그린 영역만 배경으로 지운 뒤 지운 영역 + 새로 그린 영역만
+    display.update(rects) 로 올린다.
+    """
+
+    def __init__(self, screen, background, scroll_speed=BG_SCROLL_SPEED):
+        self.screen = screen
+        self.size = screen.get_size()
+        self.strip = make_strip(background, self.size)
+        self.scroll_speed = scroll_speed
+        self.bg_y = 0.0
+        self._shown_top = None   # 지금 화면에 깔린 배경의 띠 안 위치
+        self._prev = []          # 지난 프레임에 그린 영역
+        self._dirty = []
+        self._full = True        # 다음 프레임은 전체를 다시 그림
+        self._full_frame = True  # 이번 프레임을 전체로 그렸는지
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    @property
+    def tracking(self):
+        # 그린 영역을 모아야 하는지 (배경이 멈춘 모드에서만)
+        return not self.scroll_speed
+
+    def set_scrolling(self, scrolling):
+        self.scroll_speed = BG_SCROLL_SPEED if scrolling else 0
+        self.invalidate()
+
+    def invalidate(self):
+        self._full = True
+
+    def scroll(self, dt=FRAME_MS):
+        # 배경 스크롤: 위로 점점 올라가게 (bg_y 감소). 속도는 FRAME_MS 기준이라 실제 경과 시간으로 환산
+        self.bg_y -= self.scroll_speed * dt / FRAME_MS
+        if self.bg_y <= -self.size[1]:
+            self.bg_y = 0
+
+    def begin(self):
+        # 배경 그리기. 이번 프레임이 전체 갱신이면 True
+        w, h = self.size
+        top = int(-self.bg_y)
+        full = (self._full or not self.tracking or top != self._shown_top
+                or len(self._prev) > MAX_DIRTY_RECTS)
+        if full:
+            self.screen.blit(self.strip, (0, 0), (0, top, w, h))
+        else:
+            blit = self.screen.blit
+            strip = self.strip
+            for r in self._prev:
+                blit(strip, r, (r.x, r.y + top, r.w, r.h))
+        self._shown_top = top
+        self._full = False
+        self._full_frame = full
+        self._dirty = []
+        return full
+
+    def mark(self, rects):
+        # 이번 프레임에 그린 영역 추가 (tracking 일 때만 의미 있음)
+        self._dirty.extend(rects)
+
+    def present(self):
+        if self._full_frame or len(self._dirty) > MAX_DIRTY_RECTS:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(self._prev + self._dirty)
+            self.partial_frames += 1
+        self._prev = self._dirty if self.tracking else []
+        self._dirty = []
@@ -0,0 +1,205 @@
+"""입력 리플레이 기록 / 재생.
+
+    python -m game.replay last_replay.rpl             # 헤드리스로 최대 속도 재생 + 동기화 검사
+    python -m game.replay last_replay.rpl --render    # 창에 그리면서 재생 (--fps 0 이면 제한 없음)
+
+World 는 시드 하나(random.Random)와 시뮬레이션 시계만 쓰므로 시드 + 틱마다의 입력만 있으면
+같은 판이 틱 단위로 똑같이 다시 돈다. 기록 끝의 상태 체크섬으로 재생이 어긋났는지 확인한다.
+
+파일 형식 (little-endian):
+    header  "<4sHQHII"  magic b"SGRP", version, seed, sim_hz, 틱 수, 마지막 상태 체크섬
+    body    (입력이 바뀐 틱까지의 간격 varint, 입력 비트 1byte) 반복
+            입력 비트: 1 = 왼쪽, 2 = 오른쪽, 4 = 발사, 8/16 = 품질 단계 (0~3, Inputs.quality)
+"""
+import argparse
+import os
+import struct
+import sys
+import time
+import zlib
+
+from game.world import World, Inputs, NO_INPUT
+
+MAGIC = b"SGRP"
+VERSION = 1
+REPLAY_FILE = "last_replay.rpl"
+
+_HEADER = struct.Struct("<4sHQHII")
+
+LEFT = 1
+RIGHT = 2
+FIRE = 4
+QUALITY_SHIFT = 3
+
+
+def pack_inputs(inputs):
+    return ((LEFT if inputs.left else 0) | (RIGHT if inputs.right else 0) | (FIRE if inputs.fire else 0)
+            | (inputs.quality << QUALITY_SHIFT))
+
+
+def unpack_inputs(bits):
+    return Inputs(bool(bits & LEFT), bool(bits & RIGHT), bool(bits & FIRE), (bits >> QUALITY_SHIFT) & 3)
+
+
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    value = shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        value |= (b & 0x7F) << shift
+        if b < 0x80:
+            return value, pos
+        shift += 7
+
+
+def world_checksum(world):
+    # 재생 검증용 상태 요약: 점수/체력/플레이어 위치/적 위치/탄 개수
+    parts = [
+        world.tick, world.round_num, world.enemies_killed, world.player.health,
+        world.player.rect.x, len(world.enemies), len(world.projectiles), len(world.powerups),
+    ]
+    for enemy in world.enemies:
+        parts.extend(enemy.rect.topleft)
+    data = struct.pack(f"<{len(parts)}i", *parts)
+    return zlib.crc32(data)
+
+
+class ReplayRecorder:
+    """틱마다 입력을 받아 바뀐 지점만 (간격, 비트) 로 모은다."""
+
+    def __init__(self, seed, sim_hz):
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.ticks = 0
+        self._body = bytearray()
+        self._state = 0
+        self._last_change = 0
+
+    def record(self, inputs):
+        bits = pack_inputs(inputs)
+        if bits != self._state:
+            write_varint(self._body, self.ticks - self._last_change)
+            self._body.append(bits)
+            self._state = bits
+            self._last_change = self.ticks
+        self.ticks += 1
+
+    def to_bytes(self, checksum=0):
+        return _HEADER.pack(MAGIC, VERSION, self.seed, self.sim_hz, self.ticks, checksum) + bytes(self._body)
+
+    def save(self, path=REPLAY_FILE, world=None):
+        data = self.to_bytes(world_checksum(world) if world is not None else 0)
+        with open(path, "wb") as fp:
+            fp.write(data)
+        return len(data)
+
+
+class Replay:
+    def __init__(self, seed, sim_hz, inputs, checksum=0):
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.inputs = inputs      # 틱마다 Inputs
+        self.checksum = checksum
+
+    def __len__(self):
+        return len(self.inputs)
+
+    @property
+    def step_ms(self):
+        return 1000 / self.sim_hz
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, sim_hz, ticks, checksum = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a replay (v{VERSION})")
+        inputs = []
+        state = NO_INPUT
+        pos = _HEADER.size
+        while pos < len(data):
+            gap, pos = read_varint(data, pos)
+            bits = data[pos]
+            pos += 1
+            inputs.extend([state] * gap)
+            state = unpack_inputs(bits)
+        inputs.extend([state] * (ticks - len(inputs)))
+        return cls(seed, sim_hz, inputs, checksum)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as fp:
+            return cls.from_bytes(fp.read())
+
+
+def play(replay, images, on_tick=None):
+    """replay 를 처음부터 끝까지 돌린 World 를 돌려준다. on_tick(world) 는 매 틱 뒤에 호출."""
+    world = World(images, seed=replay.seed)
+    step_ms = replay.step_ms
+    for inputs in replay.inputs:
+        world.step(inputs, step_ms)
+        if on_tick is not None:
+            on_tick(world)
+    return world
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="리플레이 재생")
+    parser.add_argument("path", nargs="?", default=REPLAY_FILE)
+    parser.add_argument("--render", action="store_true", help="창에 그리면서 재생")
+    parser.add_argument("--fps", type=int, default=0, help="--render 때 프레임 제한 (0: 최대 속도)")
+    args = parser.parse_args(argv)
+
+    import pygame
+
+    from game.assets import load_images
+    from game.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    replay = Replay.load(args.path)
+    if not args.render:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    images = load_images()
+
+    if args.render:
+        from game.render import ScrollRenderer, draw_batched
+
+        renderer = ScrollRenderer(screen, images["background"])
+        clock = pygame.time.Clock()
+
+        def on_tick(world):
+            pygame.event.pump()
+            renderer.scroll(replay.step_ms)
+            renderer.begin()
+            draw_batched(screen, world.all_sprites, doreturn=False)
+            world.projectiles.draw(screen)
+            renderer.present()
+            clock.tick(args.fps)
+    else:
+        on_tick = None
+
+    t0 = time.perf_counter()
+    world = play(replay, images, on_tick)
+    elapsed = time.perf_counter() - t0
+    checksum = world_checksum(world)
+    game_seconds = len(replay) * replay.step_ms / 1000
+    print(f"{args.path}: seed {replay.seed}, {len(replay)} ticks @ {replay.sim_hz} Hz "
+          f"({game_seconds:.1f}s game time) in {elapsed:.2f}s ({game_seconds / elapsed if elapsed else 0:.1f}x)")
+    print(f"round {world.round_num}, kills {world.enemies_killed}, health {world.player.health}")
+    pygame.quit()
+    if replay.checksum and checksum != replay.checksum:
+        print(f"DESYNC: checksum {checksum:08x} != recorded {replay.checksum:08x}")
+        return 1
+    print(f"checksum {checksum:08x} OK" if replay.checksum else f"checksum {checksum:08x} (not recorded)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
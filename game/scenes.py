@@ -0,0 +1,416 @@
+"""장면(scene) 스택, 메인 루프(App)와 메뉴 화면들.
+
+메인 루프 하나(App.run)가 스택 맨 위 장면의 handle_event / update / draw 를 매 프레임 부른다.
+시작 메뉴, 게임 설명, 게임 진행, 라운드 전환, 게임 오버는 모두 장면이고, 라운드 메시지 같은
+전환은 대기(sleep) 대신 시간이 정해진 장면이라 그동안에도 이벤트 큐가 계속 비워진다.
+
+게임 진행 장면(game/playing.py)과 시뮬레이션, 효과음, 파티클은 처음 게임을 시작할 때 import 한다
+(첫 메뉴 프레임을 늦추지 않게).
+"""
+import random
+
+import pygame
+
+from game import startup
+from game.settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, RED, GREEN, BLUE, SIM_HZ, RECORD_REPLAY, QUALITY_GOVERNOR,
+)
+from game.text import render_text
+from game.render import StaticScreen, ScrollRenderer
+
+MENU_FPS = 60
+FAREWELL_MS = 2000        # 종료 전 "게임 오버" 표시 시간
+
+
+class Scene:
+    """장면 기본형. 필요한 메서드만 덮어쓴다."""
+
+    fps = MENU_FPS  # 이 장면이 맨 위일 때 프레임 제한 (0 이면 제한 없음)
+    startup_mark = None  # 처음 그려졌을 때 기록할 시작 시간 단계 이름 (game.startup)
+
+    def __init__(self, app):
+        self.app = app
+
+    def enter(self):
+        # 스택에 올라갈 때
+        pass
+
+    def resume(self):
+        # 위 장면이 빠져서 다시 맨 위가 될 때
+        pass
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.app.scenes.clear()
+
+    def update(self, frame_ms):
+        pass
+
+    def draw(self):
+        pass
+
+
+class SceneStack:
+    def __init__(self):
+        self._stack = []
+
+    def __bool__(self):
+        return bool(self._stack)
+
+    def __len__(self):
+        return len(self._stack)
+
+    @property
+    def top(self):
+        return self._stack[-1] if self._stack else None
+
+    def push(self, scene):
+        self._stack.append(scene)
+        scene.enter()
+
+    def pop(self):
+        scene = self._stack.pop()
+        if self._stack:
+            self._stack[-1].resume()
+        return scene
+
+    def replace(self, scene):
+        # 맨 위 장면을 바꿈 (아래 장면은 resume 되지 않음)
+        if self._stack:
+            self._stack.pop()
+        self.push(scene)
+
+    def clear(self):
+        self._stack.clear()
+
+
+class App:
+    """장면들이 같이 쓰는 상태(화면, 에셋, 월드)와 메인 루프."""
+
+    def __init__(self, screen, assets):
+        self.screen = screen
+        self.assets = assets
+        self.scenes = SceneStack()
+        self.clock = pygame.time.Clock()
+        self.world = None
+        self.renderer = None
+        # F3: 단계별 시간 측정 + 오버레이 켜기/끄기, F4: 측정값 내보내기 (Chrome trace / CSV)
+        # 처음 F3 을 누를 때 만듦 (numpy 배열 / 오버레이 폰트를 첫 메뉴 프레임 전에 만들지 않게)
+        self.profiler = None
+        self.overlay = None
+        self.recorder = None  # 이번 판 입력 기록 (RECORD_REPLAY)
+        # 게임 화면에서만 쓰는 것들 — 에셋이 준비된 뒤 init_gameplay 에서 채움
+        self.sfx = None        # 효과음 (game.audio.SoundBank)
+        self.particles = None  # 폭발/피격 효과 (시뮬레이션과 별개)
+        self.governor = None   # 프레임 예산을 넘으면 품질 단계를 낮춤 (QUALITY_GOVERNOR 가 꺼져 있으면 None)
+
+    @property
+    def active_profiler(self):
+        # 꺼져 있으면 None — 측정 지점은 `is not None` 검사만 함
+        profiler = self.profiler
+        return profiler if profiler is not None and profiler.enabled else None
+
+    def toggle_profiler(self):
+        if self.profiler is None:
+            from game.profiler import FrameProfiler, ProfilerOverlay
+
+            self.profiler = FrameProfiler()
+            self.overlay = ProfilerOverlay(self.profiler)
+        self.profiler.enabled = not self.profiler.enabled
+        if self.profiler.enabled:
+            self.profiler.begin_frame()
+        if self.world is not None:
+            self.world.profiler = self.active_profiler
+        if self.renderer is not None:
+            self.renderer.invalidate()  # 오버레이가 있던 자리 지우기
+
+    def export_profile(self):
+        if self.profiler is None:
+            print("profile: nothing recorded (F3 to start)")
+            return
+        for path in self.profiler.export():
+            print(f"profile: {path}")
+
+    def run(self, scene):
+        scenes = self.scenes
+        scenes.push(scene)
+        frame_ms = 0
+        while scenes:
+            prof = self.active_profiler
+            if prof is not None:
+                prof.begin_frame()
+            for event in pygame.event.get():
+                if not scenes:
+                    break
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.toggle_profiler()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                    self.export_profile()
+                else:
+                    scenes.top.handle_event(event)
+            if not scenes:
+                break
+            prof = self.active_profiler
+            if prof is not None:
+                prof.lap("events")
+            scenes.top.update(frame_ms)
+            if not scenes:
+                break
+            if prof is not None:
+                prof.lap("scene_update")
+            top = scenes.top
+            top.draw()
+            if top.startup_mark is not None:
+                startup.mark(top.startup_mark, report=True)
+            if prof is not None:
+                prof.lap("present")
+                prof.end_frame(self.world)
+            frame_ms = self.clock.tick(scenes.top.fps if scenes else 0)
+
+    def init_gameplay(self):
+        # 게임 화면 준비 (처음 한 번): 에셋을 기다리고 게임에서만 쓰는 모듈을 이때 import
+        if self.renderer is not None:
+            return self.assets.wait()
+        from game.audio import SoundBank
+        from game.particles import ParticleSystem
+        from game.governor import QualityGovernor
+
+        images = self.assets.wait()
+        self.assets.print_report_once()
+        self.renderer = ScrollRenderer(self.screen, images["background"])
+        self.sfx = SoundBank(images.get("sfx"))
+        self.particles = ParticleSystem()
+        self.governor = QualityGovernor() if QUALITY_GOVERNOR else None
+        return images
+
+    def start_game(self):
+        # 에셋이 다 준비된 뒤 호출: 시뮬레이션 생성 (스프라이트 그룹 / 편대 / 플레이어 / 점수는 World 가 소유)
+        from game.playing import PlayingScene, RoundTransitionScene
+
+        if self.world is None:
+            from game.world import World
+
+            images = self.init_gameplay()
+            self.world = World(images, seed=random.getrandbits(32))
+            self.world.track_motion = True  # 렌더 보간용 직전 틱 위치 기록
+            self.world.profiler = self.active_profiler
+        startup.mark("game setup")
+        self.begin_recording()
+        playing = PlayingScene(self)
+        self.scenes.replace(playing)
+        self.scenes.push(RoundTransitionScene(self, playing))
+
+    def new_game(self):
+        # 다시하기: 새 시드로 월드 리셋
+        self.world.reset(random.getrandbits(32))
+        self.world.prev_positions = {}
+        self.particles.clear()
+        self.begin_recording()
+
+    def begin_recording(self):
+        if RECORD_REPLAY:
+            from game.replay import ReplayRecorder
+
+            self.recorder = ReplayRecorder(self.world.seed, SIM_HZ)
+
+    def save_replay(self):
+        # 판이 끝났을 때 한 번 저장 (게임 오버 / 게임 중 종료)
+        recorder = self.recorder
+        self.recorder = None
+        if recorder is None or not recorder.ticks:
+            return
+        from game.replay import REPLAY_FILE
+
+        try:
+            size = recorder.save(REPLAY_FILE, self.world)
+            print(f"replay: {REPLAY_FILE} ({recorder.ticks} ticks, {size} bytes)")
+        except OSError as e:
+            print(f"Warning: replay: {e}")
+
+    def end_game(self):
+        # 게임 중 종료: "게임 오버" 를 잠깐 보여주고 루프 끝내기
+        self.save_replay()
+        self.scenes.clear()
+        self.scenes.push(FarewellScene(self))
+
+
+class MenuScene(Scene):
+    """StaticScreen 위에 그리는 정적 화면 (처음 한 번만 전체를 그리고 이후엔 바뀐 곳만 올림)."""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.menu = StaticScreen(app.screen)
+
+    def resume(self):
+        self.menu.invalidate()  # 위 화면이 덮어썼으므로 다시 그림
+
+    def update(self, frame_ms):
+        # 메뉴 배경: 배경 이미지가 아직 준비 안 됐으면 검은 화면 (준비되면 그때 한 번 전체를 다시 그림)
+        assets = self.app.assets
+        assets.poll()
+        self.menu.set_background(assets.get("background"))
+
+    def draw(self):
+        self.menu.draw()
+
+
+# 시작 메뉴 (시작 / 설명 버튼)
+class StartMenuScene(MenuScene):
+    startup_mark = "menu frame"
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.start_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 30, 200, 60)
+        self.info_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 40, 200, 50)
+        self.starting = False  # 시작을 눌렀지만 에셋이 아직 로딩 중
+
+        menu = self.menu
+        menu.add_rect(GREEN, self.start_button)  # 시작 버튼
+        menu.add_rect(BLUE, self.info_button)    # 설명 버튼
+
+        # 타이틀
+        title_text = render_text("슈팅 게임", 80, WHITE)
+        menu.add(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, SCREEN_HEIGHT // 3 - 80))
+
+        btn_text = render_text("시작하기", 36, BLACK)
+        menu.add(
+            btn_text,
+            (
+                SCREEN_WIDTH // 2 - btn_text.get_width() // 2,
+                SCREEN_HEIGHT // 2 - btn_text.get_height() // 2,
+            ),
+        )
+
+        info_text = render_text("게임 설명", 24, BLACK)
+        menu.add(
+            info_text,
+            (
+                SCREEN_WIDTH // 2 - info_text.get_width() // 2,
+                SCREEN_HEIGHT // 2 + 40 + (50 - info_text.get_height()) // 2,
+            ),
+        )
+
+        # 로딩이 덜 끝난 상태에서 시작하면 보이는 안내
+        loading_text = render_text("불러오는 중...", 24, WHITE)
+        self.loading = menu.add(loading_text, (SCREEN_WIDTH // 2 - loading_text.get_width() // 2, SCREEN_HEIGHT // 2 + 110))
+        self.loading.visible = 0
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.start_button.collidepoint(event.pos):
+                self.start()
+            elif self.info_button.collidepoint(event.pos):
+                self.app.scenes.push(InstructionsScene(self.app))
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                self.start()
+        else:
+            super().handle_event(event)
+
+    def start(self):
+        startup.mark("in menu")
+        self.starting = True
+        self.loading.visible = 1
+        self.loading.dirty = 1
+
+    def update(self, frame_ms):
+        super().update(frame_ms)
+        if self.starting and self.app.assets.done:
+            self.app.start_game()
+
+
+# 게임 설명 화면
+class InstructionsScene(MenuScene):
+    LINES = [
+        "게임 설명",
+        "",
+        "조작:",
+        "- 좌/우 화살표: 이동",
+        "- 스페이스: 발사 (파워업: 폭탄/연발)",
+        "",
+        "목표: 적을 많이 처치하여 라운드를 진행하세요.",
+        "아이템을 획득하면 무기가 강화됩니다.",
+        "",
+        "버튼이나 아무 키를 눌러 돌아가세요.",
+    ]
+
+    def __init__(self, app):
+        super().__init__(app)
+        y = 80
+        for i, line in enumerate(self.LINES):
+            text = render_text(line, 48 if i == 0 else 24, WHITE)
+            self.menu.add(text, (50, y))
+            y += text.get_height() + 10
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN or (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1):
+            self.app.scenes.pop()
+        else:
+            super().handle_event(event)
+
+
+def game_over_text():
+    text = render_text("게임 오버", 74, RED)
+    pos = (
+        SCREEN_WIDTH // 2 - text.get_width() // 2,
+        SCREEN_HEIGHT // 2 - text.get_height() // 2 - 60,
+    )
+    return text, pos
+
+
+# 게임 오버 메뉴 (다시하기 / 종료)
+class GameOverScene(MenuScene):
+    def __init__(self, app):
+        super().__init__(app)
+        self.restart_button = pygame.Rect(SCREEN_WIDTH // 2 - 140, SCREEN_HEIGHT // 2 + 10, 120, 50)
+        self.quit_button = pygame.Rect(SCREEN_WIDTH // 2 + 20, SCREEN_HEIGHT // 2 + 10, 120, 50)
+
+        menu = self.menu
+        menu.add(*game_over_text())
+
+        # 다시하기 버튼
+        menu.add_rect(GREEN, self.restart_button)
+        rt = render_text("다시하기 (R)", 36, BLACK)
+        menu.add(rt, (self.restart_button.x + (self.restart_button.width - rt.get_width()) // 2, self.restart_button.y + 10))
+
+        # 종료 버튼
+        menu.add_rect(RED, self.quit_button)
+        qt = render_text("종료 (Q)", 36, BLACK)
+        menu.add(qt, (self.quit_button.x + (self.quit_button.width - qt.get_width()) // 2, self.quit_button.y + 10))
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.restart_button.collidepoint(event.pos):
+                self.restart()
+            elif self.quit_button.collidepoint(event.pos):
+                self.app.end_game()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:  # R키로 다시하기
+                self.restart()
+            elif event.key == pygame.K_q:  # Q로 종료
+                self.app.end_game()
+        else:
+            super().handle_event(event)
+
+    def restart(self):
+        self.app.new_game()
+        self.app.scenes.pop()
+
+
+# 종료 전 "게임 오버" 잠깐 표시
+class FarewellScene(Scene):
+    def __init__(self, app):
+        super().__init__(app)
+        self.elapsed = 0
+        self.shown = False
+
+    def update(self, frame_ms):
+        self.elapsed += frame_ms
+        if self.elapsed >= FAREWELL_MS:
+            self.app.scenes.clear()
+
+    def draw(self):
+        if not self.shown:
+            self.shown = True
+            self.app.screen.blit(*game_over_text())
+            pygame.display.flip()
@@ -0,0 +1,297 @@
+"""LAN 협동 플레이 서버 (권한 서버).
+
+    python -m game.server                       # 2인, 포트 5555
+    python -m game.server --players 1 --port 6000 --seed 7
+
+asyncio UDP 소켓 하나로 클라이언트들의 입력을 받고, World 를 SIM_HZ 고정 주기로 직접 돌려서
+NET_SNAPSHOT_EVERY 틱마다 클라이언트별로 스냅숏을 보낸다. 스냅숏은 그 클라이언트가 마지막으로
+받았다고 알려온 스냅숏과의 델타(game.net). 인원이 다 모일 때까지는 멈춘 상태로 스냅숏만 보내고,
+게임 오버 후 NET_RESTART_MS 가 지나면 새 시드로 다시 시작한다.
+
+입력은 클라이언트가 틱마다 매긴 순번으로 틱당 하나씩 적용한다. 제때 안 온 틱은 직전 입력의 이동을
+이어 쓰고(발사는 빼고), 밀린 입력이 많으면 오래된 것을 버려서 따라잡는다.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+
+from game import net
+from game.replay import unpack_inputs
+from game.settings import (
+    SIM_HZ, NET_PORT, NET_PLAYERS, NET_SNAPSHOT_EVERY, NET_HISTORY, NET_TIMEOUT_MS, NET_RESTART_MS,
+)
+from game.world import World, NO_INPUT
+
+MAX_INPUT_LAG = 6        # 이보다 많이 밀린 입력은 버림 (틱)
+STATS_EVERY_S = 5.0
+
+
+class ClientSlot:
+    """플레이어 자리 하나에 붙은 클라이언트."""
+
+    def __init__(self, addr, index):
+        self.addr = addr
+        self.index = index
+        self.inputs = {}         # 입력 순번 -> Inputs (아직 적용 안 한 것)
+        self.next_seq = 1        # 다음에 적용할 입력 순번
+        self.last_applied = 0    # 적용한 마지막 순번 (스냅숏에 실어 보냄 -> 클라이언트 예측 보정)
+        self.last_input = NO_INPUT
+        self.acked = 0           # 클라이언트가 받았다고 알려온 마지막 스냅숏 번호
+        self.history = OrderedDict()   # 스냅숏 번호 -> 보낸 상태 (델타 기준)
+        self.echo_time = 0       # 마지막 입력 패킷의 클라이언트 시각
+        self.echo_at = 0.0       # 그 패킷을 받은 서버 시각
+        self.last_heard = time.monotonic()
+        self.stats = net.NetStats()
+
+    def take_input(self):
+        # 이번 틱에 쓸 입력
+        pending = self.inputs
+        if pending and max(pending) - self.next_seq >= MAX_INPUT_LAG:
+            # 많이 밀렸으면 최근 몇 틱만 남기고 건너뜀
+            skip_to = max(pending) - MAX_INPUT_LAG + 1
+            for seq in [s for s in pending if s < skip_to]:
+                del pending[seq]
+            self.next_seq = skip_to
+        inputs = pending.pop(self.next_seq, None)
+        if inputs is None:
+            return self.last_input._replace(fire=False)
+        self.last_applied = self.next_seq
+        self.next_seq += 1
+        self.last_input = inputs
+        return inputs
+
+    def skip_inputs(self):
+        # 멈춰 있는 동안(인원 대기 / 게임 오버) 온 입력은 적용하지 않고 처리한 것으로 침
+        if self.inputs:
+            self.last_applied = max(self.inputs)
+            self.next_seq = self.last_applied + 1
+            self.inputs.clear()
+        self.last_input = NO_INPUT
+
+
+class GameServer(asyncio.DatagramProtocol):
+    def __init__(self, images, players=NET_PLAYERS, seed=None):
+        self.images = images
+        self.players = players
+        self.world = World(images, seed=seed if seed is not None else random.getrandbits(32), players=players)
+        self.slots = [None] * players
+        self.by_addr = {}
+        self.transport = None
+        self.snap_id = 0
+        self.sounds = []      # 지난 스냅숏 이후의 효과음 / 효과 (스냅숏마다 비움)
+        self.effects = []
+        self.over_ms = 0.0    # 게임 오버 후 지난 시간
+        self.ticks = 0
+        self.snapshot_bytes = 0
+        self.snapshots = 0
+        self.tick_ms = 0.0
+
+    # --- 수신 ---------------------------------------------------------------------
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        if not data:
+            return
+        slot = self.by_addr.get(addr)
+        if slot is not None:
+            slot.stats.received(len(data))
+            slot.last_heard = time.monotonic()
+        kind = data[0]
+        if kind == net.MSG_HELLO:
+            self.join(data, addr)
+        elif kind == net.MSG_INPUT and slot is not None:
+            self.receive_input(slot, data)
+        elif kind == net.MSG_BYE and slot is not None:
+            self.leave(slot, "bye")
+
+    def join(self, data, addr):
+        _, version = net.HELLO.unpack_from(data, 0)
+        slot = self.by_addr.get(addr)
+        if slot is None:
+            if version != net.PROTOCOL_VERSION or None not in self.slots:
+                self.send(addr, net.BYTE.pack(net.MSG_FULL))
+                return
+            index = self.slots.index(None)
+            slot = ClientSlot(addr, index)
+            self.slots[index] = slot
+            self.by_addr[addr] = slot
+            print(f"server: player {index + 1} joined from {addr[0]}:{addr[1]}")
+        # HELLO 가 다시 오면 (WELCOME 이 유실됨) 한 번 더 보냄
+        self.send(addr, net.WELCOME.pack(net.MSG_WELCOME, slot.index, self.players, SIM_HZ), slot)
+
+    def leave(self, slot, reason):
+        print(f"server: player {slot.index + 1} left ({reason}) — {slot.stats.summary()}")
+        self.slots[slot.index] = None
+        del self.by_addr[slot.addr]
+
+    def receive_input(self, slot, data):
+        ack, client_time, first_seq, bits = net.unpack_input(data)
+        if ack in slot.history:
+            slot.acked = ack
+            # 더 오래된 기준은 다시 쓸 일이 없음
+            while slot.history and next(iter(slot.history)) < ack:
+                slot.history.popitem(last=False)
+        slot.echo_time = client_time
+        slot.echo_at = time.monotonic()
+        for i, b in enumerate(bits):
+            seq = first_seq + i
+            if seq >= slot.next_seq and seq not in slot.inputs:
+                slot.inputs[seq] = unpack_inputs(b)._replace(quality=0)
+
+    # --- 송신 ---------------------------------------------------------------------
+
+    def send(self, addr, packet, slot=None):
+        self.transport.sendto(packet, addr)
+        if slot is not None:
+            slot.stats.sent(len(packet))
+
+    def send_snapshots(self, flags):
+        self.snap_id += 1
+        state = net.capture(self.world, flags)
+        sounds, effects = self.sounds, self.effects
+        for slot in self.slots:
+            if slot is None:
+                continue
+            base = slot.history.get(slot.acked)
+            base_id = slot.acked if base is not None else 0
+            sent = state
+            body = net.encode_state(state, base or net.empty_state(), sounds, effects)
+            packet = self.pack(slot, base_id, body)
+            while len(packet) > net.MAX_PACKET and sent["b"]:
+                # 너무 크면 탄 표를 반씩 줄임 (잘라낸 상태를 기준으로 기록)
+                keep = sorted(sent["b"])[:len(sent["b"]) // 2]
+                sent = dict(sent, b={k: sent["b"][k] for k in keep})
+                body = net.encode_state(sent, base or net.empty_state(), sounds, effects)
+                packet = self.pack(slot, base_id, body)
+            self.send(slot.addr, packet, slot)
+            slot.history[self.snap_id] = sent
+            while len(slot.history) > NET_HISTORY:
+                slot.history.popitem(last=False)
+            if base_id:
+                slot.stats.delta_snapshots += 1
+            else:
+                slot.stats.full_snapshots += 1
+            self.snapshot_bytes += len(packet)
+            self.snapshots += 1
+        self.sounds = []
+        self.effects = []
+
+    def pack(self, slot, base_id, body):
+        hold = int((time.monotonic() - slot.echo_at) * 1000) if slot.echo_at else 0
+        return net.pack_snapshot(self.snap_id, base_id, slot.last_applied, slot.echo_time, hold, body)
+
+    # --- 틱 -----------------------------------------------------------------------
+
+    def tick(self, step_ms):
+        world = self.world
+        now = time.monotonic()
+        for slot in self.slots:
+            if slot is not None and (now - slot.last_heard) * 1000 > NET_TIMEOUT_MS:
+                self.leave(slot, "timeout")
+
+        flags = 0
+        if None in self.slots or world.game_over:
+            for slot in self.slots:
+                if slot is not None:
+                    slot.skip_inputs()
+            if None in self.slots:
+                flags |= net.FLAG_WAITING
+            else:
+                self.over_ms += step_ms
+                if self.over_ms >= NET_RESTART_MS:
+                    self.restart()
+        else:
+            inputs = [slot.take_input() for slot in self.slots]
+            t0 = time.perf_counter()
+            world.step(inputs, step_ms)
+            self.tick_ms += (time.perf_counter() - t0) * 1000
+            self.sounds.extend(world.sounds)
+            self.effects.extend(world.effects)
+        self.ticks += 1
+        if self.ticks % NET_SNAPSHOT_EVERY == 0:
+            self.send_snapshots(flags)
+        for slot in self.slots:
+            if slot is not None:
+                slot.stats.update()
+
+    def restart(self):
+        seed = random.getrandbits(32)
+        print(f"server: new game (seed {seed})")
+        self.world.reset(seed)
+        self.over_ms = 0.0
+
+    def print_stats(self):
+        avg = self.snapshot_bytes / self.snapshots if self.snapshots else 0
+        print(f"server: tick {self.world.tick}, round {self.world.round_num}, "
+              f"players {self.players - self.slots.count(None)}/{self.players}, "
+              f"snapshot avg {avg:.0f} B, sim {self.tick_ms / max(self.ticks, 1):.2f} ms/tick")
+        for slot in self.slots:
+            if slot is not None:
+                print(f"  P{slot.index + 1} {slot.addr[0]}:{slot.addr[1]}: {slot.stats.summary()}")
+        self.snapshot_bytes = self.snapshots = 0
+
+    async def run(self, duration=None):
+        # 고정 주기 틱 루프 (늦어지면 밀린 틱을 몰아서 돌림, 한 번에 최대 5틱)
+        loop = asyncio.get_running_loop()
+        step = 1 / SIM_HZ
+        start = next_tick = loop.time()
+        next_stats = start + STATS_EVERY_S
+        while duration is None or loop.time() - start < duration:
+            now = loop.time()
+            behind = 0
+            while next_tick <= now and behind < 5:
+                self.tick(step * 1000)
+                next_tick += step
+                behind += 1
+            if next_tick <= now:
+                next_tick = now + step
+            if now >= next_stats:
+                self.print_stats()
+                next_stats += STATS_EVERY_S
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        for slot in self.slots:
+            if slot is not None:
+                self.send(slot.addr, net.BYTE.pack(net.MSG_BYE), slot)
+
+
+async def serve(images, host="0.0.0.0", port=NET_PORT, players=NET_PLAYERS, seed=None, duration=None):
+    loop = asyncio.get_running_loop()
+    server = GameServer(images, players, seed)
+    transport, _ = await loop.create_datagram_endpoint(lambda: server, local_addr=(host, port))
+    print(f"server: listening on {host}:{port}, waiting for {players} player(s)")
+    try:
+        await server.run(duration)
+    finally:
+        transport.close()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LAN 협동 플레이 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=NET_PORT)
+    parser.add_argument("--players", type=int, default=NET_PLAYERS)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--seconds", type=float, default=None, help="이만큼 돌리고 종료 (테스트용)")
+    args = parser.parse_args(argv)
+
+    # 화면 없이: 이미지는 변환 없이 원본 Surface 그대로 (충돌 마스크/크기에만 씀)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from game.assets import load_images
+
+    images = load_images()
+    try:
+        asyncio.run(serve(images, args.host, args.port, args.players, args.seed, args.seconds))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+# 게임 전역 설정값 (디스플레이 없이 import 가능)
+
+# Screen dimensions
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+
+# Player settings
+PLAYER_WIDTH = 50
+PLAYER_HEIGHT = 60
+PLAYER_SPEED = 5
+
+# Bullet settings
+BULLET_WIDTH = 5
+BULLET_HEIGHT = 10
+BULLET_SPEED = 7
+
+# Enemy settings
+ENEMY_WIDTH = 50
+ENEMY_HEIGHT = 60
+INITIAL_ENEMY_SPEED = 3
+
+# 발사 난이도 조정(전역)
+ENEMY_SHOOT_PROB = 0.25           # 적이 발사 시도할 확률 (0.0 ~ 1.0)
+ENEMY_BULLET_MIN_SPEED = 2.0     # 적 총알 최소 속도
+ENEMY_BULLET_MAX_SPEED = 3.0     # 적 총알 최대 속도
+
+# 라운드 / 아이템
+ENEMIES_PER_ROUND = 50
+POWERUP_DROP_PROB = 0.12
+EXPLOSION_RADIUS = 40             # 폭탄 폭발 반경
+
+# 배경 스크롤 속도 (위로 이동)
+BG_SCROLL_SPEED = 1.5
+
+# 시뮬레이션 한 틱의 기본 길이 (ms, 60fps 기준). 위의 속도 값들은 모두 이 한 틱 동안의 이동량(px)
+FRAME_MS = 1000 / 60
+
+# 고정 시뮬레이션 주기 (60 또는 120 Hz). 화면 그리기 속도와 상관없이 이 주기로 진행한다
+SIM_HZ = 60
+# 화면 그리기 제한 (fps). 0 이면 제한 없음
+RENDER_FPS = 60
+# 수직 동기화 (SCALED 창 모드에서만 지원, 실패하면 일반 창으로)
+VSYNC = False
+# 판마다 시드 + 틱별 입력을 last_replay.rpl 로 저장 (python -m game.replay 로 재생)
+RECORD_REPLAY = True
+# 한 프레임이 이보다 오래 걸리면 잘라서 따라잡기 (멈췄다 돌아왔을 때 틱 폭주 방지)
+MAX_FRAME_MS = 250
+
+# 사운드: 믹서 출력 형식과 버퍼 크기(샘플). 버퍼가 작을수록 효과음 지연이 짧지만 끊길 수 있다
+MIXER_FREQUENCY = 44100
+MIXER_BUFFER = 512
+SFX_CHANNELS = 16                 # 효과음이 동시에 낼 수 있는 소리 수 (모자라면 우선순위로 뺏음)
+SFX_VOLUME = 0.6
+
+# 파티클 효과 최대 개수 (넘으면 새 파티클은 버림)
+MAX_PARTICLES = 20000
+
+# 품질 자동 조절 (game/governor.py): 최근 프레임 작업 시간 평균이 예산을 넘으면 한 단계씩 낮춘다
+QUALITY_GOVERNOR = True
+FRAME_BUDGET_MS = 1000 / 60
+# 최저 단계의 최대 개수. 보통 플레이(3틱마다 발사: 파티클 ~100, 플레이어 탄 ~25, 적 총알 ~10)는 건드리지 않고
+# 폭탄 연사 / 탄막에서만 걸리는 값 (bench bomb_spam: 파티클 ~6,600, 플레이어 탄 ~75, 적 총알 ~55)
+LOW_PARTICLE_CAP = 2000
+LOW_ENEMY_BULLET_CAP = 40
+LOW_PLAYER_SHOT_CAP = 40          # 플레이어 총알 + 폭탄
+
+# LAN 협동 플레이 (game/server.py, python shooting_game.py --connect 호스트)
+NET_PORT = 5555
+NET_PLAYERS = 2                   # 서버가 기다리는 인원 (다 모이면 시작)
+NET_SNAPSHOT_EVERY = 1            # 몇 틱마다 스냅숏을 보낼지
+NET_INPUT_REDUNDANCY = 8          # 입력 패킷마다 다시 실어 보내는 최근 입력 틱 수 (패킷 손실 대비)
+NET_HISTORY = 64                  # 델타 기준으로 쓰려고 보관하는 스냅숏 수 (서버: 클라이언트별, 클라이언트: 받은 것)
+NET_TIMEOUT_MS = 5000             # 이만큼 소식이 없으면 연결 끊김
+NET_RESTART_MS = 5000             # 게임 오버 후 서버가 새 판을 시작하기까지
+# 패킷에는 이름 대신 이 표의 번호가 실린다 (game/net.py). 순서를 바꾸거나 항목을 넣고 빼면
+# net.PROTOCOL_VERSION 도 올릴 것. audio.SFX / particles.EFFECTS / enemy_variants.HITBOXES 는 import 때 이 표와 맞춰 본다
+SOUND_NAMES = ("shot", "bomb", "hit", "explosion", "powerup", "player_hit", "round")
+EFFECT_NAMES = ("hit", "explosion", "bomb", "powerup")
+ENEMY_KINDS = ("weak", "weak_img", "strong", "mid")
+
+# 시작 시간 출력 (game/startup.py): 프로세스 시작 -> 첫 메뉴 프레임 / 첫 게임 프레임
+STARTUP_REPORT = True
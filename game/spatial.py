@@ -0,0 +1,199 @@
+from itertools import count
+
+import pygame
+
+from game.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# 격자 한 칸 크기 (px). 적(28~70px)과 총알이 1~4칸에 걸치는 정도
+CELL_SIZE = 64
+
+
+class SpatialHash:
+    """800x600 화면을 균일 격자로 나눈 broadphase 인덱스.
+
+    sync(group) 으로 한 그룹의 스프라이트를 격자에 반영한다. 이전 프레임과 같은 칸에
+    있는 스프라이트는 건드리지 않고, 칸이 바뀐 것 / 새로 들어온 것 / 사라진 것만 갱신한다.
+    화면 밖 좌표는 가장자리 칸으로 모은다.
+    """
+
+    def __init__(self, cell_size=CELL_SIZE, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        self.cell_size = cell_size
+        self.cols = width // cell_size + 1
+        self.rows = height // cell_size + 1
+        self.cells = [set() for _ in range(self.cols * self.rows)]
+        self._where = {}   # sprite -> (x0, y0, x1, y1) 차지한 칸 범위
+        self._seq = {}     # sprite -> 삽입 순번 (그룹 순서대로 결과를 돌려주기 위해)
+        self._counter = count()
+
+    def _cell_range(self, rect):
+        # min/max 호출 대신 비교문으로 클램프 (매 프레임 스프라이트마다 불리는 경로)
+        cs = self.cell_size
+        last_x = self.cols - 1
+        last_y = self.rows - 1
+        x0 = rect.left // cs
+        x1 = (rect.right - 1) // cs
+        y0 = rect.top // cs
+        y1 = (rect.bottom - 1) // cs
+        if x0 < 0:
+            x0 = 0
+        elif x0 > last_x:
+            x0 = last_x
+        if x1 < 0:
+            x1 = 0
+        elif x1 > last_x:
+            x1 = last_x
+        if y0 < 0:
+            y0 = 0
+        elif y0 > last_y:
+            y0 = last_y
+        if y1 < 0:
+            y1 = 0
+        elif y1 > last_y:
+            y1 = last_y
+        return x0, y0, x1, y1
+
+    def _place(self, sprite, span, add):
+        x0, y0, x1, y1 = span
+        cols = self.cols
+        cells = self.cells
+        for cy in range(y0, y1 + 1):
+            row = cy * cols
+            for cx in range(x0, x1 + 1):
+                if add:
+                    cells[row + cx].add(sprite)
+                else:
+                    cells[row + cx].discard(sprite)
+
+    def insert(self, sprite):
+        span = self._cell_range(sprite.rect)
+        old = self._where.get(sprite)
+        if old == span:
+            return
+        if old is not None:
+            self._place(sprite, old, False)
+        else:
+            self._seq[sprite] = next(self._counter)
+        self._place(sprite, span, True)
+        self._where[sprite] = span
+
+    def remove(self, sprite):
+        span = self._where.pop(sprite, None)
+        if span is not None:
+            self._place(sprite, span, False)
+            del self._seq[sprite]
+
+    def sync(self, group):
+        members = group.spritedict
+        # 그룹에서 빠진(kill 된) 스프라이트 정리
+        for s in [s for s in self._where if s not in members]:
+            self.remove(s)
+        for s in members:
+            self.insert(s)
+
+    def clear(self):
+        for cell in self.cells:
+            cell.clear()
+        self._where.clear()
+        self._seq.clear()
+
+    def query_rect(self, rect):
+        # rect 와 같은 칸에 있는 후보 (순서 없음). 한 칸이면 그 칸의 set 을 그대로 돌려주므로 수정 금지
+        x0, y0, x1, y1 = self._cell_range(rect)
+        cells = self.cells
+        cols = self.cols
+        if x0 == x1 and y0 == y1:
+            return cells[y0 * cols + x0]
+        found = set()
+        for cy in range(y0, y1 + 1):
+            row = cy * cols
+            for cx in range(x0, x1 + 1):
+                found.update(cells[row + cx])
+        return found
+
+    def collide_rect(self, rect, test=None):
+        # 같은 칸 후보 중 rect 가 겹치고 test(narrowphase) 를 통과한 것을 삽입 순서대로
+        candidates = self.query_rect(rect)
+        if not candidates:
+            return []
+        colliderect = rect.colliderect
+        hits = [s for s in candidates if colliderect(s.rect)]
+        if test is not None and hits:
+            hits = [s for s in hits if test(s)]
+        if len(hits) > 1:
+            hits.sort(key=self._seq.__getitem__)
+        return hits
+
+    def collide(self, sprite, collided=None):
+        if collided is None:
+            return self.collide_rect(sprite.rect)
+        return self.collide_rect(sprite.rect, lambda s: collided(sprite, s))
+
+    def query_circles(self, centers, radius):
+        """여러 원(중심 목록, 같은 반지름) 안에 중심이 들어오는 스프라이트를 한 번에 찾는다.
+
+        후보는 모든 원의 외접 사각형이 걸친 칸에서 한 번만 모으고, 각 후보의 중심을 한 번씩
+        읽어 모든 원과 제곱 거리로 비교한다. 원마다 삽입 순서대로 정렬된 목록을 돌려준다.
+        """
+        results = [[] for _ in centers]
+        if not centers:
+            return results
+        span = pygame.Rect(0, 0, 2 * radius + 1, 2 * radius + 1)
+        candidates = set()
+        for cx, cy in centers:
+            span.center = (cx, cy)
+            found = self.query_rect(span)
+            if found:
+                candidates.update(found)
+        if not candidates:
+            return results
+        r2 = radius * radius
+        indexed = list(enumerate(centers))
+        for s in candidates:
+            sx, sy = s.rect.center
+            for i, (cx, cy) in indexed:
+                dx = cx - sx
+                dy = cy - sy
+                if dx * dx + dy * dy <= r2:
+                    results[i].append(s)
+        seq = self._seq.__getitem__
+        for hits in results:
+            if len(hits) > 1:
+                hits.sort(key=seq)
+        return results
+
+    def query_circle(self, center, radius):
+        return self.query_circles([center], radius)[0]
+
+
+# pygame.sprite.spritecollide / groupcollide 와 같은 결과를 돌려주는 대체 함수.
+# collided 는 rect 가 겹칠 때만 참이 되는 함수여야 한다 (collide_rect, collide_mask 등).
+
+def spritecollide(sprite, group, dokill, collided=None):
+    # 스프라이트 하나에 대한 질의는 격자를 갱신하는 비용(그룹 전체를 파이썬에서 순회)을
+    # 되찾을 수 없으므로, C 로 도는 collidelistall 로 rect 가 겹치는 것만 고른 뒤 narrowphase
+    members = group.sprites()
+    hits = [members[i] for i in sprite.rect.collidelistall([s.rect for s in members])]
+    if collided is not None and hits:
+        hits = [s for s in hits if collided(sprite, s)]
+    if dokill:
+        for s in hits:
+            s.kill()
+    return hits
+
+
+def groupcollide(groupa, groupb, dokilla, dokillb, collided=None, index=None):
+    if index is None:
+        index = SpatialHash()
+    index.sync(groupb)
+    crashed = {}
+    for a in groupa.sprites():
+        hits = index.collide(a, collided)
+        if hits:
+            crashed[a] = hits
+            if dokillb:
+                for b in hits:
+                    b.kill()
+                    index.remove(b)
+            if dokilla:
+                a.kill()
+    return crashed
@@ -0,0 +1,115 @@
+"""시작 시간 측정: 프로세스 시작 -> 첫 메뉴 프레임 / 첫 게임 프레임.
+
+shooting_game.py 가 다른 무엇보다 먼저 import 해서 기준 시각을 잡고, 시작 과정의 각 단계가 끝날 때
+mark(이름) 을 부른다. 같은 이름은 처음 한 번만 기록한다. report=True 인 지점(첫 메뉴 / 첫 게임 프레임)에서는
+그때까지의 단계별 시간을 한 줄로 출력한다 (STARTUP_REPORT):
+
+    startup: menu frame 412 ms (interpreter 38 + imports 160 + display 55 + menu 159)
+
+interpreter 는 프로세스가 시작된 뒤 이 모듈이 import 되기까지 (파이썬 초기화, PyInstaller 압축 풀기).
+프로세스 시작 시각은 OS 에서 읽는다 (Linux /proc, Windows GetProcessTimes). PyInstaller onefile 은
+부트로더(부모 프로세스)가 압축을 푼 뒤 자식 프로세스를 띄우므로 부모 프로세스의 시작 시각을 쓴다.
+읽을 수 없으면 interpreter 없이 이 모듈을 import 한 시각부터 잰다.
+"""
+import os
+import sys
+import time
+
+from game.settings import STARTUP_REPORT
+
+_t0 = time.perf_counter()
+
+
+def _linux_age(pid):
+    # /proc/<pid>/stat 22번째 필드: 부팅 후 프로세스 시작 시각 (clock tick)
+    with open(f"/proc/{pid}/stat") as f:
+        stat = f.read()
+    fields = stat[stat.rindex(")") + 2:].split()
+    started = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    with open("/proc/uptime") as f:
+        uptime = float(f.read().split()[0])
+    return uptime - started
+
+
+def _windows_age(pid):
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.windll.kernel32
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    if pid == os.getpid():
+        handle = kernel32.GetCurrentProcess()
+    else:
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            raise OSError("OpenProcess")
+    created, exited, kernel, user, now = (wintypes.FILETIME() for _ in range(5))
+    try:
+        if not kernel32.GetProcessTimes(handle, ctypes.byref(created), ctypes.byref(exited),
+                                        ctypes.byref(kernel), ctypes.byref(user)):
+            raise OSError("GetProcessTimes")
+    finally:
+        if pid != os.getpid():
+            kernel32.CloseHandle(handle)
+    kernel32.GetSystemTimeAsFileTime(ctypes.byref(now))
+
+    def ticks(ft):  # 100 ns 단위
+        return (ft.dwHighDateTime << 32) | ft.dwLowDateTime
+
+    return (ticks(now) - ticks(created)) / 1e7
+
+
+def _is_onefile():
+    # onefile 은 임시 폴더에 풀어서 실행하므로 _MEIPASS 가 실행 파일 폴더와 다르다
+    meipass = getattr(sys, "_MEIPASS", None)
+    return bool(getattr(sys, "frozen", False) and meipass
+                and os.path.normcase(os.path.abspath(meipass)) != os.path.normcase(os.path.dirname(os.path.abspath(sys.executable))))
+
+
+def process_age():
+    """프로세스가 시작된 뒤 지난 초 (onefile 이면 부트로더 기준). 알 수 없으면 None."""
+    pid = os.getppid() if _is_onefile() else os.getpid()
+    try:
+        if sys.platform.startswith("linux"):
+            return _linux_age(pid)
+        if sys.platform == "win32":
+            return _windows_age(pid)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    return None
+
+
+_age = process_age()
+# 이름 -> 프로세스 시작부터 ms (기록한 순서대로)
+_marks = {"interpreter": _age * 1000} if _age is not None else {}
+_base_ms = _age * 1000 if _age is not None else 0.0
+
+
+def elapsed_ms():
+    """프로세스 시작부터 지금까지 ms (시작 시각을 모르면 이 모듈 import 부터)."""
+    return _base_ms + (time.perf_counter() - _t0) * 1000
+
+
+def mark(name, report=False):
+    # 단계 name 이 끝난 시각을 처음 한 번만 기록. report 면 단계별 시간과 함께 출력
+    if name in _marks:
+        return
+    _marks[name] = elapsed_ms()
+    if report and STARTUP_REPORT:
+        print(f"startup: {summary(name)}")
+
+
+def marks():
+    return dict(_marks)
+
+
+def summary(name):
+    # "menu frame 412 ms (interpreter 38 + imports 160 + ...)" — name 까지의 단계별 구간
+    parts = []
+    prev = 0.0
+    for key, at in _marks.items():
+        parts.append(f"{key} {at - prev:.0f}")
+        prev = at
+        if key == name:
+            break
+    return f"{name} {_marks[name]:.0f} ms ({' + '.join(parts)})"
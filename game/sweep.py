@@ -0,0 +1,242 @@
+"""난이도/밸런스 일괄 시뮬레이션.
+
+    python -m game.sweep                                  # 기본 격자, 설정마다 20판
+    python -m game.sweep --games 200 -j 8 --shoot-prob 0.15,0.25 --per-round 30,50 -o sweep.csv
+    python -m game.sweep --max-minutes 2 --bullet-speed 2-3,3-4.5 --drop 0.05,0.12
+
+스크립트 봇(bot_inputs)이 판마다 다른 시드로 헤드리스 World 를 끝까지(또는 시간 제한까지) 돌린다.
+(설정, 시드) 하나가 작업 하나이고 multiprocessing 프로세스 풀로 코어 수만큼 나눠 돌린다.
+워커는 시작할 때 이미지를 한 번만 읽는다. 결과는 설정별로 생존 시간/라운드당 처치 수/틱 비용을
+모아 표로 출력하고 CSV(+ 같은 이름의 .json 에 판별 결과)로 저장한다.
+"""
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from game.projectiles import ENEMY_BULLET
+from game.settings import SCREEN_WIDTH, PLAYER_WIDTH, FRAME_MS
+from game.world import World, Inputs, DEFAULT_TUNING, EVENT_GAME_OVER
+
+OUTPUT_FILE = "sweep_results.csv"
+
+# 봇 파라미터
+DODGE_RANGE = 160      # 플레이어 위로 이 거리 안의 적 총알만 피한다
+DODGE_WIDTH = 36       # 플레이어 중심에서 가로로 이 거리 안이면 위협
+AIM_DEADZONE = 6
+FIRE_EVERY = 6         # 몇 틱마다 쏠지 (봇의 세기를 정하는 설정일 뿐, 게임에 발사 쿨다운은 없음)
+
+
+def bot_inputs(world, tick):
+    """간단한 스크립트 봇: 위에서 떨어지는 적 총알을 피하고, 아니면 가장 아래쪽 적 밑으로 가서 쏜다.
+
+    World 상태만 보고 결정하므로 같은 시드면 같은 판이 나온다.
+    """
+    player = world.player
+    px = player.rect.centerx
+    top = player.rect.top
+
+    # 1) 회피: 위험한 적 총알/떨어지는 적의 가로 평균에서 멀어지는 쪽으로
+    bx, by = world.projectiles.centers(ENEMY_BULLET)
+    near = [e.rect for e in world.enemies if e.rect.bottom > top - DODGE_RANGE]
+    if near:
+        bx = np.concatenate([bx, [r.centerx for r in near]])
+        by = np.concatenate([by, [r.bottom for r in near]])
+    if bx.size:
+        reach = DODGE_WIDTH + (PLAYER_WIDTH // 2 if near else 0)
+        threat = (by > top - DODGE_RANGE) & (by < player.rect.bottom + 20) & (abs(bx - px) < reach)
+        if threat.any():
+            away = px - float(bx[threat].mean())
+            if away == 0:
+                away = 1 if px < SCREEN_WIDTH / 2 else -1
+            # 화면 끝에 몰렸으면 반대로
+            if px < DODGE_WIDTH:
+                away = 1
+            elif px > SCREEN_WIDTH - DODGE_WIDTH:
+                away = -1
+            return Inputs(away < 0, away > 0, tick % FIRE_EVERY == 0)
+
+    # 2) 조준: 가장 아래쪽(가까운) 적
+    target = None
+    for enemy in world.enemies:
+        if target is None or enemy.rect.bottom > target.rect.bottom:
+            target = enemy
+    if target is None:
+        return Inputs(False, False, tick % FIRE_EVERY == 0)
+    dx = target.rect.centerx - px
+    return Inputs(dx < -AIM_DEADZONE, dx > AIM_DEADZONE, tick % FIRE_EVERY == 0)
+
+
+def play_game(images, tuning, seed, max_ticks):
+    """봇으로 한 판. 게임 오버나 max_ticks 까지 돌리고 결과 dict 를 돌려준다."""
+    world = World(images, seed=seed, tuning=tuning)
+    clock = time.perf_counter_ns
+    tick_ns = []
+    over = False
+    for tick in range(max_ticks):
+        inputs = bot_inputs(world, tick)
+        t0 = clock()
+        events = world.step(inputs, FRAME_MS)
+        tick_ns.append(clock() - t0)
+        if EVENT_GAME_OVER in events:
+            over = True
+            break
+    ticks = len(tick_ns)
+    tick_ms = sorted(v / 1e6 for v in tick_ns)
+    return {
+        "seed": seed,
+        "ticks": ticks,
+        "survival_s": ticks * FRAME_MS / 1000,
+        "game_over": over,
+        "rounds": world.round_num,
+        "kills": world.total_kills,
+        "kills_per_round": world.total_kills / world.round_num,
+        "tick_mean_ms": sum(tick_ms) / ticks if ticks else 0.0,
+        "tick_p95_ms": tick_ms[min(ticks - 1, int(ticks * 0.95))] if ticks else 0.0,
+    }
+
+
+# --- 워커 --------------------------------------------------------------------
+
+_images = None
+
+
+def _init_worker():
+    # 워커마다 한 번: 이미지 로드. 디스플레이를 초기화하지 않으므로 convert 없이 원본 Surface 를 쓰고,
+    # SDL 이 SIGTERM 핸들러를 걸지 않아 풀 종료 때 워커가 남지 않는다.
+    global _images
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+    from game.assets import load_images
+
+    _images = load_images()
+
+
+def _run_job(job):
+    index, tuning, seed, max_ticks = job
+    # 프로세스 사이로는 namedtuple 대신 일반 tuple 로 보낸다
+    result = play_game(_images, DEFAULT_TUNING._make(tuning), seed, max_ticks)
+    result["config"] = index
+    return result
+
+
+# --- 격자 / 집계 ---------------------------------------------------------------
+
+def _floats(text):
+    return [float(v) for v in text.split(",") if v]
+
+
+def _ints(text):
+    return [int(v) for v in text.split(",") if v]
+
+
+def _ranges(text):
+    # "2-3,3-4.5" -> [(2.0, 3.0), (3.0, 4.5)]
+    out = []
+    for part in text.split(","):
+        lo, _, hi = part.partition("-")
+        out.append((float(lo), float(hi or lo)))
+    return out
+
+
+def build_grid(shoot_probs, bullet_speeds, enemy_speeds, per_rounds, drops):
+    return [
+        DEFAULT_TUNING._replace(
+            enemy_shoot_prob=shoot, enemy_bullet_min_speed=lo, enemy_bullet_max_speed=hi,
+            initial_enemy_speed=speed, enemies_per_round=per_round, powerup_drop_prob=drop,
+        )
+        for shoot, (lo, hi), speed, per_round, drop
+        in itertools.product(shoot_probs, bullet_speeds, enemy_speeds, per_rounds, drops)
+    ]
+
+
+def summarize(tuning, games):
+    survival = [g["survival_s"] for g in games]
+    return {
+        **tuning._asdict(),
+        "games": len(games),
+        "game_over_rate": sum(g["game_over"] for g in games) / len(games),
+        "survival_mean_s": statistics.fmean(survival),
+        "survival_median_s": statistics.median(survival),
+        "survival_min_s": min(survival),
+        "rounds_mean": statistics.fmean(g["rounds"] for g in games),
+        "kills_per_round": statistics.fmean(g["kills_per_round"] for g in games),
+        "tick_mean_ms": statistics.fmean(g["tick_mean_ms"] for g in games),
+        "tick_p95_ms": max(g["tick_p95_ms"] for g in games),
+    }
+
+
+def print_table(rows):
+    print(f"{'shoot':>6} {'bullet':>9} {'espd':>5} {'round':>5} {'drop':>5} |"
+          f" {'games':>5} {'over%':>6} {'surv s':>7} {'med s':>7} {'rounds':>6} {'k/rnd':>6} {'tick ms':>8} {'p95':>6}")
+    for r in rows:
+        bullet = f"{r['enemy_bullet_min_speed']:g}-{r['enemy_bullet_max_speed']:g}"
+        print(f"{r['enemy_shoot_prob']:6.3g} {bullet:>9} {r['initial_enemy_speed']:5g} {r['enemies_per_round']:5d}"
+              f" {r['powerup_drop_prob']:5.3g} | {r['games']:5d} {r['game_over_rate'] * 100:5.1f}%"
+              f" {r['survival_mean_s']:7.1f} {r['survival_median_s']:7.1f} {r['rounds_mean']:6.2f}"
+              f" {r['kills_per_round']:6.1f} {r['tick_mean_ms']:8.3f} {r['tick_p95_ms']:6.2f}")
+
+
+def main(argv=None):
+    t = DEFAULT_TUNING
+    parser = argparse.ArgumentParser(description="봇으로 난이도/밸런스 격자를 일괄 시뮬레이션")
+    parser.add_argument("--games", type=int, default=20, help="설정마다 판 수 (시드 seed..seed+games-1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-minutes", type=float, default=5.0, help="한 판 최대 게임 시간")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="워커 프로세스 수 (0: CPU 수)")
+    parser.add_argument("--shoot-prob", type=_floats, default=[t.enemy_shoot_prob])
+    parser.add_argument("--bullet-speed", type=_ranges,
+                        default=[(t.enemy_bullet_min_speed, t.enemy_bullet_max_speed)], help="min-max,...")
+    parser.add_argument("--enemy-speed", type=_floats, default=[t.initial_enemy_speed])
+    parser.add_argument("--per-round", type=_ints, default=[t.enemies_per_round])
+    parser.add_argument("--drop", type=_floats, default=[t.powerup_drop_prob])
+    parser.add_argument("-o", "--output", default=OUTPUT_FILE)
+    args = parser.parse_args(argv)
+
+    grid = build_grid(args.shoot_prob, args.bullet_speed, args.enemy_speed, args.per_round, args.drop)
+    max_ticks = int(args.max_minutes * 60_000 / FRAME_MS)  # play_game 은 FRAME_MS 씩 진행
+    jobs = [(i, tuple(tuning), args.seed + g, max_ticks)
+            for i, tuning in enumerate(grid) for g in range(args.games)]
+    workers = min(args.jobs or os.cpu_count() or 1, len(jobs))
+    print(f"{len(grid)} configs x {args.games} games = {len(jobs)} games on {workers} processes")
+
+    per_config = [[] for _ in grid]
+    t0 = time.perf_counter()
+    # spawn: 부모의 pygame 상태를 물려받지 않도록 (Windows 와 같은 방식)
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(workers, initializer=_init_worker) as pool:
+        chunksize = max(1, len(jobs) // (workers * 8))
+        for done, result in enumerate(pool.imap_unordered(_run_job, jobs, chunksize), 1):
+            per_config[result["config"]].append(result)
+            if done % max(1, len(jobs) // 10) == 0:
+                print(f"  {done}/{len(jobs)} games ({time.perf_counter() - t0:.1f}s)")
+        pool.close()
+        pool.join()
+    elapsed = time.perf_counter() - t0
+
+    rows = [summarize(tuning, games) for tuning, games in zip(grid, per_config)]
+    print_table(rows)
+    sim_seconds = sum(g["survival_s"] for games in per_config for g in games)
+    print(f"{len(jobs)} games, {sim_seconds / 60:.1f} game-minutes in {elapsed:.1f}s "
+          f"({sim_seconds / elapsed if elapsed else 0:.0f}x real time)")
+
+    with open(args.output, "w", newline="", encoding="utf-8") as fp:
+        writer = csv.DictWriter(fp, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    games_path = os.path.splitext(args.output)[0] + ".json"
+    with open(games_path, "w", encoding="utf-8") as fp:
+        json.dump({"configs": rows, "games": per_config}, fp, indent=1)
+    print(f"saved {args.output}, {games_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
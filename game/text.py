@@ -0,0 +1,52 @@
+import os
+from functools import lru_cache
+
+import pygame
+
+# 렌더링된 문자열 Surface 캐시 크기 (HUD 숫자 + 메뉴 문구 정도면 충분)
+TEXT_CACHE_SIZE = 256
+
+
+# Windows 기본 한글 폰트 파일 (있으면 SysFont 의 시스템 폰트 목록 훑기를 건너뜀 — 첫 메뉴 프레임이 빨라짐)
+KOREAN_FONT_FILE = os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts", "malgun.ttf")
+
+
+# 한글 폰트 선택 (Windows 기본 한글 폰트 시도, 실패하면 기본 폰트)
+# SysFont 는 시스템 폰트 목록을 훑기 때문에 크기별로 한 번만 찾는다
+@lru_cache(maxsize=None)
+def get_korean_font(size):
+    if os.path.isfile(KOREAN_FONT_FILE):
+        try:
+            return pygame.font.Font(KOREAN_FONT_FILE, size)
+        except (pygame.error, OSError):
+            pass
+    try:
+        return pygame.font.SysFont("malgungothic", size)
+    except Exception:
+        try:
+            return pygame.font.SysFont("맑은 고딕", size)
+        except Exception:
+            return pygame.font.Font(None, size)
+
+
+# (text, size, color) 별로 렌더링 결과를 LRU 캐시 — 반환된 Surface 는 공유되므로 blit 만 할 것
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def render_text(text, size, color):
+    return get_korean_font(size).render(text, True, color)
+
+
+class HudText:
+    """값이 바뀔 때만 다시 렌더링하는 HUD 문자열 (예: "체력: {}")."""
+
+    def __init__(self, fmt, size, color):
+        self.fmt = fmt
+        self.size = size
+        self.color = tuple(color)
+        self._value = object()
+        self._surface = None
+
+    def render(self, value):
+        if value != self._value:
+            self._value = value
+            self._surface = render_text(self.fmt.format(value), self.size, self.color)
+        return self._surface
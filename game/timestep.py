@@ -0,0 +1,34 @@
+from game.settings import SIM_HZ, MAX_FRAME_MS
+
+
+class FixedTimestep:
+    """고정 주기 시뮬레이션용 시간 누산기.
+
+    advance(frame_ms) 에 실제로 흐른 시간을 넣으면 이번 프레임에 돌려야 할 틱 수를 돌려준다.
+    남은 시간은 다음 프레임으로 넘기고, alpha(0~1) 는 지난 틱과 다음 틱 사이 어디를
+    그려야 하는지(렌더 보간 비율)를 나타낸다.
+    """
+
+    def __init__(self, hz=SIM_HZ, max_frame_ms=MAX_FRAME_MS):
+        self.hz = hz
+        self.step_ms = 1000 / hz
+        self.max_frame_ms = max_frame_ms
+        self.accumulator = 0.0
+        self.dropped_ms = 0.0  # max_frame_ms 로 잘라낸 시간 합계
+
+    def reset(self):
+        # 메뉴 등으로 멈춰 있던 시간은 버림
+        self.accumulator = 0.0
+
+    def advance(self, frame_ms):
+        if frame_ms > self.max_frame_ms:
+            self.dropped_ms += frame_ms - self.max_frame_ms
+            frame_ms = self.max_frame_ms
+        self.accumulator += frame_ms
+        ticks = int(self.accumulator // self.step_ms)
+        self.accumulator -= ticks * self.step_ms
+        return ticks
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step_ms
@@ -0,0 +1,408 @@
+import math
+import random
+from collections import namedtuple
+
+import pygame
+
+from game.settings import (
+    SCREEN_WIDTH, INITIAL_ENEMY_SPEED, ENEMIES_PER_ROUND, POWERUP_DROP_PROB,
+    EXPLOSION_RADIUS, FRAME_MS, BULLET_SPEED, LOW_ENEMY_BULLET_CAP, LOW_PLAYER_SHOT_CAP,
+    ENEMY_SHOOT_PROB, ENEMY_BULLET_MIN_SPEED, ENEMY_BULLET_MAX_SPEED,
+)
+from game import hitbox
+from game.entities import Player, Enemy, PowerUp
+from game.projectiles import Projectiles, BULLET, BOMB, ENEMY_BULLET
+from game.formation import Formation
+from game.spatial import SpatialHash, spritecollide
+from game.pool import SpritePool
+from game.enemy_variants import EnemyVariants
+from game.fire_scheduler import FireScheduler
+
+# 한 틱 동안의 입력 (좌/우 이동은 누르고 있는지, fire 는 이번 틱에 SPACE 가 눌렸는지)
+# quality: 품질 단계 (game.governor). 시뮬레이션에 영향을 주는 단계(충돌 판정, 탄 개수)라서
+# 입력과 같이 틱마다 넘기고 리플레이에도 같이 기록한다
+Inputs = namedtuple("Inputs", ["left", "right", "fire", "quality"], defaults=(0,))
+NO_INPUT = Inputs(False, False, False)
+
+# 품질 단계 (값이 클수록 가벼움, 앞 단계의 조치를 모두 포함)
+QUALITY_HIGH = 0          # 타입별 히트박스 그대로 (마스크 히트박스 포함)
+QUALITY_COARSE = 1        # 마스크 히트박스도 사각형으로
+QUALITY_STATIC_BG = 2     # + 배경 스크롤 멈춤 (그리기 쪽)
+QUALITY_LOW_CAPS = 3      # + 파티클 / 적 총알 / 플레이어 탄 최대 개수 낮춤
+
+# QUALITY_COARSE 에서 마스크 히트박스 대신 쓰는 사각형 크기 (이미지 사각형 대비)
+COARSE_RATIO = 0.8
+_collide_coarse = hitbox.collide_coarse(COARSE_RATIO)
+
+# 난이도/밸런스 값 (기본값은 settings). 밸런스 스윕(game.sweep)에서 World 마다 바꿔 넣는다
+Tuning = namedtuple("Tuning", [
+    "enemy_shoot_prob", "enemy_bullet_min_speed", "enemy_bullet_max_speed",
+    "initial_enemy_speed", "enemies_per_round", "powerup_drop_prob",
+])
+DEFAULT_TUNING = Tuning(
+    ENEMY_SHOOT_PROB, ENEMY_BULLET_MIN_SPEED, ENEMY_BULLET_MAX_SPEED,
+    INITIAL_ENEMY_SPEED, ENEMIES_PER_ROUND, POWERUP_DROP_PROB,
+)
+
+# step() 이 돌려주는 이벤트
+EVENT_ROUND = "round"          # 라운드 증가 (라운드 메시지 표시)
+EVENT_GAME_OVER = "game_over"  # 플레이어 체력 0
+
+
+class World:
+    """게임 시뮬레이션 상태. 디스플레이 없이 step() 만으로 진행된다."""
+
+    def __init__(self, images, seed=None, tuning=DEFAULT_TUNING, players=1):
+        self.images = images
+        self.seed = seed
+        self.tuning = tuning
+        self.num_players = players  # 협동 플레이 인원 (game.server). step 에 플레이어별 입력을 넘긴다
+        # 렌더 보간을 쓰는 쪽(게임 화면)만 켬 — 헤드리스 실행에서는 위치 기록 비용을 아낌
+        self.track_motion = False
+        # 단계별 시간 측정 (game.profiler.FrameProfiler). 꺼져 있으면 None
+        self.profiler = None
+        # 탄 배열과 파워업 풀은 reset 해도 그대로 두고 재사용
+        self.projectiles = Projectiles()
+        self.powerup_pool = SpritePool(PowerUp)
+        # 적 이미지/마스크 변형 캐시
+        self.enemy_variants = EnemyVariants(images.get("weak_enemy"), prebuilt=images.get("enemy_variants"))
+        # 적 발사 예약 힙
+        self.fire_scheduler = FireScheduler()
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed = seed
+        self.rng = random.Random(self.seed)
+        self.time_ms = 0.0
+        self.tick = 0
+        # 이번 틱 이동량 배율 (속도 값은 FRAME_MS 한 틱 기준, 120Hz 면 0.5)
+        self.tick_scale = 1.0
+        # 렌더 보간용: 직전 틱 시작 시점의 스프라이트 위치 {sprite: (x, y)} (track_motion 일 때만)
+        self.prev_positions = {}
+
+        # 이전 판의 파워업은 풀로 돌려보냄
+        for powerup in list(getattr(self, "powerups", ())):
+            powerup.kill()
+        self.all_sprites = pygame.sprite.Group()
+        self.enemies = pygame.sprite.Group()
+        self.powerups = pygame.sprite.Group()
+        self.formations = []
+        self.fire_scheduler.clear()
+        # 플레이어 총알 / 폭탄 / 적 총알 (Sprite 가 아닌 배열 기반)
+        self.projectiles.clear()
+
+        # 총알/폭탄 -> 적 충돌용 broadphase 격자 (프레임 간 증분 갱신)
+        self.enemy_grid = SpatialHash()
+
+        # 적/파워업마다 붙이는 번호 (네트워크 스냅숏에서 같은 개체를 알아보는 용도)
+        self.next_id = 0
+
+        self.players = [Player(self, i, self.num_players) for i in range(self.num_players)]
+        self.player = self.players[0]
+        self.all_sprites.add(self.players)
+
+        self.enemies_killed = 0
+        self.total_kills = 0      # 라운드와 상관없이 누적 (통계용)
+        self.sounds = []          # 이번 틱에 낼 효과음 이름 (game.audio 가 재생, 헤드리스에서는 무시)
+        self.effects = []         # 이번 틱의 파티클 효과 (종류, x, y) (game.particles)
+        self.quality = QUALITY_HIGH
+        self.round_num = 1
+        self.enemies_per_round = self.tuning.enemies_per_round
+        self.enemy_speed = self.tuning.initial_enemy_speed
+
+        # 편대 스타일로 초기화
+        self.create_initial_formations()
+
+    # --- 생성 -------------------------------------------------------------
+
+    def create_formation(self, cols=6, rows=3, start_x=None, start_y=60, pattern=None, h_spacing=70, v_spacing=60):
+        rng = self.rng
+        if start_x is None:
+            start_x = (SCREEN_WIDTH - (cols-1)*h_spacing) // 2
+        f = Formation(start_x, start_y, cols, rows, h_spacing=h_spacing, v_spacing=v_spacing, pattern=pattern)
+        members = []
+        for r in range(rows):
+            for c in range(cols):
+                # 패턴에 따라 적 타입을 지정할 수 있음
+                if pattern and r < len(pattern) and c < len(pattern[r]):
+                    etype = pattern[r][c]
+                else:
+                    # 중앙은 강한 적 배치 예시
+                    if r == 0 and c in (cols//2 - 1, cols//2):
+                        etype = "strong"
+                    elif r == rows-1 and rng.random() < 0.6:
+                        etype = "weak"
+                    else:
+                        etype = rng.choice(["weak", "mid"])
+                offset_x = c * f.h_spacing
+                offset_y = r * f.v_spacing
+                members.append(Enemy(self, enemy_type=etype, formation=f, offset_x=offset_x, offset_y=offset_y))
+        # 편대 전체를 한 번에 추가 / 발사 예약
+        self.add_enemies(members)
+        self.formations.append(f)
+        return f
+
+    def create_initial_formations(self):
+        self.formations.clear()
+        # 중앙 대형을 작게: cols/rows 축소하여 적 수 줄임
+        self.create_formation(cols=5, rows=2, start_y=40)
+        # 좌/우 보조 편대는 하나로 줄이거나 제거
+        self.create_formation(cols=3, rows=1, start_x=60, start_y=-40)
+
+    def create_individual_enemy(self):
+        self.add_enemy(Enemy(self, enemy_type=self.rng.choice(["weak", "mid"]), formation=None))
+
+    def create_enemies(self, num_enemies):
+        self.add_enemies([Enemy(self) for _ in range(num_enemies)])
+
+    def create_powerup(self, x, y):
+        power_type = self.rng.choice(["double_bullet", "bomb_bullet"])
+        powerup = self.powerup_pool.acquire(x, y, power_type, self)
+        powerup.net_id = self.new_id()
+        self.all_sprites.add(powerup)
+        self.powerups.add(powerup)
+
+    def enemies_in_radius(self, centers, radius):
+        # 중심 목록 각각에 대해 반경 안(적의 중심 기준)에 있는 적 목록 — 그룹 순서 유지
+        self.enemy_grid.sync(self.enemies)
+        return self.enemy_grid.query_circles(centers, radius)
+
+    def new_id(self):
+        self.next_id += 1
+        return self.next_id
+
+    def target_player(self, x):
+        # 적이 노릴 플레이어: 혼자면 그 플레이어, 여럿이면 살아있는 플레이어 중 가로로 가장 가까운 쪽
+        if len(self.players) == 1:
+            return self.player
+        alive = [p for p in self.players if p.health > 0]
+        if not alive:
+            return None
+        return min(alive, key=lambda p: abs(p.rect.centerx - x))
+
+    def add_enemy(self, enemy):
+        enemy.net_id = self.new_id()
+        self.all_sprites.add(enemy)
+        self.enemies.add(enemy)
+        self.fire_scheduler.schedule(enemy, enemy.next_shot_time)
+
+    def add_enemies(self, enemies):
+        for enemy in enemies:
+            enemy.net_id = self.new_id()
+        self.all_sprites.add(enemies)
+        self.enemies.add(enemies)
+        self.fire_scheduler.schedule_many([(enemy, enemy.next_shot_time) for enemy in enemies])
+
+    def add_enemy_bullet(self, x, y, target_x, target_y, speed=4):
+        # (x, y) 에서 (target_x, target_y) 방향으로 날아가는 적 총알 (최저 품질에서는 개수 제한)
+        if self.quality >= QUALITY_LOW_CAPS and self.projectiles.count(ENEMY_BULLET) >= LOW_ENEMY_BULLET_CAP:
+            return None
+        dx = target_x - x
+        dy = target_y - y
+        dist = math.hypot(dx, dy) or 1
+        return self.projectiles.spawn_centered(ENEMY_BULLET, x, y, dx / dist * speed, dy / dist * speed)
+
+    def player_shots_capped(self):
+        # 최저 품질에서는 플레이어 총알 + 폭탄 개수 제한
+        proj = self.projectiles
+        return self.quality >= QUALITY_LOW_CAPS and proj.count(BULLET) + proj.count(BOMB) >= LOW_PLAYER_SHOT_CAP
+
+    def add_bullet(self, x, y):
+        if self.player_shots_capped():
+            return None
+        return self.projectiles.spawn_at(BULLET, x, y, 0, -BULLET_SPEED)
+
+    def add_bomb(self, x, y):
+        if self.player_shots_capped():
+            return None
+        return self.projectiles.spawn_at(BOMB, x, y, 0, -BULLET_SPEED)
+
+    def fire(self, player=None):
+        if player is None:
+            player = self.player
+        if self.player_shots_capped():
+            return  # 소리도 내지 않음
+        if player.bomb_bullet:
+            self.add_bomb(player.rect.centerx, player.rect.top)
+            self.sounds.append("bomb")
+        else:
+            self.sounds.append("shot")
+            self.add_bullet(player.rect.centerx, player.rect.top)
+            if player.double_bullet:
+                self.add_bullet(player.rect.centerx - 20, player.rect.top)
+
+    # --- 한 틱 진행 ----------------------------------------------------------
+
+    def step(self, inputs=NO_INPUT, dt=FRAME_MS):
+        """입력 한 틱을 적용하고 시뮬레이션을 dt(ms) 만큼 진행한다. 발생한 이벤트 목록을 돌려준다.
+
+        inputs 는 Inputs 하나(1P) 또는 플레이어 수만큼의 Inputs 목록.
+        """
+        self.handle_input(inputs)
+        self.update(dt)
+        return self.collide()
+
+    def handle_input(self, inputs):
+        # 틱의 첫 단계: 지난 틱 효과음 / 파티클 효과 비우기
+        self.sounds.clear()
+        self.effects.clear()
+        if isinstance(inputs, Inputs):
+            inputs = (inputs,)
+        self.quality = inputs[0].quality
+        for player, controls in zip(self.players, inputs):
+            player.controls = controls
+            if controls.fire and player.health > 0:
+                self.fire(player)
+        if self.profiler is not None:
+            self.profiler.lap("input")
+
+    def update(self, dt=FRAME_MS):
+        self.time_ms += dt
+        self.tick += 1
+        self.tick_scale = dt / FRAME_MS
+        prof = self.profiler
+        if self.track_motion:
+            self.prev_positions = {s: s.rect.topleft for s in self.all_sprites.spritedict}
+        self.all_sprites.update()
+        if prof is not None:
+            prof.lap("update_sprites")
+        self.projectiles.update(self.tick_scale)
+        if prof is not None:
+            prof.lap("update_projectiles")
+        # formations 업데이트 (편대 전체 이동 처리)
+        for f in list(self.formations):
+            f.update(self.tick_scale)
+        if prof is not None:
+            prof.lap("update_formations")
+        self.fire_enemies()
+        if prof is not None:
+            prof.lap("enemy_fire")
+
+    def fire_enemies(self):
+        # 발사 시각이 된 적만 힙에서 꺼내 한 번에 쏘고, 다음 발사 시각을 한 번에 다시 예약
+        now = self.time_ms
+        scheduler = self.fire_scheduler
+        due = scheduler.pop_due(now)
+        if due:
+            scheduler.schedule_many([(enemy, enemy.shoot(now)) for enemy in due])
+        scheduler.compact(len(self.enemies))
+
+    def collide(self):
+        events = []
+        player = self.player
+        prof = self.profiler
+        precise = self.quality < QUALITY_COARSE
+
+        # Check for bullet-enemy collisions (적 히트박스 vs 총알 사각형)
+        self.enemy_grid.sync(self.enemies)
+        hits = self.projectiles.collide_grid(BULLET, self.enemy_grid, True, precise, COARSE_RATIO)
+        for bullet, hit_enemies in hits.items():
+            for enemy in hit_enemies:
+                enemy.health -= 1
+                if enemy.health > 0:
+                    self.sounds.append("hit")
+                    self.effects.append(("hit", enemy.rect.centerx, enemy.rect.bottom))
+                else:
+                    enemy.kill()
+                    self.sounds.append("explosion")
+                    self.effects.append(("explosion", *enemy.rect.center))
+                    self.enemies_killed += 1
+                    self.total_kills += 1
+                    if self.rng.random() < self.tuning.powerup_drop_prob:
+                        self.create_powerup(enemy.rect.centerx, enemy.rect.centery)
+                    if self.enemies_killed < self.enemies_per_round:
+                        self.create_individual_enemy()
+        if prof is not None:
+            prof.lap("collide_bullets")
+
+        # Check for bomb-enemy collisions
+        self.enemy_grid.sync(self.enemies)
+        bomb_hits = self.projectiles.collide_grid(BOMB, self.enemy_grid, True, precise, COARSE_RATIO)
+        # 이번 프레임에 터진 폭탄들의 폭발 범위를 한 번에 질의
+        centers = [self.projectiles.rect(bomb).center for bomb in bomb_hits]
+        blasts = self.enemies_in_radius(centers, EXPLOSION_RADIUS)
+        for center, in_range in zip(centers, blasts):
+            self.effects.append(("bomb", *center))
+            # 폭발 범위 내 적은 체력 감소 (앞선 폭탄에 이미 죽은 적은 건너뜀)
+            for enemy in in_range:
+                if not enemy.alive():
+                    continue
+                enemy.health -= 2
+                if enemy.health <= 0:
+                    enemy.kill()
+                    self.sounds.append("explosion")
+                    self.effects.append(("explosion", *enemy.rect.center))
+                    self.enemies_killed += 1
+                    self.total_kills += 1
+                    if self.rng.random() < self.tuning.powerup_drop_prob:
+                        self.create_powerup(enemy.rect.centerx, enemy.rect.centery)
+            if self.enemies_killed >= self.enemies_per_round:
+                self.round_num += 1
+                self.enemies_killed = 0
+                self.enemy_speed += 1
+                self.create_enemies(10)
+                events.append(EVENT_ROUND)
+                self.sounds.append("round")
+            else:
+                while len(self.enemies) < 10:
+                    self.add_enemy(Enemy(self))
+        if prof is not None:
+            prof.lap("collide_bombs")
+
+        # 플레이어별: 적 / 파워업 / 적 총알 (살아있는 플레이어만). 마지막 플레이어가 쓰러지면 게임 오버
+        alive = [p for p in self.players if p.health > 0]
+        for player in alive:
+            self.collide_player(player, precise)
+        if alive and self.game_over:
+            events.append(EVENT_GAME_OVER)
+
+        return events
+
+    def collide_player(self, player, precise):
+        # Check for player-enemy collisions
+        prof = self.profiler
+        player_hits = spritecollide(player, self.enemies, True, hitbox.collide if precise else _collide_coarse)
+        for hit in player_hits:
+            player.reduce_health()
+            self.sounds.append("player_hit")
+            self.add_enemy(Enemy(self))
+            if player.health <= 0:
+                break
+        if prof is not None:
+            prof.lap("collide_player")
+
+        # Check for player-powerup collisions (줍기는 rect 가 닿기만 하면 — 히트박스를 쓰지 않음)
+        powerup_hits = spritecollide(player, self.powerups, True)
+        for hit in powerup_hits:
+            self.sounds.append("powerup")
+            self.effects.append(("powerup", *hit.rect.center))
+            player.reset_powerups()
+            if hit.power_type == "double_bullet":
+                player.double_bullet = True
+            elif hit.power_type == "bomb_bullet":
+                player.bomb_bullet = True
+        if prof is not None:
+            prof.lap("collide_powerups")
+
+        # 적 총알이 플레이어에 맞는지 검사
+        enemy_hits = self.projectiles.collide_sprite(player, ENEMY_BULLET, True, precise, COARSE_RATIO)
+        for hit in enemy_hits:
+            player.reduce_health()
+            self.sounds.append("player_hit")
+            if player.health <= 0:
+                break
+        if prof is not None:
+            prof.lap("collide_enemy_bullets")
+
+    def pool_stats(self):
+        return {
+            "projectiles": self.projectiles.stats(),
+            "powerups": self.powerup_pool.stats(),
+            "enemy_variants": self.enemy_variants.stats(),
+            "fire_scheduler": self.fire_scheduler.stats(),
+        }
+
+    @property
+    def game_over(self):
+        return all(p.health <= 0 for p in self.players)
@@ -0,0 +1,35 @@
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from game.assets import PACK_NAME, load_images_from_files, pack_key, sources_key
+from game.assetpack import write_pack
+from game.enemy_variants import EnemyVariants, variant_name
+from game.entities import PLAYER_HITBOX
+from game.hitbox import needs_mask
+
+# 원본 PNG/JPG 를 한 번 디코딩해서 게임이 쓰는 크기로 스케일한 뒤 아틀라스 팩으로 저장
+# (mk_carimage.py 는 PIL 로 게임이 쓰지 않는 car.png 만 그리는 스크립트라, 게임 패키지의 변형/히트박스 코드가
+#  필요한 이 단계는 따로 둔다. 빌드 워크플로는 이 스크립트만 돌린다)
+start = time.perf_counter()
+images = load_images_from_files()
+
+sprites = {
+    "player": (images["player"], pygame.mask.from_surface(images["player"]) if needs_mask(PLAYER_HITBOX) else None),
+    "background": (images["background"], None),
+}
+if images["weak_enemy"]:
+    sprites["weak_enemy"] = (images["weak_enemy"], None)
+
+# 적 변형(양자화된 크기별 이미지 + 히트박스가 MASK 인 종류만 마스크) 전부
+variants = EnemyVariants(images["weak_enemy"])
+for key in variants.all_keys():
+    image, mask, _ = variants.get(key)
+    sprites[variant_name(key)] = (image, mask)
+
+write_pack(PACK_NAME, sprites, opaque=("background",), key=pack_key(), sources=sources_key())
+print(f"{PACK_NAME}: {len(sprites)} sprites, {os.path.getsize(PACK_NAME) / 1024:.0f} KiB "
+      f"({time.perf_counter() - start:.2f}s)")
@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+# 저장소 루트에서 pytest 를 어떻게 부르든 game 패키지를 찾도록
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture(scope="session")
+def images():
+    # 헤드리스 도구들과 같이 디스플레이 없이 원본 Surface 로 (game.sweep._init_worker)
+    from game.assets import load_images
+
+    return load_images()
@@ -0,0 +1,94 @@
+import random
+
+from game import net
+from game.server import GameServer, ClientSlot
+from game.world import World, Inputs
+
+
+def roundtrip(state, base, sounds=(), effects=()):
+    # 서버가 보내는 그대로 (압축 포함) 패킷으로 만들었다가 풀기
+    body = net.encode_state(state, base, sounds, effects)
+    packet = net.pack_snapshot(1, 0, 0, 0, 0, body)
+    return net.decode_state(net.unpack_snapshot(packet)[-1], base)
+
+
+def play(world, rng, ticks):
+    for _ in range(ticks):
+        world.step(Inputs(rng.random() < 0.3, rng.random() < 0.3, rng.random() < 0.3))
+
+
+def test_full_and_delta_snapshots(images):
+    rng = random.Random(3)
+    world = World(images, seed=3)
+    base = net.empty_state()
+    for _ in range(60):
+        play(world, rng, 5)
+        state = net.capture(world)
+        assert roundtrip(state, net.empty_state())[0] == state   # 전체
+        assert roundtrip(state, base)[0] == state                # 직전 스냅숏과의 델타
+        base = state
+
+
+def test_removed_entities_and_negative_values():
+    base = net.empty_state()
+    base["e"] = {5: (10, 20, 0, 32, 32), 9: (100, 50, 2, 55, 40), 300: (0, 0, 3, 40, 40)}
+    base["b"] = {1: (0, 5, 5), 2: (2, 7, 9), 70000: (1, 400, 300)}
+    state = net.empty_state()
+    state["g"] = {0: (1000, 3, 7, 42, net.FLAG_GAME_OVER)}
+    state["p"] = {0: (-12, 500, 0, 3), 1: (780, 500, 2, 0)}
+    state["e"] = {9: (-55, -40, 2, 55, 40), 301: (3, 4, 1, 30, 30)}   # 5, 300 없어짐 / 9 바뀜 / 301 새로
+    state["b"] = {70000: (1, 400, -8), 2 ** 40: (2, -1, -1)}
+    sounds = list(net.SOUND_NAMES)
+    effects = [(net.EFFECT_NAMES[0], -5, 600), (net.EFFECT_NAMES[-1], 10 ** 6, -10 ** 6)]
+    decoded, got_sounds, got_effects = roundtrip(state, base, sounds, effects)
+    assert decoded == state
+    assert got_sounds == sounds
+    assert got_effects == effects
+    # 다 없어진 상태도
+    assert roundtrip(net.empty_state(), state)[0] == net.empty_state()
+
+
+class FakeTransport:
+    def __init__(self):
+        self.sent = []
+
+    def sendto(self, packet, addr):
+        self.sent.append(packet)
+
+
+def test_server_snapshots_decode_against_acked_base(images, monkeypatch):
+    # 탄 표가 MAX_PACKET 을 넘어 잘리는 경우 포함: 클라이언트가 푼 상태 == 서버가 기록한 기준 상태
+    monkeypatch.setattr(net, "MAX_PACKET", 400)
+    server = GameServer(images, players=1, seed=5)
+    server.transport = FakeTransport()
+    addr = ("127.0.0.1", 40000)
+    slot = ClientSlot(addr, 0)
+    server.slots[0] = slot
+    server.by_addr[addr] = slot
+    world = server.world
+    rng = random.Random(5)
+
+    received = {}   # 클라이언트 쪽: 스냅숏 번호 -> 상태
+    truncated = deltas = 0
+    for tick in range(40):
+        for _ in range(30):
+            world.add_enemy_bullet(rng.randint(0, 800), rng.randint(0, 600), rng.randint(0, 800), 700)
+        slot.inputs[slot.next_seq] = Inputs(False, True, tick % 2 == 0)
+        server.tick(1000 / 60)
+        packet = server.transport.sent[-1]
+        snap_id, base_id, _, _, _, body = net.unpack_snapshot(packet)
+        assert len(packet) <= net.MAX_PACKET or not slot.history[snap_id]["b"]
+        base = received[base_id] if base_id else net.empty_state()
+        deltas += bool(base_id)
+        state, _, _ = net.decode_state(body, base)
+        assert state == slot.history[snap_id]
+        captured = net.capture(world)
+        if len(state["b"]) < len(captured["b"]):
+            truncated += 1
+            assert state["b"] == {k: captured["b"][k] for k in state["b"]}
+        assert {name: state[name] for name in "gpeu"} == {name: captured[name] for name in "gpeu"}
+        received[snap_id] = state
+        # 클라이언트가 받은 스냅숏을 ack (두 틱에 한 번 — 기준이 한 틱 이상 뒤처진 델타도 검사)
+        if tick % 2:
+            slot.acked = snap_id
+    assert truncated and deltas
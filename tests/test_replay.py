@@ -0,0 +1,43 @@
+import random
+
+from game.replay import Replay, ReplayRecorder, play, world_checksum
+from game.settings import SIM_HZ
+from game.world import World, Inputs
+
+
+def record_game(images, seed, ticks):
+    # 무작위 입력으로 한 판을 돌리면서 기록
+    rng = random.Random(seed)
+    world = World(images, seed=seed)
+    recorder = ReplayRecorder(seed, SIM_HZ)
+    played = []
+    move = 0
+    for _ in range(ticks):
+        if rng.random() < 0.05:
+            move = rng.choice((-1, 0, 1))
+        inputs = Inputs(move < 0, move > 0, rng.random() < 0.2, rng.choice((0, 0, 0, 1)))
+        recorder.record(inputs)
+        played.append(inputs)
+        world.step(inputs, 1000 / SIM_HZ)
+    return world, recorder, played
+
+
+def test_replay_reproduces_checksum(images, tmp_path):
+    world, recorder, _ = record_game(images, seed=1234, ticks=1500)
+    path = tmp_path / "test.rpl"
+    recorder.save(str(path), world)
+
+    replay = Replay.load(str(path))
+    assert replay.seed == 1234
+    assert len(replay) == 1500
+    assert replay.checksum == world_checksum(world)
+    replayed = play(replay, images)
+    assert world_checksum(replayed) == replay.checksum
+    assert replayed.tick == world.tick
+    assert replayed.enemies_killed == world.enemies_killed
+
+
+def test_replay_inputs_roundtrip(images):
+    _, recorder, played = record_game(images, seed=99, ticks=300)
+    replay = Replay.from_bytes(recorder.to_bytes())
+    assert replay.inputs == played